@@ -2,10 +2,20 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import json
 import re
 from datetime import datetime
-import plotly.express as px
+import price_store
+import charts
+import change_rate
+import price_analytics
+import composite_index
+import escalation
+import forecast
+import pivot_cache
+import data_registry
+import item_lookup
+import table_view
+import instrumentation
 
 st.set_page_config(
     page_title="건설자재 가격비교",
@@ -13,6 +23,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# 성능 측정 (환경 변수 DASHBOARD_PROFILE=1 또는 주소 뒤에 ?profile=1 을 붙이면 사용)
+instrumentation.start_rerun(instrumentation.is_enabled(st.query_params.get('profile')))
+
 # 폰트 크기 설정 (CSS 스타일링에 사용될 기본값)
 all_font_size = 16
 
@@ -49,325 +62,203 @@ st.markdown(f"""
     </style>
 """, unsafe_allow_html=True)
 
+def load_category(category):
+    # 저장소에서 분야 하나만 읽고 품목 조회 구조를 만듦 (레지스트리에 없을 때만 호출됨)
+    instrumentation.cache_miss()
+    return data_registry.load_category_lookup(category)
+
+@st.cache_resource
+def get_data_registry():
+    # 세션 간에 공유되는 분야별 데이터 (선택한 탭의 분야만 처음 요청할 때 불러옴)
+    return data_registry.CategoryRegistry(load_category)
+
 @st.cache_data
-def load_and_process_data():
-    try:
-        # 전기 케이블 데이터 로드 (마크다운 파일에서)
-        try:
-            # 마크다운 파일에서 케이블 데이터 읽기
-            with open('cable_data.md', 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-            
-            # 마크다운 테이블 파싱
-            import re
-            rows = re.findall(r'\|(.*?)\|', markdown_content)
-            
-            # 헤더와 구분선 건너뛰기
-            rows = [row for row in rows if '----' not in row]
-            if len(rows) > 1:  # 헤더와 데이터 행이 있는 경우
-                # 헤더 파싱
-                headers = [h.strip() for h in rows[0].split('|')]
-                
-                # 데이터 행 파싱
-                data = []
-                for row in rows[1:]:
-                    values = [val.strip() for val in row.split('|')]
-                    entry = {headers[i]: values[i] for i in range(len(headers)) if i < len(values)}
-                    data.append(entry)
-                
-                cable_df = pd.DataFrame(data)
-                
-                # 숫자형 변환
-                for year in ['2021', '2022', '2023', '2024']:
-                    if year in cable_df.columns:
-                        cable_df[year] = pd.to_numeric(cable_df[year])
-                
-                print("케이블 데이터 로드 완료 (마크다운 파일)")
-            else:
-                # 마크다운 파싱 실패 시 JSON 파일 대체
-                raise Exception("마크다운 파싱 실패")
-        except Exception as e:
-            print(f"마크다운 로드 오류, JSON으로 대체: {e}")
-            # 기존 JSON 파일 로드 (대체 방법)
-            with open('onlycable.json', 'r', encoding='utf-8') as f:
-                cable_data = json.load(f)
-            cable_df = pd.DataFrame(cable_data)
-        
-        # 토목 자재 데이터 로드
-        try:
-            with open('concre_table_ocr.md', 'r', encoding='utf-8') as f:
-                concre_df = pd.read_csv(f, delimiter='|')
-                concre_df = concre_df.iloc[:, 1:-1]  # 첫 번째와 마지막 열 제거 (마크다운 형식으로 인한 빈 열)
-                concre_df.columns = concre_df.columns.str.strip()  # 열 이름의 공백 제거
-        except Exception as e:
-            print(f"토목 데이터 로드 오류: {e}")
-            concre_df = pd.DataFrame()
-        
-        # 엔지니어링 노임 데이터 로드
-        try:
-            with open('engineering_salary_ocr.md', 'r', encoding='utf-8') as f:
-                eng_df = pd.read_csv(f, delimiter='|')
-                eng_df = eng_df.iloc[:, 1:-1]  # 첫 번째와 마지막 열 제거 (마크다운 형식으로 인한 빈 열)
-                eng_df.columns = eng_df.columns.str.strip()  # 열 이름의 공백 제거
-        except Exception as e:
-            print(f"엔지니어링 노임 데이터 로드 오류: {e}")
-            eng_df = pd.DataFrame()
-            
-        # 건설업 임금실태 데이터 로드
-        try:
-            with open('construction_wage_ocr.md', 'r', encoding='utf-8') as f:
-                construction_df = pd.read_csv(f, delimiter='|')
-                construction_df = construction_df.iloc[:, 1:-1]  # 첫 번째와 마지막 열 제거 (마크다운 형식으로 인한 빈 열)
-                construction_df.columns = construction_df.columns.str.strip()  # 열 이름의 공백 제거
-        except Exception as e:
-            print(f"건설업 임금실태 데이터 로드 오류: {e}")
-            construction_df = pd.DataFrame()
-        
-        return {
-            'cable': cable_df,
-            'concre': concre_df,
-            'engineering': eng_df,
-            'construction': construction_df
-        }
-    except Exception as e:
-        print(f"데이터 로드 중 오류 발생: {e}")
-        return None
+def load_unified_store(signatures):
+    # 네 분야를 합친 장형 테이블 (원본 파일 상태 signatures가 바뀐 경우에만 다시 읽음)
+    instrumentation.cache_miss()
+    return price_store.load_store()
 
 @st.cache_data
+def load_price_index(signatures):
+    # (분야, 품목, 규격) × 연도 가격 행렬 (내역서 조인용 해시 인덱스)
+    instrumentation.cache_miss()
+    return escalation.price_index(load_unified_store(signatures))
+
 def load_concrete_data():
     try:
-        # Markdown 파일에서 테이블 읽기
-        with open('concre_table_ocr.md', 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
-        
-        # 마크다운 테이블을 파싱하여 데이터프레임으로 변환
-        lines = markdown_text.strip().split('\n')
-        if len(lines) < 3:  # 헤더, 구분선, 데이터 행이 최소한 있어야 함
-            return pd.DataFrame()
-        
-        # 헤더 추출
-        headers = [h.strip() for h in lines[0].split('|')[1:-1]]
-        
-        # 데이터 행 추출
-        data = []
-        for line in lines[2:]:  # 첫 번째 줄은 헤더, 두 번째 줄은 구분선
-            values = [val.strip() for val in line.split('|')[1:-1]]
-            if len(values) == len(headers):
-                row = {}
-                for i, header in enumerate(headers):
-                    if i == 0:  # 연도
-                        row['year'] = int(values[i].replace('년', ''))
-                    elif i == 1:  # 규격
-                        row['spec'] = values[i]
-                    elif i == 2:  # 가격
-                        row['price'] = int(values[i])
-                data.append(row)
-        
-        df = pd.DataFrame(data)
-        return df
+        return get_data_registry().get('concre')
     except Exception as e:
         st.error(f"콘크리트 데이터 로드 중 오류 발생: {str(e)}")
-        return pd.DataFrame()
+        return item_lookup.build('concre', pd.DataFrame())
 
-@st.cache_data
 def load_engineering_salary_data():
     try:
-        # Markdown 파일에서 테이블 읽기
-        with open('engineering_salary_ocr.md', 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
-        
-        # 마크다운 테이블을 파싱하여 데이터프레임으로 변환
-        lines = markdown_text.strip().split('\n')
-        if len(lines) < 3:  # 헤더, 구분선, 데이터 행이 최소한 있어야 함
-            return pd.DataFrame()
-        
-        # 헤더 추출
-        headers = [h.strip() for h in lines[0].split('|')[1:-1]]
-        
-        # 데이터 행 추출
-        data = []
-        for line in lines[2:]:  # 첫 번째 줄은 헤더, 두 번째 줄은 구분선
-            values = [val.strip() for val in line.split('|')[1:-1]]
-            if len(values) == len(headers):
-                row = {}
-                for i, header in enumerate(headers):
-                    if i == 0:  # 연도
-                        row['year'] = int(values[i])
-                    elif i == 1:  # 직위
-                        row['position'] = values[i]
-                    elif i == 2:  # 금액
-                        row['salary'] = int(values[i])
-                data.append(row)
-        
-        df = pd.DataFrame(data)
-        return df
+        return get_data_registry().get('engineering')
     except Exception as e:
         st.error(f"엔지니어링 노임단가 데이터 로드 중 오류 발생: {str(e)}")
-        return pd.DataFrame()
+        return item_lookup.build('engineering', pd.DataFrame())
 
-@st.cache_data
 def load_construction_wage_data():
     try:
-        # Markdown 파일에서 테이블 읽기
-        with open('construction_wage_ocr.md', 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
-        
-        # 마크다운 테이블을 파싱하여 데이터프레임으로 변환
-        lines = markdown_text.strip().split('\n')
-        if len(lines) < 3:  # 헤더, 구분선, 데이터 행이 최소한 있어야 함
-            return pd.DataFrame()
-        
-        # 헤더 추출
-        headers = [h.strip() for h in lines[0].split('|')[1:-1]]
-        
-        # 데이터 행 추출
-        data = []
-        for line in lines[2:]:  # 첫 번째 줄은 헤더, 두 번째 줄은 구분선
-            values = [val.strip() for val in line.split('|')[1:-1]]
-            if len(values) == len(headers):
-                row = {}
-                for i, header in enumerate(headers):
-                    if i == 0:  # 연도
-                        row['year'] = int(values[i])
-                    elif i == 1:  # 직종
-                        row['occupation'] = values[i]
-                    elif i == 2:  # 임금
-                        row['wage'] = int(values[i])
-                data.append(row)
-        
-        df = pd.DataFrame(data)
-        return df
+        return get_data_registry().get('construction')
     except Exception as e:
         st.error(f"건설업 임금실태 데이터 로드 중 오류 발생: {str(e)}")
-        return pd.DataFrame()
+        return item_lookup.build('construction', pd.DataFrame())
 
 def calculate_price_changes(df, size):
-    size_data = df[df['size'] == size].sort_values('year')
-    if len(size_data) >= 2:
-        initial_price = size_data.iloc[0]['price']
-        final_price = size_data.iloc[-1]['price']
-        years_diff = size_data.iloc[-1]['year'] - size_data.iloc[0]['year']
-        
-        if years_diff > 0:
-            total_change = ((final_price - initial_price) / initial_price) * 100
-            avg_annual_change = ((final_price / initial_price) ** (1/years_diff) - 1) * 100
-            return total_change, avg_annual_change
+    # 품목별 첫 해와 마지막 해 기준 변동률
+    changes = change_rate.compute_changes(change_rate.pivot_years(df[df['size'] == size], 'size'))
+    if size in changes.index:
+        return changes.loc[size, 'change_percent'], changes.loc[size, 'cagr']
     return None, None
 
 def calculate_concrete_price_change(df, spec):
-    # 특정 규격의 데이터만 필터링
-    spec_data = df[df['spec'] == spec]
-    
-    if len(spec_data) == 2:  # 2020년과 2025년 데이터가 모두 있는 경우
-        price_2020 = spec_data[spec_data['year'] == 2020]['price'].values[0]
-        price_2025 = spec_data[spec_data['year'] == 2025]['price'].values[0]
-        
-        # 총 변동률
-        total_change = ((price_2025 - price_2020) / price_2020) * 100
-        
-        # 연평균 변동률
-        years_diff = 5  # 2025 - 2020
-        avg_annual_change = ((price_2025 / price_2020) ** (1/years_diff) - 1) * 100
-        
-        return price_2020, price_2025, total_change, avg_annual_change
+    # 2020년과 2025년 데이터가 모두 있는 경우
+    changes = change_rate.compute_changes(change_rate.pivot_years(df[df['spec'] == spec], 'spec'), 2020, 2025)
+    if spec in changes.index:
+        spec_change = changes.loc[spec]
+        return spec_change['start_price'], spec_change['end_price'], spec_change['change_percent'], spec_change['cagr']
     return None, None, None, None
 
-@st.cache_data
 def load_cable_data():
     try:
-        # Markdown 파일에서 케이블 데이터 읽기
-        print("cable_data.md 파일 읽기 시도...")
-        
-        with open('cable_data.md', 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
-            # BOM 제거
-            if markdown_text.startswith('\ufeff'):
-                markdown_text = markdown_text[1:]
-            print(f"파일 로드 성공: {len(markdown_text)} 바이트")
-            
-        # 마크다운 테이블을 파싱하여 데이터프레임으로 변환
-        lines = markdown_text.strip().split('\n')
-        print(f"파싱된 라인 수: {len(lines)}")
-        
-        # 테이블 부분만 추출 (처음 몇 줄은 제목일 수 있음)
-        table_start = -1
-        for i, line in enumerate(lines):
-            if line.strip().startswith('|') and '|' in line[1:]:
-                table_start = i
-                break
-        
-        if table_start == -1 or table_start + 2 >= len(lines):
-            print("마크다운 테이블을 찾을 수 없습니다.")
-            return pd.DataFrame()
-        
-        # 헤더 행 추출
-        header_line = lines[table_start]
-        headers = [h.strip() for h in header_line.split('|')[1:-1]]
-        print(f"추출된 헤더: {headers}")
-        
-        # 구분선 건너뛰기
-        # 데이터 행 추출 (구분선 다음부터)
-        data_lines = lines[table_start + 2:]
-        
-        cable_data = []
-        for line in data_lines:
-            if not line.strip().startswith('|'):
-                continue
-                
-            values = [val.strip() for val in line.split('|')[1:-1]]
-            if len(values) != len(headers):
-                print(f"열 개수 불일치: {len(values)} vs {len(headers)}, 값: {values}")
-                continue
-                
-            # 연도별 데이터 항목 생성
-            brand = values[0]  # 품명
-            size = values[1]   # 규격
-            unit = values[2]   # 단위
-            
-            for i, year in enumerate(['2021', '2022', '2023', '2024']):
-                year_idx = i + 3  # 품명, 규격, 단위 다음이 2021년부터
-                if year_idx < len(values) and values[year_idx] and values[year_idx].strip():
-                    try:
-                        # 가격에 쉼표가 있을 경우 제거
-                        price_str = values[year_idx].replace(',', '')
-                        price = int(price_str)
-                        cable_data.append({
-                            'year': int(year),
-                            'brand': brand,
-                            'size': size,
-                            'unit': unit,
-                            'price': price
-                        })
-                    except ValueError as e:
-                        print(f"가격 변환 오류: {values[year_idx]}, 오류: {e}")
-        
-        print(f"추출된 데이터 항목 수: {len(cable_data)}")
-        
-        if not cable_data:
-            print("파싱된 데이터가 없습니다. 원본 테이블 일부 출력:")
-            for i in range(min(5, len(lines))):
-                print(lines[i])
-            return pd.DataFrame()
-        
-        # 데이터프레임 생성
-        df = pd.DataFrame(cable_data)
-        print(f"생성된 데이터프레임 크기: {df.shape}")
-        print(df.head())
-        
-        return df
-    
-    except FileNotFoundError:
-        error_msg = "cable_data.md 파일을 찾을 수 없습니다."
-        print(error_msg)
-        st.error(error_msg)
-        return pd.DataFrame()
+        return get_data_registry().get('cable')
     except Exception as e:
-        import traceback
         error_msg = f"케이블 데이터 로드 중 오류 발생: {str(e)}"
         print(error_msg)
-        print(traceback.format_exc())
         st.error(error_msg)
-        return pd.DataFrame()
+        return item_lookup.build('cable', pd.DataFrame())
+
+@st.cache_resource
+def get_pivot_cache():
+    # 세션 간에 공유되는 품목 × 연도 행렬 캐시
+    return pivot_cache.PivotCache()
+
+def get_pivot_entry(lookup, category, item_col, value_col, min_year, max_year, brand=None):
+    # 필터 조건이 같으면 이전에 계산한 행렬과 변동률 표를 그대로 사용
+    key = (category, min_year, max_year, brand, price_store.store_version(category))
+    df = lookup.group_frame(brand) if brand is not None else lookup.frame
+
+    def build():
+        instrumentation.cache_miss()
+        return pivot_cache.build_pivot_entry(df, item_col, value_col, min_year, max_year)
+
+    return get_pivot_cache().get_or_compute(key, build)
+
+@st.cache_resource
+def get_figure_cache():
+    # 세션 간에 공유되는 그래프 캐시 (데이터 내용과 스타일 인자가 같으면 재사용)
+    return charts.FigureCache()
+
+def cached_figure(builder, *args, **kwargs):
+    # 같은 데이터 조각과 스타일의 그래프는 다시 만들지 않음
+    def build():
+        instrumentation.cache_miss()
+        return builder(*args, **kwargs)
+
+    return get_figure_cache().get_or_compute(charts.figure_key(builder, *args, **kwargs), build)
+
+def show_analytics(analytics, item_label):
+    # 품목별 CAGR, 전년 대비 변동률, 최대 하락폭, 추세 상승률 표
+    st.subheader(f"{item_label}별 변동 분석 (선택 범위의 모든 연도 기준)")
+    if analytics.empty:
+        st.info("두 해 이상 가격이 있는 항목이 없습니다.")
+        return
+    labels = price_analytics.ANALYTICS_LABELS
+    table_view.paged_dataframe(
+        price_analytics.display_table(analytics, item_label),
+        key=f"analytics_{item_label}",
+        column_config={
+            labels['start_price']: st.column_config.NumberColumn(format="localized"),
+            labels['end_price']: st.column_config.NumberColumn(format="localized"),
+        },
+        use_container_width=True,
+    )
+
+def show_comparison(lookup, items, selected_years, analytics, item_label, value_label, label, group=''):
+    # 선택한 여러 항목을 한 번에 조회해 한 그래프에 겹쳐 그리고, 캐시된 분석 표에서 해당 항목 행만 꺼내 보여줌
+    st.header(f"{item_label} 비교 ({len(items)}개)")
+    with instrumentation.timed('filter', f'{label} 비교') as record:
+        series = lookup.batch(items, group, selected_years)
+        record['rows'] = len(series)
+    if series.empty:
+        st.warning("선택한 조건에 맞는 데이터가 없습니다.")
+        return
+    
+    normalize = st.checkbox("첫 해 = 100으로 환산해 비교", key=f"compare_normalize_{label}")
+    prefix = f"{group} " if group else ''
+    with instrumentation.timed('px.line', f'{label} 비교', cached=True):
+        fig = cached_figure(
+            charts.overlay_figure, series, lookup.item_col, lookup.value_col,
+            f"{prefix}{item_label}별 {value_label} 추이 비교", value_label, normalize=normalize
+        )
+    plotly_chart(fig, f'{label} 비교', use_container_width=True)
+    
+    positions = analytics.index.astype(str).get_indexer(items)
+    stats = analytics.iloc[positions[positions >= 0]]
+    if stats.empty:
+        st.info("두 해 이상 가격이 있는 항목이 없습니다.")
+        return
+    labels = price_analytics.ANALYTICS_LABELS
+    table_view.paged_dataframe(
+        price_analytics.display_table(stats, item_label),
+        key=f"compare_{label}",
+        column_config={
+            labels['start_price']: st.column_config.NumberColumn(format="localized"),
+            labels['end_price']: st.column_config.NumberColumn(format="localized"),
+        },
+        use_container_width=True,
+    )
+
+def forecast_controls():
+    # 단가 예측 모형과 예측 기간 (사용 안 함이면 모형은 None)
+    st.sidebar.subheader("단가 예측")
+    model = st.sidebar.selectbox(
+        "예측 모형",
+        [None] + list(forecast.MODELS),
+        format_func=lambda name: "사용 안 함" if name is None else forecast.MODELS[name],
+        key="forecast_model"
+    )
+    horizon = st.sidebar.number_input("예측 기간 (년)", min_value=1, max_value=5, value=1, key="forecast_horizon")
+    return model, int(horizon)
+
+def get_forecast_params(lookup, category, model, brand=None):
+    # 모든 연도 기준으로 분야(케이블은 품명)의 모든 품목에 한 번에 맞춘 모수, 분야 데이터가 바뀔 때만 다시 맞춤
+    key = ('forecast', category, brand, model, price_store.store_version(category))
+
+    def build():
+        instrumentation.cache_miss()
+        frame = lookup.group_frame(brand) if brand is not None else lookup.frame
+        wide = change_rate.pivot_years(frame, lookup.item_col, value_col=lookup.value_col)
+        wide.index = wide.index.astype(str)
+        return {'params': forecast.fit(wide, model)}
+
+    return get_pivot_cache().get_or_compute(key, build)['params']
+
+def item_forecast(lookup, category, item, model, horizon, brand=None):
+    # 선택한 품목의 예측값과 예측 구간 (예측을 사용하지 않으면 None)
+    if model is None:
+        return None
+    with instrumentation.timed('forecast', category, cached=True) as record:
+        params = get_forecast_params(lookup, category, model, brand)
+        record['rows'] = len(params)
+    if item not in params.index:
+        return None
+    return forecast.predict(params.loc[[item]], model, horizon)
+
+def show_forecast_caption(prediction, model, value_label):
+    if prediction is None or prediction.empty:
+        if model is not None:
+            st.caption("예측에 필요한 연도가 부족합니다.")
+        return
+    first = prediction.iloc[0]
+    band = "" if np.isnan(first['lower']) else f" (95% 구간 {first['lower']:,.0f}~{first['upper']:,.0f}원)"
+    st.caption(f"{int(first['year'])}년 예측 {value_label}: {first['forecast']:,.0f}원{band} - {forecast.MODELS[model]}")
+
+def plotly_chart(fig, label, **kwargs):
+    # 그래프 출력 시간 측정
+    with instrumentation.timed('st.plotly_chart', label):
+        st.plotly_chart(fig, **kwargs)
 
 # 메인 타이틀
 col1, col2 = st.columns([1, 3])
@@ -379,7 +270,7 @@ with col2:
 # 사이드바에 분야 선택 추가
 selected_field = st.sidebar.selectbox(
     "분야 선택",
-    ["엔지니어링노임", "건설업 임금실태", "토목", "전기"]
+    ["엔지니어링노임", "건설업 임금실태", "토목", "전기", "종합 지수", "공사비 물가변동"]
 )
 
 if selected_field == "전기":
@@ -387,40 +278,59 @@ if selected_field == "전기":
     
     try:
         # 케이블 데이터 로드
-        df = load_cable_data()
+        with instrumentation.timed('load', '전기', cached=True) as record:
+            cable_lookup = load_cable_data()
+            df = cable_lookup.frame
+            record['rows'] = len(df)
         
         if not df.empty:
             # 사이드바에 필터 추가
             st.sidebar.header("필터 설정")
             
-            # 연도 선택
-            years = sorted(df['year'].unique())
-            selected_years = st.sidebar.multiselect(
-                "연도 선택",
-                years,
-                default=years
-            )
-            
             # 케이블 유형 선택
-            brands = sorted(df['brand'].unique())
+            brands = cable_lookup.groups
             selected_brand = st.sidebar.selectbox(
                 "케이블 유형 선택",
                 brands
             )
             
+            # 연도 선택 (케이블 유형마다 단가표 연도가 다름)
+            years = cable_lookup.years_by_group[selected_brand]
+            selected_years = st.sidebar.multiselect(
+                "연도 선택",
+                years,
+                default=years
+            )
+            
             # 케이블 사이즈 선택
-            sizes = sorted(df[df['brand'] == selected_brand]['size'].unique())
+            sizes = cable_lookup.items_by_group[selected_brand]
             selected_size = st.sidebar.selectbox(
                 "케이블 사이즈 선택",
                 sizes
             )
             
-            # 데이터 필터링
-            filtered_df = df[
-                (df['year'].isin(selected_years)) &
-                (df['brand'] == selected_brand) &
-                (df['size'] == selected_size)
-            ]
+            # 비교 모드: 여러 항목을 고르면 한 그래프로 겹쳐 비교
+            compare_sizes = st.sidebar.multiselect(
+                "비교할 케이블 사이즈 (여러 개 선택)",
+                sizes,
+                key="compare_sizes"
+            )
+            forecast_model, forecast_horizon = forecast_controls()
+            
+            # 데이터 필터링 (선택 조건별 사이즈 × 연도 행렬은 캐시에서 재사용)
+            with instrumentation.timed('filter', '전기', cached=True) as record:
+                if selected_years:
+                    pivot_entry = get_pivot_entry(
+                        cable_lookup, 'cable', 'size', 'price', min(selected_years), max(selected_years), brand=selected_brand
+                    )
+                    filtered_df = cable_lookup.series(selected_size, selected_brand, selected_years)
+                else:
+                    filtered_df = pd.DataFrame()
+                record['rows'] = len(filtered_df)
+            
+            if selected_years and compare_sizes:
+                show_comparison(cable_lookup, compare_sizes, selected_years, pivot_entry['analytics'],
+                                '케이블 사이즈', '가격', '전기', group=selected_brand)
             
             # 메인 영역
             st.header(f"{selected_brand} {selected_size} 가격 변동")
@@ -428,19 +338,14 @@ if selected_field == "전기":
             # 데이터 시각화
             if not filtered_df.empty:
                 # 가격 변동 그래프
-                fig = px.line(
-                    filtered_df, 
-                    x='year', 
-                    y='price',
-                    markers=True,
-                    title=f"{selected_brand} {selected_size} 연도별 가격 변동"
-                )
-                fig.update_layout(
-                    xaxis_title="연도",
-                    yaxis_title="가격(원)",
-                    height=400
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                prediction = item_forecast(cable_lookup, 'cable', selected_size, forecast_model, forecast_horizon, brand=selected_brand)
+                with instrumentation.timed('px.line', '전기 가격 변동', cached=True):
+                    fig = cached_figure(
+                        charts.trend_figure, filtered_df, 'price', f"{selected_brand} {selected_size} 연도별 가격 변동", '가격', height=400,
+                        prediction=prediction
+                    )
+                plotly_chart(fig, '전기 가격 변동', use_container_width=True)
+                show_forecast_caption(prediction, forecast_model, '가격')
                 
                 # 가격 데이터 테이블
                 st.subheader("가격 데이터")
@@ -458,13 +363,14 @@ if selected_field == "전기":
                     total_change = max_price - min_price
                     total_change_percent = (total_change / min_price) * 100
                     years_diff = max_year - min_year
-                    annual_change_percent = total_change_percent / years_diff if years_diff > 0 else 0
+                    # 연평균 변동률은 복리 기준 (CAGR)
+                    annual_change_percent = ((max_price / min_price) ** (1 / years_diff) - 1) * 100 if years_diff > 0 else 0
                     
                     col1, col2 = st.columns(2)
                     with col1:
                         st.metric("총 변동액", f"{total_change:,}원", f"{total_change_percent:.1f}%")
                     with col2:
-                        st.metric("연평균 변동률", f"{annual_change_percent:.1f}%")
+                        st.metric("연평균 변동률(CAGR)", f"{annual_change_percent:.1f}%")
                 
                 # 모든 사이즈 비교
                 st.header("케이블 사이즈별 가격 변동률 비교")
@@ -473,53 +379,42 @@ if selected_field == "전기":
                     min_year = min(selected_years)
                     max_year = max(selected_years)
                     
-                    change_data = []
-                    for size in sizes:
-                        size_data = df[
-                            (df['brand'] == selected_brand) &
-                            (df['size'] == size) & 
-                            (df['year'].isin([min_year, max_year]))
-                        ]
-                        
-                        if len(size_data) == 2:
-                            min_year_price = size_data[size_data['year'] == min_year]['price'].values[0]
-                            max_year_price = size_data[size_data['year'] == max_year]['price'].values[0]
-                            
-                            change = max_year_price - min_year_price
-                            change_percent = (change / min_year_price) * 100
-                            
-                            change_data.append({
-                                'size': size,
-                                'min_price': min_year_price,
-                                'max_price': max_year_price,
-                                'change': change,
-                                'change_percent': change_percent
-                            })
-                    
-                    change_df = pd.DataFrame(change_data)
+                    # 캐시된 사이즈별 변동률 표 사용
+                    changes = pivot_entry['changes']
+                    
+                    change_df = pd.DataFrame({
+                        'size': changes.index.astype(str),
+                        'min_price': changes['start_price'].astype('int64').to_numpy(),
+                        'max_price': changes['end_price'].astype('int64').to_numpy(),
+                        'change': changes['change'].astype('int64').to_numpy(),
+                        'change_percent': changes['change_percent'].to_numpy()
+                    })
                     if not change_df.empty:
                         # 변동률 그래프
-                        fig = px.bar(
-                            change_df, 
-                            x='size', 
-                            y='change_percent',
-                            title=f"{min_year}년 대비 {max_year}년 가격 변동률(%)"
-                        )
-                        fig.update_layout(
-                            xaxis_title="케이블 사이즈",
-                            yaxis_title="변동률(%)",
-                            height=400
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        with instrumentation.timed('px.bar', '전기 사이즈별 변동률', cached=True):
+                            fig = cached_figure(
+                                charts.change_bar_figure, changes, '케이블 사이즈', f"{min_year}년 대비 {max_year}년 가격 변동률(%)", height=400
+                            )
+                        plotly_chart(fig, '전기 사이즈별 변동률', use_container_width=True)
                         
                         # 변동률 데이터 테이블
                         st.subheader("사이즈별 가격 변동 데이터")
-                        change_df['min_price'] = change_df['min_price'].apply(lambda x: f"{x:,}원")
-                        change_df['max_price'] = change_df['max_price'].apply(lambda x: f"{x:,}원")
-                        change_df['change'] = change_df['change'].apply(lambda x: f"{x:,}원")
-                        change_df['change_percent'] = change_df['change_percent'].apply(lambda x: f"{x:.1f}%")
-                        
-                        st.dataframe(change_df[['size', 'min_price', 'max_price', 'change', 'change_percent']], use_container_width=True)
+                        # 숫자 열은 그대로 두고 표시 형식만 지정 (정렬은 숫자 기준)
+                        table_view.paged_dataframe(
+                            change_df,
+                            key="cable_changes",
+                            column_config={
+                                'size': "케이블 사이즈",
+                                'min_price': table_view.won_column(f"{min_year}년 가격"),
+                                'max_price': table_view.won_column(f"{max_year}년 가격"),
+                                'change': table_view.won_column("변동액"),
+                                'change_percent': table_view.percent_column("변동률"),
+                            },
+                            use_container_width=True,
+                        )
+                    
+                    # 선택 연도 범위의 모든 연도 기준 변동 분석
+                    show_analytics(pivot_entry['analytics'], '케이블 사이즈')
             else:
                 st.warning("선택한 조건에 맞는 데이터가 없습니다.")
         else:
@@ -533,14 +428,17 @@ elif selected_field == "토목":
     
     try:
         # 콘크리트 데이터 로드
-        concrete_df = load_concrete_data()
+        with instrumentation.timed('load', '토목', cached=True) as record:
+            concrete_lookup = load_concrete_data()
+            concrete_df = concrete_lookup.frame
+            record['rows'] = len(concrete_df)
         
         if not concrete_df.empty:
             # 사이드바에 필터 추가
             st.sidebar.header("필터 설정")
             
             # 연도 선택 추가
-            years = sorted(concrete_df['year'].unique())
+            years = concrete_lookup.years
             selected_years = st.sidebar.multiselect(
                 "연도 선택",
                 years,
@@ -548,36 +446,45 @@ elif selected_field == "토목":
             )
             
             # 아스팔트 콘크리트 규격 선택
-            specs = sorted(concrete_df['spec'].unique())
+            specs = concrete_lookup.items
             selected_spec = st.sidebar.selectbox(
                 "아스팔트 콘크리트 규격 선택",
                 specs
             )
             
-            # 선택한 연도로 데이터 필터링
-            filtered_concrete_df = concrete_df[concrete_df['year'].isin(selected_years)]
+            # 비교 모드: 여러 항목을 고르면 한 그래프로 겹쳐 비교
+            compare_specs = st.sidebar.multiselect(
+                "비교할 규격 (여러 개 선택)",
+                specs,
+                key="compare_specs"
+            )
+            forecast_model, forecast_horizon = forecast_controls()
             
-            if len(selected_years) >= 2 and len(filtered_concrete_df) >= 2:
-                # 선택된 규격의 데이터만 필터링
-                spec_df = filtered_concrete_df[filtered_concrete_df['spec'] == selected_spec]
+            if len(selected_years) >= 2:
+                # 가격 변동 계산 (선택된 연도 범위), 모든 규격의 행렬과 변동률 표는 캐시에서 재사용
+                min_year = min(selected_years)
+                max_year = max(selected_years)
+                # 선택된 규격의 데이터만 추출
+                with instrumentation.timed('filter', '토목', cached=True) as record:
+                    pivot_entry = get_pivot_entry(concrete_lookup, 'concre', 'spec', 'price', min_year, max_year)
+                    changes = pivot_entry['changes']
+                    spec_df = concrete_lookup.series(selected_spec, years=selected_years)
+                    record['rows'] = len(spec_df)
                 
-                if len(spec_df) >= 2:
-                    # 가격 변동 계산 (선택된 연도 범위)
-                    min_year = min(selected_years)
-                    max_year = max(selected_years)
-                    
-                    min_year_price = spec_df[spec_df['year'] == min_year]['price'].values[0]
-                    max_year_price = spec_df[spec_df['year'] == max_year]['price'].values[0]
+                if compare_specs:
+                    show_comparison(concrete_lookup, compare_specs, selected_years, pivot_entry['analytics'], '규격', '가격', '토목')
+                
+                if len(spec_df) >= 2 and selected_spec in changes.index:
+                    spec_change = changes.loc[selected_spec]
+                    min_year_price = int(spec_change['start_price'])
+                    max_year_price = int(spec_change['end_price'])
                     
                     # 총 변동률
-                    total_change = ((max_year_price - min_year_price) / min_year_price) * 100
+                    total_change = spec_change['change_percent']
                     
                     # 연평균 변동률
                     years_diff = max_year - min_year
-                    if years_diff > 0:
-                        avg_annual_change = ((max_year_price / min_year_price) ** (1/years_diff) - 1) * 100
-                    else:
-                        avg_annual_change = 0
+                    avg_annual_change = spec_change['cagr']
                     
                     # 2개의 컬럼 생성
                     col1, col2 = st.columns(2)
@@ -586,17 +493,9 @@ elif selected_field == "토목":
                         # 가격 비교 그래프
                         st.subheader(f"가격 비교 ({min_year}년 vs {max_year}년)")
                         
-                        comp_df = pd.DataFrame({
-                            '연도': [f'{min_year}년', f'{max_year}년'],
-                            '가격': [min_year_price, max_year_price]
-                        })
-                        
-                        fig = px.bar(comp_df, x='연도', y='가격',
-                                   title=f'{selected_spec} 가격 비교',
-                                   color='연도',
-                                   labels={'연도': '', '가격': '가격 (원)'},
-                                   text_auto=True)
-                        st.plotly_chart(fig)
+                        with instrumentation.timed('px.bar', '토목 가격 비교', cached=True):
+                            fig = cached_figure(charts.comparison_figure, selected_spec, min_year, max_year, min_year_price, max_year_price, '가격')
+                        plotly_chart(fig, '토목 가격 비교')
                         
                     with col2:
                         # 가격 변동 분석
@@ -620,36 +519,24 @@ elif selected_field == "토목":
                     # 모든 연도의 선택된 규격 가격 추이 그래프
                     if len(spec_df) > 1:
                         st.subheader(f"{selected_spec} 가격 추이")
-                        trend_fig = px.line(spec_df.sort_values('year'), x='year', y='price',
-                                        title=f'{selected_spec} 연도별 가격 추이',
-                                        labels={'year': '연도', 'price': '가격 (원)'},
-                                        markers=True)
-                        st.plotly_chart(trend_fig)
+                        prediction = item_forecast(concrete_lookup, 'concre', selected_spec, forecast_model, forecast_horizon)
+                        with instrumentation.timed('px.line', '토목 가격 추이', cached=True):
+                            trend_fig = cached_figure(charts.trend_figure, spec_df, 'price', f'{selected_spec} 연도별 가격 추이', '가격',
+                                                      prediction=prediction)
+                        plotly_chart(trend_fig, '토목 가격 추이')
+                        show_forecast_caption(prediction, forecast_model, '가격')
                     
                     # 모든 규격의 가격 변동률 비교
                     st.subheader("규격별 가격 변동률 비교")
                     
-                    # 모든 규격의 변동률 계산
-                    change_data = []
-                    for spec in specs:
-                        spec_data = filtered_concrete_df[filtered_concrete_df['spec'] == spec]
-                        if len(spec_data) >= 2 and min_year in spec_data['year'].values and max_year in spec_data['year'].values:
-                            min_price = spec_data[spec_data['year'] == min_year]['price'].values[0]
-                            max_price = spec_data[spec_data['year'] == max_year]['price'].values[0]
-                            spec_change = ((max_price - min_price) / min_price) * 100
-                            change_data.append({
-                                '규격': spec,
-                                '변동률': spec_change
-                            })
-                    
-                    change_df = pd.DataFrame(change_data)
-                    if not change_df.empty:
-                        fig_all = px.bar(change_df, x='규격', y='변동률',
-                                      title=f'규격별 가격 변동률 ({min_year}-{max_year})',
-                                      labels={'규격': '', '변동률': '변동률 (%)'},
-                                      color='변동률',
-                                      text_auto='.2f')
-                        st.plotly_chart(fig_all)
+                    # 위에서 계산한 모든 규격의 변동률 사용
+                    if not changes.empty:
+                        with instrumentation.timed('px.bar', '토목 규격별 변동률', cached=True):
+                            fig_all = cached_figure(charts.change_bar_figure, changes, '규격', f'규격별 가격 변동률 ({min_year}-{max_year})')
+                        plotly_chart(fig_all, '토목 규격별 변동률')
+                    
+                    # 선택 연도 범위의 모든 연도 기준 변동 분석
+                    show_analytics(pivot_entry['analytics'], '규격')
                     
                     # 원본 데이터 표시
                     st.subheader("원본 데이터")
@@ -670,14 +557,17 @@ elif selected_field == "엔지니어링노임":
     
     try:
         # 엔지니어링 노임데이터 로드
-        engineering_df = load_engineering_salary_data()
+        with instrumentation.timed('load', '엔지니어링노임', cached=True) as record:
+            engineering_lookup = load_engineering_salary_data()
+            engineering_df = engineering_lookup.frame
+            record['rows'] = len(engineering_df)
         
         if not engineering_df.empty:
             # 사이드바에 필터 추가
             st.sidebar.header("필터 설정")
             
             # 연도 선택
-            years = sorted(engineering_df['year'].unique())
+            years = engineering_lookup.years
             selected_years = st.sidebar.multiselect(
                 "연도 선택",
                 years,
@@ -685,36 +575,45 @@ elif selected_field == "엔지니어링노임":
             )
             
             # 기술자 등급 선택
-            positions = sorted(engineering_df['position'].unique())
+            positions = engineering_lookup.items
             selected_position = st.sidebar.selectbox(
                 "기술자 등급 선택",
                 positions
             )
             
-            # 선택한 연도로 데이터 필터링
-            filtered_engineering_df = engineering_df[engineering_df['year'].isin(selected_years)]
+            # 비교 모드: 여러 항목을 고르면 한 그래프로 겹쳐 비교
+            compare_positions = st.sidebar.multiselect(
+                "비교할 기술자 등급 (여러 개 선택)",
+                positions,
+                key="compare_positions"
+            )
+            forecast_model, forecast_horizon = forecast_controls()
             
-            if len(selected_years) >= 2 and len(filtered_engineering_df) >= 2:
-                # 선택된 기술자 등급의 데이터만 필터링
-                position_df = filtered_engineering_df[filtered_engineering_df['position'] == selected_position]
+            if len(selected_years) >= 2:
+                # 가격 변동 계산 (선택된 연도 범위), 모든 기술자 등급의 행렬과 변동률 표는 캐시에서 재사용
+                min_year = min(selected_years)
+                max_year = max(selected_years)
+                # 선택된 기술자 등급의 데이터만 추출
+                with instrumentation.timed('filter', '엔지니어링노임', cached=True) as record:
+                    pivot_entry = get_pivot_entry(engineering_lookup, 'engineering', 'position', 'salary', min_year, max_year)
+                    changes = pivot_entry['changes']
+                    position_df = engineering_lookup.series(selected_position, years=selected_years)
+                    record['rows'] = len(position_df)
                 
-                if len(position_df) >= 2:
-                    # 가격 변동 계산 (선택된 연도 범위)
-                    min_year = min(selected_years)
-                    max_year = max(selected_years)
-                    
-                    min_year_salary = position_df[position_df['year'] == min_year]['salary'].values[0]
-                    max_year_salary = position_df[position_df['year'] == max_year]['salary'].values[0]
+                if compare_positions:
+                    show_comparison(engineering_lookup, compare_positions, selected_years, pivot_entry['analytics'], '기술자 등급', '노임단가', '엔지니어링노임')
+                
+                if len(position_df) >= 2 and selected_position in changes.index:
+                    position_change = changes.loc[selected_position]
+                    min_year_salary = int(position_change['start_price'])
+                    max_year_salary = int(position_change['end_price'])
                     
                     # 총 변동률
-                    total_change = ((max_year_salary - min_year_salary) / min_year_salary) * 100
+                    total_change = position_change['change_percent']
                     
                     # 연평균 변동률
                     years_diff = max_year - min_year
-                    if years_diff > 0:
-                        avg_annual_change = ((max_year_salary / min_year_salary) ** (1/years_diff) - 1) * 100
-                    else:
-                        avg_annual_change = 0
+                    avg_annual_change = position_change['cagr']
                     
                     # 2개의 컬럼 생성
                     col1, col2 = st.columns(2)
@@ -723,25 +622,18 @@ elif selected_field == "엔지니어링노임":
                         # 노임단가 비교 그래프
                         st.subheader(f"노임단가 비교 ({min_year}년 vs {max_year}년)")
                         
-                        comp_df = pd.DataFrame({
-                            '연도': [f'{min_year}년', f'{max_year}년'],
-                            '노임단가': [min_year_salary, max_year_salary]
-                        })
-                        
-                        fig = px.bar(comp_df, x='연도', y='노임단가',
-                                   title=f'{selected_position} 노임단가 비교',
-                                   color='연도',
-                                   labels={'연도': '', '노임단가': '노임단가 (원)'},
-                                   text_auto=True)
-                        st.plotly_chart(fig)
+                        with instrumentation.timed('px.bar', '엔지니어링노임 노임단가 비교', cached=True):
+                            fig = cached_figure(charts.comparison_figure, selected_position, min_year, max_year, min_year_salary, max_year_salary, '노임단가')
+                        plotly_chart(fig, '엔지니어링노임 노임단가 비교')
                         
                         # 모든 연도의 선택된 기술자 등급 노임단가 추이 그래프
                         st.subheader(f"{selected_position} 노임단가 추이")
-                        trend_fig = px.line(position_df.sort_values('year'), x='year', y='salary',
-                                        title=f'{selected_position} 연도별 노임단가 추이',
-                                        labels={'year': '연도', 'salary': '노임단가 (원)'},
-                                        markers=True)
-                        st.plotly_chart(trend_fig)
+                        prediction = item_forecast(engineering_lookup, 'engineering', selected_position, forecast_model, forecast_horizon)
+                        with instrumentation.timed('px.line', '엔지니어링노임 노임단가 추이', cached=True):
+                            trend_fig = cached_figure(charts.trend_figure, position_df, 'salary', f'{selected_position} 연도별 노임단가 추이', '노임단가',
+                                                      prediction=prediction)
+                        plotly_chart(trend_fig, '엔지니어링노임 노임단가 추이')
+                        show_forecast_caption(prediction, forecast_model, '노임단가')
                     
                     with col2:
                         # 노임단가 변동 분석
@@ -769,27 +661,14 @@ elif selected_field == "엔지니어링노임":
                     # 모든 기술자 등급의 노임단가 변동률 비교
                     st.subheader("기술자 등급별 노임단가 변동률 비교")
                     
-                    # 모든 기술자 등급의 변동률 계산
-                    change_data = []
-                    for position in positions:
-                        position_data = filtered_engineering_df[filtered_engineering_df['position'] == position]
-                        if len(position_data) >= 2 and min_year in position_data['year'].values and max_year in position_data['year'].values:
-                            min_salary = position_data[position_data['year'] == min_year]['salary'].values[0]
-                            max_salary = position_data[position_data['year'] == max_year]['salary'].values[0]
-                            position_change = ((max_salary - min_salary) / min_salary) * 100
-                            change_data.append({
-                                '기술자 등급': position,
-                                '변동률': position_change
-                            })
-                    
-                    change_df = pd.DataFrame(change_data)
-                    if not change_df.empty:
-                        fig_all = px.bar(change_df, x='기술자 등급', y='변동률',
-                                      title=f'기술자 등급별 노임단가 변동률 ({min_year}-{max_year})',
-                                      labels={'기술자 등급': '', '변동률': '변동률 (%)'},
-                                      color='변동률',
-                                      text_auto='.2f')
-                        st.plotly_chart(fig_all)
+                    # 위에서 계산한 모든 기술자 등급의 변동률 사용
+                    if not changes.empty:
+                        with instrumentation.timed('px.bar', '엔지니어링노임 등급별 변동률', cached=True):
+                            fig_all = cached_figure(charts.change_bar_figure, changes, '기술자 등급', f'기술자 등급별 노임단가 변동률 ({min_year}-{max_year})')
+                        plotly_chart(fig_all, '엔지니어링노임 등급별 변동률')
+                    
+                    # 선택 연도 범위의 모든 연도 기준 변동 분석
+                    show_analytics(pivot_entry['analytics'], '기술자 등급')
                     
                     # 원본 데이터 표시
                     st.subheader("원본 데이터")
@@ -810,14 +689,17 @@ elif selected_field == "건설업 임금실태":
     
     try:
         # 건설업 임금실태 데이터 로드
-        construction_df = load_construction_wage_data()
+        with instrumentation.timed('load', '건설업 임금실태', cached=True) as record:
+            construction_lookup = load_construction_wage_data()
+            construction_df = construction_lookup.frame
+            record['rows'] = len(construction_df)
         
         if not construction_df.empty:
             # 사이드바에 필터 추가
             st.sidebar.header("필터 설정")
             
             # 연도 선택
-            years = sorted(construction_df['year'].unique())
+            years = construction_lookup.years
             selected_years = st.sidebar.multiselect(
                 "연도 선택",
                 years,
@@ -825,36 +707,45 @@ elif selected_field == "건설업 임금실태":
             )
             
             # 직종 선택
-            occupations = sorted(construction_df['occupation'].unique())
+            occupations = construction_lookup.items
             selected_occupation = st.sidebar.selectbox(
                 "직종 선택",
                 occupations
             )
             
-            # 선택한 연도로 데이터 필터링
-            filtered_construction_df = construction_df[construction_df['year'].isin(selected_years)]
+            # 비교 모드: 여러 항목을 고르면 한 그래프로 겹쳐 비교
+            compare_occupations = st.sidebar.multiselect(
+                "비교할 직종 (여러 개 선택)",
+                occupations,
+                key="compare_occupations"
+            )
+            forecast_model, forecast_horizon = forecast_controls()
             
-            if len(selected_years) >= 2 and len(filtered_construction_df) >= 2:
-                # 선택된 직종의 데이터만 필터링
-                occupation_df = filtered_construction_df[filtered_construction_df['occupation'] == selected_occupation]
+            if len(selected_years) >= 2:
+                # 임금 변동 계산 (선택된 연도 범위), 모든 직종의 행렬과 변동률 표는 캐시에서 재사용
+                min_year = min(selected_years)
+                max_year = max(selected_years)
+                # 선택된 직종의 데이터만 추출
+                with instrumentation.timed('filter', '건설업 임금실태', cached=True) as record:
+                    pivot_entry = get_pivot_entry(construction_lookup, 'construction', 'occupation', 'wage', min_year, max_year)
+                    changes = pivot_entry['changes']
+                    occupation_df = construction_lookup.series(selected_occupation, years=selected_years)
+                    record['rows'] = len(occupation_df)
                 
-                if len(occupation_df) >= 2:
-                    # 임금 변동 계산 (선택된 연도 범위)
-                    min_year = min(selected_years)
-                    max_year = max(selected_years)
-                    
-                    min_year_wage = occupation_df[occupation_df['year'] == min_year]['wage'].values[0]
-                    max_year_wage = occupation_df[occupation_df['year'] == max_year]['wage'].values[0]
+                if compare_occupations:
+                    show_comparison(construction_lookup, compare_occupations, selected_years, pivot_entry['analytics'], '직종', '임금', '건설업 임금실태')
+                
+                if len(occupation_df) >= 2 and selected_occupation in changes.index:
+                    occupation_change = changes.loc[selected_occupation]
+                    min_year_wage = int(occupation_change['start_price'])
+                    max_year_wage = int(occupation_change['end_price'])
                     
                     # 총 변동률
-                    total_change = ((max_year_wage - min_year_wage) / min_year_wage) * 100
+                    total_change = occupation_change['change_percent']
                     
                     # 연평균 변동률
                     years_diff = max_year - min_year
-                    if years_diff > 0:
-                        avg_annual_change = ((max_year_wage / min_year_wage) ** (1/years_diff) - 1) * 100
-                    else:
-                        avg_annual_change = 0
+                    avg_annual_change = occupation_change['cagr']
                     
                     # 2개의 컬럼 생성
                     col1, col2 = st.columns(2)
@@ -863,25 +754,18 @@ elif selected_field == "건설업 임금실태":
                         # 임금 비교 그래프
                         st.subheader(f"임금 비교 ({min_year}년 vs {max_year}년)")
                         
-                        comp_df = pd.DataFrame({
-                            '연도': [f'{min_year}년', f'{max_year}년'],
-                            '임금': [min_year_wage, max_year_wage]
-                        })
-                        
-                        fig = px.bar(comp_df, x='연도', y='임금',
-                                   title=f'{selected_occupation} 임금 비교',
-                                   color='연도',
-                                   labels={'연도': '', '임금': '임금 (원)'},
-                                   text_auto=True)
-                        st.plotly_chart(fig)
+                        with instrumentation.timed('px.bar', '건설업 임금실태 임금 비교', cached=True):
+                            fig = cached_figure(charts.comparison_figure, selected_occupation, min_year, max_year, min_year_wage, max_year_wage, '임금')
+                        plotly_chart(fig, '건설업 임금실태 임금 비교')
                         
                         # 모든 연도의 선택된 직종 임금 추이 그래프
                         st.subheader(f"{selected_occupation} 임금 추이")
-                        trend_fig = px.line(occupation_df.sort_values('year'), x='year', y='wage',
-                                        title=f'{selected_occupation} 연도별 임금 추이',
-                                        labels={'year': '연도', 'wage': '임금 (원)'},
-                                        markers=True)
-                        st.plotly_chart(trend_fig)
+                        prediction = item_forecast(construction_lookup, 'construction', selected_occupation, forecast_model, forecast_horizon)
+                        with instrumentation.timed('px.line', '건설업 임금실태 임금 추이', cached=True):
+                            trend_fig = cached_figure(charts.trend_figure, occupation_df, 'wage', f'{selected_occupation} 연도별 임금 추이', '임금',
+                                                      prediction=prediction)
+                        plotly_chart(trend_fig, '건설업 임금실태 임금 추이')
+                        show_forecast_caption(prediction, forecast_model, '임금')
                     
                     with col2:
                         # 임금 변동 분석
@@ -909,27 +793,14 @@ elif selected_field == "건설업 임금실태":
                     # 모든 직종의 임금 변동률 비교
                     st.subheader("직종별 임금 변동률 비교")
                     
-                    # 모든 직종의 변동률 계산
-                    change_data = []
-                    for occupation in occupations:
-                        occupation_data = filtered_construction_df[filtered_construction_df['occupation'] == occupation]
-                        if len(occupation_data) >= 2 and min_year in occupation_data['year'].values and max_year in occupation_data['year'].values:
-                            min_wage = occupation_data[occupation_data['year'] == min_year]['wage'].values[0]
-                            max_wage = occupation_data[occupation_data['year'] == max_year]['wage'].values[0]
-                            occupation_change = ((max_wage - min_wage) / min_wage) * 100
-                            change_data.append({
-                                '직종': occupation,
-                                '변동률': occupation_change
-                            })
-                    
-                    change_df = pd.DataFrame(change_data)
-                    if not change_df.empty:
-                        fig_all = px.bar(change_df, x='직종', y='변동률',
-                                      title=f'직종별 임금 변동률 ({min_year}-{max_year})',
-                                      labels={'직종': '', '변동률': '변동률 (%)'},
-                                      color='변동률',
-                                      text_auto='.2f')
-                        st.plotly_chart(fig_all)
+                    # 위에서 계산한 모든 직종의 변동률 사용
+                    if not changes.empty:
+                        with instrumentation.timed('px.bar', '건설업 임금실태 직종별 변동률', cached=True):
+                            fig_all = cached_figure(charts.change_bar_figure, changes, '직종', f'직종별 임금 변동률 ({min_year}-{max_year})')
+                        plotly_chart(fig_all, '건설업 임금실태 직종별 변동률')
+                    
+                    # 선택 연도 범위의 모든 연도 기준 변동 분석
+                    show_analytics(pivot_entry['analytics'], '직종')
                     
                     # 원본 데이터 표시
                     st.subheader("원본 데이터")
@@ -945,6 +816,148 @@ elif selected_field == "건설업 임금실태":
         st.error(f"오류가 발생했습니다: {str(e)}")
         st.exception(e)
 
+elif selected_field == "종합 지수":
+    st.header("분야별 종합 가격 지수")
+    
+    try:
+        # 네 분야 통합 데이터 로드
+        with instrumentation.timed('load', '종합 지수', cached=True) as record:
+            signatures = tuple(price_store.source_signature(category) for category in price_store.CATEGORIES)
+            store = load_unified_store(signatures)
+            record['rows'] = len(store)
+        
+        if not store.empty:
+            # 사이드바에 필터 추가
+            st.sidebar.header("필터 설정")
+            
+            # 기준 연도 선택 (기본값: 가장 많은 분야에 가격이 있는 연도 중 최근 연도)
+            coverage = composite_index.base_year_coverage(store)
+            years = list(coverage.index)
+            default_year = composite_index.default_base_year(coverage)
+            base_year = st.sidebar.selectbox("기준 연도 (=100)", years, index=years.index(default_year))
+            
+            # 분야별 바스켓 가중치
+            st.sidebar.subheader("바스켓 가중치")
+            basket_weights = {
+                category: st.sidebar.number_input(
+                    label, min_value=0.0, max_value=100.0, value=25.0, step=5.0, key=f"basket_{category}"
+                )
+                for category, label in price_store.CATEGORY_LABELS.items()
+            }
+            
+            # 모든 품목을 기준 연도 = 100으로 환산하고 분야 지수와 종합 지수 계산
+            with instrumentation.timed('filter', '종합 지수') as record:
+                result = composite_index.compute(store, base_year, basket_weights)
+                record['rows'] = len(result['items'])
+            indices = result['categories'].rename(columns=price_store.CATEGORY_LABELS)
+            
+            if not indices.empty:
+                missing = [
+                    label for category, label in price_store.CATEGORY_LABELS.items()
+                    if label not in indices.columns
+                ]
+                if missing:
+                    st.info(f"{base_year}년 가격이 없어 제외된 분야: {', '.join(missing)}")
+                
+                # 분야 지수와 종합 지수 추이 그래프
+                with instrumentation.timed('px.line', '종합 지수 추이', cached=True):
+                    fig = cached_figure(charts.index_figure, indices, result['composite'], base_year)
+                plotly_chart(fig, '종합 지수 추이', use_container_width=True)
+                
+                # 지수 표
+                st.subheader("연도별 지수")
+                st.dataframe(indices.assign(**{'종합 지수': result['composite']}).round(1), use_container_width=True)
+                
+                st.caption(f"기준 연도 가격이 있는 {len(result['items'].drop_duplicates(composite_index.ITEM_KEYS))}개 품목의 "
+                           "지수를 분야별로 평균한 뒤, 연도마다 지수가 있는 분야의 가중치로 종합 지수를 계산합니다.")
+            else:
+                st.warning(f"{base_year}년 가격이 있는 품목이 없습니다.")
+        else:
+            st.error("데이터를 불러올 수 없습니다.")
+    
+    except Exception as e:
+        st.error(f"오류가 발생했습니다: {str(e)}")
+        st.exception(e)
+
+elif selected_field == "공사비 물가변동":
+    st.header("내역서(BOQ) 물가변동 계산")
+    
+    try:
+        # 가격 행렬 로드
+        with instrumentation.timed('load', '공사비 물가변동', cached=True) as record:
+            signatures = tuple(price_store.source_signature(category) for category in price_store.CATEGORIES)
+            index = load_price_index(signatures)
+            record['rows'] = len(index)
+        
+        st.markdown("CSV 열: `분야`(전기/토목/엔지니어링노임/건설업 임금실태), `품목`, `규격`(노임은 비워 둠), `수량`")
+        uploaded = st.file_uploader("내역서 CSV 업로드", type=['csv'])
+        
+        # 사이드바에 연도 선택 추가
+        st.sidebar.header("필터 설정")
+        years = list(index.columns)
+        from_year = st.sidebar.selectbox("기준 연도", years, index=0)
+        to_year = st.sidebar.selectbox("목표 연도", years, index=len(years) - 1)
+        
+        if uploaded is not None:
+            boq = escalation.read_boq(uploaded)
+            with instrumentation.timed('filter', '공사비 물가변동') as record:
+                result = escalation.escalate(boq, index, from_year, to_year)
+                summary = escalation.summarize(result)
+                record['rows'] = len(result)
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric(f"{from_year}년 기준 금액", f"{summary['from_total']:,.0f} 원")
+            with col2:
+                st.metric(f"{to_year}년 금액", f"{summary['to_total']:,.0f} 원",
+                          f"{summary['escalation_percent']:.2f}%")
+            with col3:
+                st.metric("계산된 줄", f"{summary['matched_lines']:,} / {summary['lines']:,}")
+            
+            if summary['matched_lines'] < summary['lines']:
+                counts = result['status'].value_counts()
+                st.warning(f"가격표에 없는 품목 {counts.get('unknown_item', 0):,}줄, "
+                           f"{from_year}년 또는 {to_year}년 가격이 없는 품목 {counts.get('missing_price', 0):,}줄은 합계에서 제외했습니다.")
+            
+            # 분야별 소계
+            st.subheader("분야별 소계")
+            by_category = summary['by_category'].rename(index=price_store.CATEGORY_LABELS)
+            st.dataframe(by_category.round(0), use_container_width=True)
+            
+            # 줄별 결과와 내보내기
+            st.subheader("줄별 계산 결과")
+            table_view.paged_dataframe(
+                result,
+                key="escalation_result",
+                column_config={
+                    'from_price': table_view.won_column(f"{from_year}년 단가"),
+                    'to_price': table_view.won_column(f"{to_year}년 단가"),
+                    'from_cost': table_view.won_column(f"{from_year}년 금액"),
+                    'to_cost': table_view.won_column(f"{to_year}년 금액"),
+                    'escalation': table_view.won_column("변동액"),
+                    'escalation_percent': table_view.percent_column("변동률", digits=2),
+                },
+                use_container_width=True,
+            )
+            st.download_button(
+                "결과 CSV 내려받기",
+                escalation.to_csv_bytes(result),
+                file_name=f"escalation_{from_year}_{to_year}.csv",
+                mime='text/csv',
+            )
+    
+    except Exception as e:
+        st.error(f"오류가 발생했습니다: {str(e)}")
+        st.exception(e)
+
+# 이번 재실행의 단계별 실행 시간 (성능 측정을 사용할 때만)
+profile_run = instrumentation.finish_rerun(selected_field)
+if profile_run is not None:
+    with st.sidebar.expander(f"성능 측정 ({profile_run['total_seconds'] * 1000:.0f} ms)"):
+        profile_df = pd.DataFrame(profile_run['records'], columns=['name', 'label', 'seconds', 'rows', 'cache'])
+        profile_df['ms'] = (profile_df.pop('seconds') * 1000).round(1)
+        st.dataframe(profile_df, hide_index=True, use_container_width=True)
+
 # 사이드바 맨 아래에 폰트 크기 조절 섹션 추가
 st.sidebar.markdown("---")
 st.sidebar.header("폰트 크기 설정")
@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import change_rate
+import charts
+import item_lookup
+import price_store
+import synthetic_data
+
+# 분야별 마크다운 원본 열 구성 (app.py 각 탭과 동일한 열 이름으로 비교)
+TABS = {
+    'cable': {'item_col': 'size', 'value_col': 'price', 'brand': True},
+    'concre': {'item_col': 'spec', 'value_col': 'price', 'brand': False},
+    'engineering': {'item_col': 'position', 'value_col': 'salary', 'brand': False},
+    'construction': {'item_col': 'occupation', 'value_col': 'wage', 'brand': False},
+}
+
+
+def _time(func, repeats):
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, timings
+
+
+def bench_category(category, workdir, n_items, n_years, repeats, seed, skew=0.0, missing_rate=0.0):
+    """
+    한 분야의 파싱, 저장소 읽기, 필터링, 변동률 계산, 그래프 생성 시간을 각각 측정합니다.
+    """
+    config = TABS[category]
+    item_col, value_col = config['item_col'], config['value_col']
+    source = os.path.join(workdir, f"{category}.md")
+    synthetic_data.write(
+        synthetic_data.generate(category, n_items, n_years, seed, skew=skew, missing_rate=missing_rate), source
+    )
+
+    results = []
+
+    def record(phase, timings, rows):
+        results.append({
+            'category': category,
+            'phase': phase,
+            'rows': int(rows),
+            'median_s': statistics.median(timings),
+            'min_s': min(timings),
+        })
+
+    # 1. 원본 마크다운 파싱
+    long_df, timings = _time(lambda: price_store.import_source(category, source), repeats)
+    record('parse', timings, len(long_df))
+
+    # 2. 통합 저장소 쓰기/읽기 (앱 콜드 스타트)
+    store_path = os.path.join(workdir, f"{category}.parquet")
+    price_store._finalize(long_df).to_parquet(store_path, index=False)
+    store, timings = _time(lambda: pd.read_parquet(store_path), repeats)
+    record('store_read', timings, len(store))
+    df, timings = _time(lambda: price_store.category_frame(store, category), repeats)
+    record('category_frame', timings, len(df))
+
+    lookup, timings = _time(lambda: item_lookup.build(category, df), repeats)
+    record('lookup_build', timings, len(lookup))
+
+    # 3. 필터링 (탭에서 선택한 연도·품명·품목), 앱은 조회 구조를 사용하고 filter_mask는 비교용
+    years = lookup.years
+    min_year, max_year = years[0], years[-1]
+    brand = lookup.groups[0]
+    scope = lookup.group_frame(brand)
+    selected_item = lookup.items_by_group[brand][0]
+
+    def filter_rows():
+        lookup.items_by_group[brand]
+        return lookup.series(selected_item, brand, years)
+
+    def filter_mask():
+        in_scope = df[df['brand'] == brand] if config['brand'] else df
+        sorted(in_scope[item_col].unique())
+        return in_scope[(in_scope['year'].isin(years)) & (in_scope[item_col] == selected_item)]
+
+    item_df, timings = _time(filter_rows, repeats)
+    record('filter', timings, len(item_df))
+    mask_df, timings = _time(filter_mask, repeats)
+    record('filter_mask', timings, len(mask_df))
+
+    # 4. 변동률 계산 (모든 품목)
+    def changes():
+        matrix = change_rate.pivot_years(scope, item_col, value_col=value_col)
+        return change_rate.compute_changes(matrix, min_year, max_year)
+
+    change_df, timings = _time(changes, repeats)
+    record('change_rate', timings, len(change_df))
+
+    # 5. 그래프 생성 및 직렬화 (추이 그래프 + 전체 품목 변동률 그래프), 캐시 적중 시에는 직렬화만 수행
+    def figures(max_points=charts.MAX_POINTS):
+        trend_fig = charts.trend_figure(item_df, value_col, '', value_col, max_points=max_points)
+        bar_fig = charts.change_bar_figure(change_df, item_col, '', max_points=max_points)
+        return len(trend_fig.to_json()) + len(bar_fig.to_json())
+
+    payload, timings = _time(figures, repeats)
+    record('figures', timings, len(change_df))
+    results[-1]['payload_bytes'] = payload
+    payload, timings = _time(lambda: figures(max_points=len(change_df) + 1), repeats)
+    record('figures_full', timings, len(change_df))
+    results[-1]['payload_bytes'] = payload
+
+    cache = charts.FigureCache()
+    key = charts.figure_key(charts.change_bar_figure, change_df, item_col, '')
+    cache.get_or_compute(key, lambda: charts.change_bar_figure(change_df, item_col, ''))
+
+    def cached_figures():
+        bar_fig = cache.get_or_compute(charts.figure_key(charts.change_bar_figure, change_df, item_col, ''), None)
+        return len(bar_fig.to_json())
+
+    payload, timings = _time(cached_figures, repeats)
+    record('figures_cached', timings, len(change_df))
+    return results
+
+
+def bench_app(repeats):
+    """
+    Streamlit 테스트 API로 실제 데이터의 각 탭 전체 재실행 시간을 측정합니다.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for field in ["엔지니어링노임", "건설업 임금실태", "토목", "전기"]:
+        at = AppTest.from_file("app.py", default_timeout=120).run()
+        at.sidebar.selectbox[0].set_value(field).run()
+        _, timings = _time(lambda: at.run(), repeats)
+        results.append({
+            'category': field,
+            'phase': 'app_rerun',
+            'rows': 0,
+            'median_s': statistics.median(timings),
+            'min_s': min(timings),
+        })
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="단가변동 대시보드 단계별 성능 측정")
+    parser.add_argument('--items', type=int, default=1000, help="분야별 품목 수")
+    parser.add_argument('--years', type=int, default=10, help="연도 수")
+    parser.add_argument('--repeats', type=int, default=5, help="단계별 반복 횟수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skew', type=float, default=0.0, help="단가 분포·케이블 품명 분포의 치우침")
+    parser.add_argument('--missing-rate', type=float, default=0.0, help="품목·연도 칸이 비어 있을 확률")
+    parser.add_argument('--categories', nargs='+', default=list(TABS), choices=list(TABS))
+    parser.add_argument('--app', action='store_true', help="Streamlit 테스트 API로 탭 전체 재실행 시간도 측정")
+    parser.add_argument('--output', default='bench_results.json', help="결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for category in args.categories:
+            results += bench_category(
+                category, workdir, args.items, args.years, args.repeats, args.seed, args.skew, args.missing_rate
+            )
+    if args.app:
+        results += bench_app(args.repeats)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'revision': _git_revision(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'items': args.items,
+            'years': args.years,
+            'repeats': args.repeats,
+            'seed': args.seed,
+            'skew': args.skew,
+            'missing_rate': args.missing_rate,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(pd.DataFrame(results).to_string(index=False))
+    print(f"\n결과가 저장되었습니다: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+# 변동률 계산 결과 열 구성
+CHANGE_COLUMNS = ['start_year', 'end_year', 'start_price', 'end_price', 'change', 'change_percent', 'cagr']
+
+
+def pivot_years(df, keys, value_col='price', year_col='year'):
+    """
+    장형 데이터를 품목 × 연도 행렬로 한 번에 변환합니다.
+    """
+    if isinstance(keys, str):
+        keys = [keys]
+    wide = df.groupby(keys + [year_col], observed=True)[value_col].last().unstack(year_col)
+    return wide.sort_index(axis=1)
+
+
+def _endpoint_index(mask):
+    # 각 행에서 값이 있는 첫 번째/마지막 열 위치
+    first = mask.argmax(axis=1)
+    last = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)
+    return first, last
+
+
+def compute_changes(wide, start_year=None, end_year=None):
+    """
+    모든 품목의 총 변동액, 변동률(%), 연평균 변동률(CAGR, %)을 한 번에 계산합니다.
+    연도를 지정하지 않으면 품목별로 값이 있는 첫 해와 마지막 해를 사용합니다.
+    """
+    if wide.empty:
+        return pd.DataFrame(columns=CHANGE_COLUMNS, index=wide.index)
+
+    values = wide.to_numpy(dtype=float)
+    years = wide.columns.to_numpy(dtype=float)
+    rows = np.arange(len(wide))
+
+    if start_year is None or end_year is None:
+        first, last = _endpoint_index(~np.isnan(values))
+    else:
+        if start_year not in wide.columns or end_year not in wide.columns:
+            return pd.DataFrame(columns=CHANGE_COLUMNS, index=wide.index[:0])
+        first = np.full(len(wide), wide.columns.get_loc(start_year))
+        last = np.full(len(wide), wide.columns.get_loc(end_year))
+
+    start_price = values[rows, first]
+    end_price = values[rows, last]
+    years_diff = years[last] - years[first]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = end_price - start_price
+        change_percent = change / start_price * 100
+        cagr = np.where(years_diff > 0, ((end_price / start_price) ** (1 / years_diff) - 1) * 100, 0.0)
+
+    result = pd.DataFrame({
+        'start_year': years[first],
+        'end_year': years[last],
+        'start_price': start_price,
+        'end_price': end_price,
+        'change': change,
+        'change_percent': change_percent,
+        'cagr': cagr,
+    }, index=wide.index)
+
+    # 두 시점의 가격이 모두 있는 품목만 반환
+    valid = ~np.isnan(start_price) & ~np.isnan(end_price) & (start_price != 0)
+    if start_year is None or end_year is None:
+        valid &= years_diff > 0
+    result = result[valid]
+    result[['start_year', 'end_year']] = result[['start_year', 'end_year']].astype(int)
+    return result
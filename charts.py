@@ -0,0 +1,203 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# 간략 모드 기준 점 수 (이보다 많으면 표본을 줄이고 WebGL로 그림)
+MAX_POINTS = 300
+DEFAULT_MAX_FIGURES = 256
+
+
+def _arg_key(value):
+    # 데이터프레임과 시리즈는 내용 해시로, 나머지는 값 그대로 키에 사용
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        columns = tuple(value.columns) if isinstance(value, pd.DataFrame) else value.name
+        return (type(value).__name__, value.shape, columns, int(pd.util.hash_pandas_object(value).sum()))
+    return value
+
+
+def figure_key(builder, *args, **kwargs):
+    """
+    그래프 함수와 데이터 내용, 스타일 인자로 캐시 키를 만듭니다.
+    """
+    return (
+        builder.__name__,
+        tuple(_arg_key(value) for value in args),
+        tuple(sorted((name, _arg_key(value)) for name, value in kwargs.items())),
+    )
+
+
+class FigureCache:
+    """
+    만든 그래프 객체를 figure_key별로 보관하는 LRU 캐시입니다.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_FIGURES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        figure = compute()
+        with self._lock:
+            self._entries[key] = figure
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def downsample(frame, column, max_points=MAX_POINTS):
+    """
+    column 기준으로 정렬한 뒤 처음과 끝을 포함해 고르게 max_points개 행을 남깁니다.
+    """
+    if len(frame) <= max_points:
+        return frame
+    ordered = frame.sort_values(column, ascending=False, kind='stable')
+    positions = np.unique(np.linspace(0, len(ordered) - 1, max_points).round().astype(int))
+    return ordered.iloc[positions]
+
+
+def _add_forecast(fig, series, value_col, prediction):
+    # 마지막 관측점에서 이어지는 예측선과 예측 구간 음영
+    prediction = prediction.sort_values('year')
+    anchor_year = [series['year'].iloc[-1]] if not series.empty else []
+    anchor_value = [float(series[value_col].iloc[-1])] if not series.empty else []
+    years = anchor_year + prediction['year'].tolist()
+
+    if prediction[['lower', 'upper']].notna().all().all():
+        upper = anchor_value + prediction['upper'].tolist()
+        lower = anchor_value + prediction['lower'].tolist()
+        fig.add_trace(go.Scatter(
+            x=years + years[::-1], y=upper + lower[::-1],
+            fill='toself', fillcolor='rgba(99, 110, 250, 0.15)', line={'color': 'rgba(0, 0, 0, 0)'},
+            hoverinfo='skip', name='예측 구간 (95%)',
+        ))
+    fig.add_trace(go.Scatter(
+        x=years, y=anchor_value + prediction['forecast'].round().tolist(),
+        mode='lines+markers', line={'dash': 'dash'}, name='예측',
+    ))
+
+
+def trend_figure(series, value_col, title, value_label, height=None, max_points=MAX_POINTS, prediction=None):
+    """
+    한 품목의 연도별 가격(노임단가, 임금) 추이 선 그래프를 만듭니다.
+    점이 max_points보다 많으면 일정 간격으로 표본을 줄이고 WebGL(scattergl)로 그립니다.
+    prediction(forecast.predict 결과)을 주면 예측선과 예측 구간을 덧붙입니다.
+    """
+    series = series.sort_values('year')
+    compact = len(series) > max_points
+    if compact:
+        step = -(-len(series) // max_points)
+        series = pd.concat([series.iloc[::step], series.iloc[[-1]]]).drop_duplicates()
+    fig = px.line(series, x='year', y=value_col,
+                  title=title,
+                  labels={'year': '연도', value_col: f'{value_label} (원)'},
+                  markers=not compact,
+                  render_mode='webgl' if compact else 'auto')
+    if prediction is not None and not prediction.empty:
+        _add_forecast(fig, series, value_col, prediction)
+    if height is not None:
+        fig.update_layout(height=height)
+    return fig
+
+
+def overlay_figure(series, item_col, value_col, title, value_label, normalize=False, max_points=MAX_POINTS):
+    """
+    여러 품목의 연도별 추이를 한 그래프에 겹쳐 그립니다. normalize=True이면 품목마다 첫 해 = 100으로 환산합니다.
+    품목별 구간을 배열에서 바로 잘라 선 하나씩 만들므로(px의 그룹별 처리 없음) 수십 개 품목도 빠르게 그립니다.
+    점이 max_points보다 많으면 마커를 생략하고 WebGL(scattergl)로 그립니다.
+    """
+    series = series.sort_values([item_col, 'year'], kind='stable')
+    names = series[item_col].to_numpy()
+    years = series['year'].to_numpy()
+    values = series[value_col].to_numpy(dtype=float)
+    bounds = np.flatnonzero(np.concatenate([[True], names[1:] != names[:-1], [True]])) if len(names) else np.array([0])
+
+    y_label = f'{value_label} (원)'
+    if normalize:
+        first = np.repeat(values[bounds[:-1]], np.diff(bounds))
+        values = values / first * 100
+        y_label = f'{value_label} 지수 (첫 해 = 100)'
+
+    compact = len(series) > max_points
+    trace = go.Scattergl if compact else go.Scatter
+    mode = 'lines' if compact else 'lines+markers'
+    fig = go.Figure([
+        trace(x=years[start:end], y=values[start:end], name=str(names[start]), mode=mode)
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ])
+    fig.update_layout(title=title, xaxis_title='연도', yaxis_title=y_label, height=500)
+    return fig
+
+
+def comparison_figure(item, min_year, max_year, min_value, max_value, value_label):
+    """
+    한 품목의 시작 연도와 종료 연도 값을 나란히 비교하는 막대 그래프를 만듭니다.
+    """
+    comp_df = pd.DataFrame({
+        '연도': [f'{min_year}년', f'{max_year}년'],
+        value_label: [min_value, max_value]
+    })
+    return px.bar(comp_df, x='연도', y=value_label,
+                  title=f'{item} {value_label} 비교',
+                  color='연도',
+                  labels={'연도': '', value_label: f'{value_label} (원)'},
+                  text_auto=True)
+
+
+def change_bar_figure(changes, item_label, title, height=None, max_points=MAX_POINTS):
+    """
+    변동률 표(change_rate.compute_changes 결과)로 품목별 변동률 막대 그래프를 만듭니다.
+    품목이 max_points보다 많으면 변동률 순으로 정렬해 최대·최소를 포함한 max_points개만 WebGL 점 그래프로 그립니다.
+    """
+    change_df = pd.DataFrame({
+        item_label: changes.index.astype(str),
+        '변동률': changes['change_percent'].to_numpy()
+    })
+    if len(change_df) > max_points:
+        shown = downsample(change_df, '변동률', max_points)
+        fig = px.scatter(shown, x=item_label, y='변동률',
+                         title=f'{title} - 변동률 순 {len(shown)}/{len(change_df)}개 표시',
+                         labels={item_label: '', '변동률': '변동률 (%)'},
+                         color='변동률',
+                         render_mode='webgl')
+        fig.update_xaxes(showticklabels=False)
+    else:
+        fig = px.bar(change_df, x=item_label, y='변동률',
+                     title=title,
+                     labels={item_label: '', '변동률': '변동률 (%)'},
+                     color='변동률',
+                     text_auto='.2f')
+    if height is not None:
+        fig.update_layout(height=height)
+    return fig
+
+
+def index_figure(indices, composite, base_year):
+    """
+    분야별 지수와 종합 지수의 연도별 추이 그래프를 만듭니다.
+    """
+    chart_df = indices.assign(**{'종합 지수': composite}).reset_index()
+    chart_df = chart_df.melt(id_vars='year', var_name='분야', value_name='지수').dropna()
+    fig = px.line(chart_df, x='year', y='지수', color='분야', markers=True,
+                  title=f'분야별 가격 지수 ({base_year}년 = 100)',
+                  labels={'year': '연도'})
+    fig.update_layout(height=450)
+    return fig
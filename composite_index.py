@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+# 품목 식별 열 (분야, 품목, 규격)
+ITEM_KEYS = ['category', 'item', 'spec']
+
+
+def rebase(store, base_year):
+    """
+    통합 장형 테이블의 모든 품목 가격을 기준 연도 = 100 지수로 바꿉니다.
+    기준 연도 가격이 없는 품목은 제외합니다.
+    """
+    if store.empty:
+        return pd.DataFrame(columns=ITEM_KEYS + ['year', 'index'])
+
+    item_ids = store.groupby(ITEM_KEYS, observed=True, sort=False).ngroup().to_numpy()
+    prices = store['price'].to_numpy(dtype=float)
+    at_base = store['year'].to_numpy() == base_year
+
+    # 품목 번호로 기준 연도 가격을 조회 (같은 품목이 여러 번 있으면 마지막 값)
+    base_price = np.full(item_ids.max() + 1, np.nan)
+    base_price[item_ids[at_base]] = prices[at_base]
+    base = base_price[item_ids]
+
+    valid = base > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        index = prices / base * 100
+    return store.loc[valid, ITEM_KEYS + ['year']].assign(index=index[valid]).reset_index(drop=True)
+
+
+def category_indices(rebased):
+    """
+    분야 × 연도별로 품목 지수의 평균(동일 가중)을 구해 연도 × 분야 표로 반환합니다.
+    """
+    if rebased.empty:
+        return pd.DataFrame()
+
+    category_codes, categories = pd.factorize(rebased['category'].astype(str), sort=True)
+    year_codes, years = pd.factorize(rebased['year'], sort=True)
+    cells = year_codes * len(categories) + category_codes
+    size = len(years) * len(categories)
+
+    totals = np.bincount(cells, weights=rebased['index'].to_numpy(dtype=float), minlength=size)
+    counts = np.bincount(cells, minlength=size)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.where(counts > 0, totals / counts, np.nan)
+    return pd.DataFrame(
+        means.reshape(len(years), len(categories)),
+        index=pd.Index(years.astype(int), name='year'),
+        columns=categories,
+    )
+
+
+def composite(indices, basket_weights):
+    """
+    분야 지수를 바스켓 가중치로 합친 종합 지수입니다. 연도마다 지수가 있는 분야의 가중치만으로 다시 정규화합니다.
+    """
+    if indices.empty:
+        return pd.Series(dtype=float, name='composite')
+
+    weights = np.array([float(basket_weights.get(category, 0)) for category in indices.columns])
+    values = indices.to_numpy(dtype=float)
+    available = ~np.isnan(values) & (weights > 0)
+    weight_sum = (available * weights).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = np.where(available, values * weights, 0.0).sum(axis=1) / weight_sum
+    return pd.Series(np.where(weight_sum > 0, result, np.nan), index=indices.index, name='composite')
+
+
+def compute(store, base_year, basket_weights):
+    """
+    기준 연도 환산, 분야 지수, 종합 지수를 한 번에 계산합니다.
+    """
+    rebased = rebase(store, base_year)
+    indices = category_indices(rebased)
+    return {
+        'items': rebased,
+        'categories': indices,
+        'composite': composite(indices, basket_weights),
+    }
+
+
+def base_year_coverage(store):
+    # 연도별로 그 해를 기준 연도로 쓸 수 있는 품목 수 (분야별)
+    items = store.drop_duplicates(ITEM_KEYS + ['year'])
+    return items.groupby(['year', 'category'], observed=True).size().unstack('category', fill_value=0)
+
+
+def default_base_year(coverage):
+    # 가장 많은 분야에 가격이 있는 연도 중 최근 연도
+    return max(coverage.index, key=lambda year: ((coverage.loc[year] > 0).sum(), year))
@@ -0,0 +1,75 @@
+import threading
+import item_lookup
+import price_store
+
+
+def load_category_frame(category):
+    """
+    한 분야의 저장소만 읽어 app.py 탭에서 쓰는 열 이름으로 반환합니다.
+    """
+    return price_store.category_frame(price_store.load_category(category), category)
+
+
+def load_category_lookup(category):
+    """
+    한 분야의 데이터를 읽어 품목별 연도·가격 배열로 정리한 ItemLookup으로 반환합니다.
+    """
+    return item_lookup.build(category, load_category_frame(category))
+
+
+class CategoryHandle:
+    """
+    분야 하나의 데이터를 처음 요청할 때 불러와 보관합니다. invalidate() 후에는 다음 요청 때 다시 불러옵니다.
+    signature 함수를 지정하면 요청할 때마다 원본 파일 상태를 확인해 바뀐 경우에만 다시 불러옵니다.
+    """
+
+    def __init__(self, category, loader=load_category_frame, signature=price_store.source_signature):
+        self.category = category
+        self._loader = loader
+        self._signature = signature
+        self._lock = threading.Lock()
+        self._frame = None
+        self._loaded_signature = None
+        self.loads = 0
+
+    @property
+    def loaded(self):
+        return self._frame is not None
+
+    def get(self):
+        # 여러 세션이 동시에 처음 요청해도 한 번만 불러옴
+        with self._lock:
+            signature = self._signature(self.category) if self._signature is not None else None
+            if self._frame is None or signature != self._loaded_signature:
+                self._frame = self._loader(self.category)
+                self._loaded_signature = signature
+                self.loads += 1
+            return self._frame
+
+    def invalidate(self):
+        with self._lock:
+            self._frame = None
+
+
+class CategoryRegistry:
+    """
+    분야별 CategoryHandle 모음. 선택한 탭의 분야만 불러오고, 원본 파일이 바뀐 분야만 다시 불러옵니다.
+    """
+
+    def __init__(self, loader=load_category_frame, categories=price_store.CATEGORIES,
+                 signature=price_store.source_signature):
+        self._handles = {category: CategoryHandle(category, loader, signature) for category in categories}
+
+    def handle(self, category):
+        return self._handles[category]
+
+    def get(self, category):
+        return self._handles[category].get()
+
+    def invalidate(self, category=None):
+        # category를 지정하지 않으면 모든 분야를 무효화
+        for handle in ([self._handles[category]] if category is not None else self._handles.values()):
+            handle.invalidate()
+
+    def loaded(self):
+        return [category for category, handle in self._handles.items() if handle.loaded]
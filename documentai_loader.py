@@ -0,0 +1,172 @@
+import re
+import sys
+import ijson
+import numpy as np
+import pandas as pd
+from ijson.common import ObjectBuilder
+
+# 토큰 줄 분류 패턴
+YEAR_PATTERN = re.compile(r'^(\d{4})\s*년$')
+CORE_PATTERN = re.compile(r'^(\d+)\s*C$')
+SIZE_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*SQ$')
+PRICE_PATTERN = re.compile(r'^\d{1,3}(?:,\d{3})+$|^\d+$')
+BRAND_PATTERN = re.compile(r'\b([A-Z][A-Z0-9-]+)\b')
+
+# 가격을 행(SQ)과 열(코어 수)에 맞출 때 허용하는 거리 (정규화 좌표)
+ROW_TOLERANCE = 0.015
+COLUMN_TOLERANCE = 0.1
+
+CABLE_UNIT = 'm'
+
+
+def _layout_anchor(layout):
+    segments = layout.get('textAnchor', {}).get('textSegments', [])
+    return [(int(segment.get('startIndex', 0)), int(segment['endIndex'])) for segment in segments]
+
+
+def _layout_center(layout):
+    vertices = layout.get('boundingPoly', {}).get('normalizedVertices', [])
+    if not vertices:
+        return 0.0, 0.0
+    x = sum(float(vertex.get('x', 0)) for vertex in vertices) / len(vertices)
+    y = sum(float(vertex.get('y', 0)) for vertex in vertices) / len(vertices)
+    return x, y
+
+
+def _resolve(text, page_tokens):
+    return [
+        (''.join(text[start:end] for start, end in anchor), x, y)
+        for anchor, x, y in page_tokens
+    ]
+
+
+def iter_page_tokens(f):
+    """
+    Document AI JSON을 스트리밍으로 읽어 페이지별 (토큰 문자열, x, y) 목록을 순서대로 돌려줍니다.
+    토큰 외의 필드(페이지 이미지, blocks 등)는 메모리에 보관하지 않습니다.
+    """
+    text = None
+    page_tokens = None
+    waiting_pages = []  # 문서 text가 pages 뒤에 나오는 경우에만 사용
+    events = ijson.parse(f)
+
+    for prefix, event, value in events:
+        if prefix == 'text' and event == 'string':
+            text = value
+            for waiting in waiting_pages:
+                yield _resolve(text, waiting)
+            waiting_pages = []
+        elif prefix == 'pages.item' and event == 'start_map':
+            page_tokens = []
+        elif prefix == 'pages.item' and event == 'end_map':
+            if text is None:
+                waiting_pages.append(page_tokens)
+            else:
+                yield _resolve(text, page_tokens)
+            page_tokens = None
+        elif prefix == 'pages.item.tokens.item.layout' and event == 'start_map':
+            # 토큰의 layout 객체만 조립
+            builder = ObjectBuilder()
+            builder.event(event, value)
+            for prefix, event, value in events:
+                builder.event(event, value)
+                if prefix == 'pages.item.tokens.item.layout' and event == 'end_map':
+                    break
+            layout = builder.value
+            page_tokens.append((_layout_anchor(layout), *_layout_center(layout)))
+
+
+def group_lines(tokens):
+    """
+    줄바꿈으로 끝나는 토큰을 기준으로 토큰을 줄 단위로 묶습니다.
+    """
+    lines = []
+    current = []
+    for token in tokens:
+        current.append(token)
+        if token[0].endswith('\n'):
+            lines.append(current)
+            current = []
+    if current:
+        lines.append(current)
+
+    return [
+        (
+            ''.join(token[0] for token in line).strip(),
+            sum(token[1] for token in line) / len(line),
+            sum(token[2] for token in line) / len(line),
+        )
+        for line in lines
+    ]
+
+
+def parse_cable_page(lines, state):
+    """
+    한 페이지의 줄 목록에서 (연도, 품명, 규격, 가격) 행을 복원합니다.
+    연도 구간, 품명, 코어 수 열 위치는 다음 페이지로 이어질 수 있으므로 state에 보관합니다.
+    """
+    rows = []
+    prices = []
+    for text, x, y in lines:
+        year_match = YEAR_PATTERN.match(text)
+        core_match = CORE_PATTERN.match(text)
+        size_match = SIZE_PATTERN.match(text)
+        if year_match:
+            state['year'] = int(year_match.group(1))
+            state['brand'] = None
+            state['columns'] = []
+        elif core_match:
+            state['columns'].append((x, int(core_match.group(1))))
+        elif size_match:
+            rows.append((y, size_match.group(1)))
+        elif PRICE_PATTERN.match(text):
+            prices.append((x, y, int(text.replace(',', ''))))
+        elif state.get('brand') is None and BRAND_PATTERN.search(text):
+            state['brand'] = BRAND_PATTERN.search(text).group(1)
+
+    if state.get('year') is None or not rows or not state['columns'] or not prices:
+        return []
+
+    # 가격마다 가장 가까운 SQ 행과 코어 수 열을 한 번에 찾음
+    price_xy = np.array([(x, y) for x, y, _ in prices])
+    row_y = np.array([y for y, _ in rows])
+    column_x = np.array([x for x, _ in state['columns']])
+    row_distance = np.abs(price_xy[:, 1:2] - row_y[None, :])
+    column_distance = np.abs(price_xy[:, 0:1] - column_x[None, :])
+    row_index = row_distance.argmin(axis=1)
+    column_index = column_distance.argmin(axis=1)
+    matched = (
+        (row_distance[np.arange(len(prices)), row_index] <= ROW_TOLERANCE)
+        & (column_distance[np.arange(len(prices)), column_index] <= COLUMN_TOLERANCE)
+    )
+
+    records = {}
+    for i in np.flatnonzero(matched):
+        size = rows[row_index[i]][1]
+        cores = state['columns'][column_index[i]][1]
+        records.setdefault((size, cores), prices[i][2])
+
+    brand = state.get('brand') or 'CABLE'
+    return [
+        (brand, f"{size} SQ x {cores}C", CABLE_UNIT, state['year'], price)
+        for (size, cores), price in records.items()
+    ]
+
+
+def load_cable_table(path='onlycable.json'):
+    """
+    Document AI JSON(onlycable.json)에서 케이블 단가표를 장형 데이터프레임으로 복원합니다.
+    """
+    state = {'year': None, 'brand': None, 'columns': []}
+    records = []
+    with open(path, 'rb') as f:
+        for tokens in iter_page_tokens(f):
+            records.extend(parse_cable_page(group_lines(tokens), state))
+    return pd.DataFrame(records, columns=['item', 'spec', 'unit', 'year', 'price'])
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else 'onlycable.json'
+    df = load_cable_table(path)
+    print(f"{path}: {len(df)}개 행")
+    print(df.to_string())
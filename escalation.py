@@ -0,0 +1,135 @@
+import argparse
+import sys
+import numpy as np
+import pandas as pd
+import change_rate
+import price_store
+
+# 내역서(BOQ) CSV 열 구성 (한글 머리글도 허용)
+BOQ_COLUMNS = ['category', 'item', 'spec', 'quantity']
+BOQ_ALIASES = {'분야': 'category', '품목': 'item', '품명': 'item', '직종': 'item', '기술자 등급': 'item',
+               '규격': 'spec', '수량': 'quantity'}
+
+# 분야 열에 코드 대신 화면 이름을 써도 되도록
+CATEGORY_ALIASES = {
+    **{category: category for category in price_store.CATEGORIES},
+    **{label: category for category, label in price_store.CATEGORY_LABELS.items()},
+    '전기': 'cable', '케이블': 'cable', '토목': 'concre', '아스팔트 콘크리트': 'concre',
+}
+
+RESULT_COLUMNS = ['status', 'from_price', 'to_price', 'from_cost', 'to_cost', 'escalation', 'escalation_percent']
+
+
+def price_index(store):
+    """
+    통합 장형 테이블을 (분야, 품목, 규격) × 연도 가격 행렬로 만듭니다. 행 인덱스는 해시 조회에 사용됩니다.
+    """
+    keys = store[['category', 'item', 'spec']].astype(str)
+    frame = keys.assign(year=store['year'].to_numpy(), price=store['price'].to_numpy())
+    return change_rate.pivot_years(frame, ['category', 'item', 'spec'])
+
+
+def read_boq(path_or_buffer):
+    """
+    내역서 CSV를 읽어 category, item, spec, quantity 열로 정리합니다.
+    """
+    boq = pd.read_csv(path_or_buffer, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    boq.columns = boq.columns.str.strip()
+    boq = boq.rename(columns=BOQ_ALIASES)
+    missing = [column for column in ['category', 'item', 'quantity'] if column not in boq.columns]
+    if missing:
+        raise ValueError(f"내역서에 필요한 열이 없습니다: {', '.join(missing)}")
+    if 'spec' not in boq.columns:
+        boq['spec'] = ''
+
+    for column in ['category', 'item', 'spec']:
+        boq[column] = boq[column].str.strip()
+    boq['category'] = boq['category'].map(CATEGORY_ALIASES).fillna(boq['category'])
+    boq['quantity'] = pd.to_numeric(boq['quantity'].str.replace(',', '', regex=False), errors='coerce')
+    return boq
+
+
+def escalate(boq, index, from_year, to_year):
+    """
+    내역서의 모든 줄을 가격 행렬과 한 번에 조인하여 기준 연도와 목표 연도의 금액, 변동액, 변동률을 계산합니다.
+    status는 matched(두 해 가격 모두 있음), missing_price(해당 연도 가격 없음), unknown_item(가격표에 없는 품목)입니다.
+    """
+    keys = pd.MultiIndex.from_arrays([boq['category'], boq['item'], boq['spec']])
+    rows = index.index.get_indexer(keys)
+    found = rows >= 0
+
+    def prices_for(year):
+        if year not in index.columns:
+            return np.full(len(boq), np.nan)
+        column = index[year].to_numpy(dtype=float)
+        return np.where(found, column[np.where(found, rows, 0)], np.nan)
+
+    from_price = prices_for(from_year)
+    to_price = prices_for(to_year)
+    quantity = boq['quantity'].to_numpy(dtype=float)
+    matched = ~np.isnan(from_price) & ~np.isnan(to_price)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        from_cost = quantity * from_price
+        to_cost = quantity * to_price
+        escalation_percent = (to_price / from_price - 1) * 100
+
+    result = boq.copy()
+    result['status'] = np.where(matched, 'matched', np.where(found, 'missing_price', 'unknown_item'))
+    result['from_price'] = from_price
+    result['to_price'] = to_price
+    result['from_cost'] = from_cost
+    result['to_cost'] = to_cost
+    result['escalation'] = to_cost - from_cost
+    result['escalation_percent'] = escalation_percent
+    return result
+
+
+def summarize(result):
+    """
+    가격이 모두 있는 줄의 합계와 분야별 소계를 계산합니다.
+    """
+    matched = result[result['status'] == 'matched']
+    by_category = matched.groupby('category')[['from_cost', 'to_cost', 'escalation']].sum()
+    from_total = matched['from_cost'].sum()
+    to_total = matched['to_cost'].sum()
+    return {
+        'lines': len(result),
+        'matched_lines': len(matched),
+        'from_total': from_total,
+        'to_total': to_total,
+        'escalation': to_total - from_total,
+        'escalation_percent': (to_total / from_total - 1) * 100 if from_total else np.nan,
+        'by_category': by_category,
+    }
+
+
+def to_csv_bytes(result):
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8
+    return result.to_csv(index=False).encode('utf-8-sig')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="내역서(BOQ) 물가변동 금액 계산")
+    parser.add_argument('boq', help="내역서 CSV (category/분야, item/품목, spec/규격, quantity/수량)")
+    parser.add_argument('from_year', type=int, help="기준 연도")
+    parser.add_argument('to_year', type=int, help="목표 연도")
+    parser.add_argument('--output', '-o', default='escalation_result.csv', help="결과 CSV 파일")
+    args = parser.parse_args()
+
+    try:
+        boq = read_boq(args.boq)
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}")
+        sys.exit(1)
+
+    result = escalate(boq, price_index(price_store.load_store()), args.from_year, args.to_year)
+    with open(args.output, 'wb') as f:
+        f.write(to_csv_bytes(result))
+
+    summary = summarize(result)
+    print(f"{summary['lines']}줄 중 {summary['matched_lines']}줄 계산 ({args.from_year} → {args.to_year})")
+    print(f"기준 금액 {summary['from_total']:,.0f}원 → 목표 금액 {summary['to_total']:,.0f}원 "
+          f"(변동 {summary['escalation']:,.0f}원, {summary['escalation_percent']:.2f}%)")
+    print(result['status'].value_counts().to_string())
+    print(f"결과가 저장되었습니다: {args.output}")
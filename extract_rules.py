@@ -0,0 +1,157 @@
+import re
+from typing import NamedTuple, Optional
+
+# 공통 패턴 (모듈을 읽을 때 한 번만 컴파일)
+YEAR_HEADER = re.compile(r'(\d{4})년')
+WON_AMOUNT = re.compile(r'(\d[\d,]*)원')
+PLAIN_AMOUNT = re.compile(r'\d{1,3}(?:,\d{3})+|\d+')
+
+
+class Keyword:
+    """
+    줄에 키워드가 포함되어 있으면 줄 전체를 항목으로 봅니다.
+    """
+    def __init__(self, *keywords):
+        self.keywords = keywords
+
+    def __call__(self, line):
+        return (0, len(line)) if any(keyword in line for keyword in self.keywords) else None
+
+
+class Substrings:
+    """
+    줄에 목록의 단어가 포함되어 있으면 줄 전체를 항목으로 봅니다.
+    목록 단어 길이만큼의 부분 문자열만 집합에서 조회하므로, 목록 크기와 관계없이 줄 길이 × 단어 길이 종류 수만큼 조회합니다.
+    """
+    def __init__(self, words):
+        self.words = frozenset(words)
+        self.lengths = sorted({len(word) for word in self.words})
+
+    def __call__(self, line):
+        for start in range(len(line)):
+            for length in self.lengths:
+                if start + length > len(line):
+                    break
+                if line[start:start + length] in self.words:
+                    return (0, len(line))
+        return None
+
+
+class Pattern:
+    """
+    정규식과 일치하는 부분을 항목으로 봅니다. whole_line=True이면 일치하는 줄 전체를 항목으로 봅니다.
+    """
+    def __init__(self, pattern, whole_line=False):
+        self.pattern = re.compile(pattern)
+        self.whole_line = whole_line
+
+    def __call__(self, line):
+        match = self.pattern.search(line)
+        if match is None:
+            return None
+        return (0, len(line)) if self.whole_line else match.span()
+
+
+class RuleSet(NamedTuple):
+    # 연도 머리글 (None이면 연도 없이 추출), 항목 판별, 금액 패턴
+    name: str
+    item: object
+    amount: re.Pattern
+    year: Optional[re.Pattern] = YEAR_HEADER
+    min_amounts: int = 1       # 한 줄에서 찾아야 하는 최소 금액 개수 (2 이상이면 모든 금액을 반환)
+    lookahead: int = 1         # 항목 줄 다음 몇 줄까지 금액을 찾을지
+    same_line: bool = True     # 항목 줄 자체의 금액도 사용할지
+
+
+class Extracted(NamedTuple):
+    year: Optional[int]
+    item: str
+    amounts: list
+    line: str
+
+
+def _amounts(rule, line, pos=0):
+    # 금액 목록과 첫 금액의 시작 위치
+    if rule.min_amounts == 1:
+        match = rule.amount.search(line, pos)
+        if match is None:
+            return [], None
+        return [int(match.group(match.lastindex or 0).replace(',', ''))], match.start()
+    matches = list(rule.amount.finditer(line, pos))
+    if len(matches) < rule.min_amounts:
+        return [], None
+    return [int(match.group(0).replace(',', '')) for match in matches], matches[0].start()
+
+
+def extract(rule, text):
+    """
+    OCR 텍스트를 한 번만 훑으며 (연도, 항목, 금액) 행을 찾습니다.
+    금액이 항목 줄에 없으면 다음 lookahead 줄 안에서 처음 나오는 금액을 그 항목의 금액으로 사용합니다.
+    금액 줄을 기다리는 항목이 여럿이면 (품명 줄이 연달아 나오는 경우) 모두 그 금액 줄의 금액을 사용합니다.
+    """
+    year = None
+    pending = []  # 금액 줄을 기다리는 (항목, 남은 줄 수)
+
+    for raw_line in text.split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        if rule.year is not None:
+            year_match = rule.year.search(line)
+            if year_match:
+                year = int(year_match.group(1))
+                pending = []
+                continue
+            if year is None:
+                continue
+
+        span = rule.item(line)
+        amounts, amount_start = _amounts(rule, line, span[1] if span and span[1] < len(line) else 0)
+
+        # 이전 항목 줄들이 기다리는 금액
+        if pending:
+            if amounts:
+                for item, _ in pending:
+                    yield Extracted(year, item, amounts, line)
+                pending = []
+            else:
+                pending = [(item, budget - 1) for item, budget in pending if budget > 1]
+
+        if span is None:
+            continue
+        start, end = span
+        if rule.same_line and amounts:
+            yield Extracted(year, line[start:min(end, amount_start)].strip(), amounts, line)
+        else:
+            pending.append((line[start:end].strip(), rule.lookahead))
+
+
+# 분야별 규칙 (새 분야는 규칙을 추가하면 됨)
+ENGINEERING = RuleSet('engineering', item=Keyword('기술자'), amount=WON_AMOUNT)
+
+CONSTRUCTION_OCCUPATIONS = [
+    '보통인부', '특별인부', '작업반장', '비계공', '형틀목공', '철근공', '용접공', '절단공',
+    '콘크리트공', '방수공', '미장공', '조적공', '견출공', '도장공', '배관공', '전공',
+]
+# 직종 이름을 포함하는 줄 전체가 항목 (내선전공처럼 목록의 직종을 포함하는 복합 직종명도 추출)
+CONSTRUCTION = RuleSet('construction', item=Substrings(CONSTRUCTION_OCCUPATIONS), amount=WON_AMOUNT)
+
+CONCRETE = RuleSet(
+    'concre',
+    item=Pattern(r'(?:BB|WC)-\d+\(#\d+\)\s*\S*'),
+    amount=re.compile(r'\d{1,3}(?:,\d{3})+|\d{5,}'),
+)
+
+CABLE_SIZE = re.compile(r'(\d+(\.\d+)?)\s*[xX×]\s*(\d+(\.\d+)?)(sq)?\s*mm.*')
+CABLE = RuleSet(
+    'cable',
+    item=Pattern(r'(?:F-CV|HIV|CVV|한국|케이블|전력|제어용|가교|연선|동선)|' + CABLE_SIZE.pattern, whole_line=True),
+    amount=PLAIN_AMOUNT,
+    year=None,
+    min_amounts=2,
+    lookahead=3,
+    same_line=False,
+)
+
+RULE_SETS = {rule.name: rule for rule in [ENGINEERING, CONSTRUCTION, CONCRETE, CABLE]}
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+
+# 예측 모형 (화면 표시 이름)
+MODELS = {
+    'log_linear': '로그 선형 추세',
+    'holt': 'Holt 지수평활',
+}
+
+# 예측 구간 (정규 근사 95%)
+BAND_Z = 1.96
+
+# Holt 평활 계수 후보 (품목마다 한 단계 앞 예측 오차가 가장 작은 조합을 선택)
+HOLT_ALPHAS = [0.2, 0.4, 0.6, 0.8, 1.0]
+HOLT_BETAS = [0.05, 0.2, 0.4, 0.6]
+
+PARAM_COLUMNS = ['n_years', 'last_year', 'last_price', 'level', 'slope', 'sigma', 'x_mean', 'sxx', 'alpha', 'beta']
+FORECAST_COLUMNS = ['item', 'year', 'forecast', 'lower', 'upper']
+
+
+def _log_matrix(wide):
+    # 품목 × 연도 로그 가격 (값이 없거나 0 이하이면 NaN)
+    values = wide.to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_values = np.log(values)
+    log_values[~np.isfinite(log_values)] = np.nan
+    return log_values
+
+
+def _last_observed(wide):
+    # 품목별 관측 연도 수, 마지막 관측 연도와 가격 (모형과 같이 0 이하 가격은 제외)
+    values = wide.to_numpy(dtype=float)
+    years = wide.columns.to_numpy(dtype=float)
+    observed = ~np.isnan(_log_matrix(wide))
+    last = np.where(observed.any(axis=1), values.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1), -1)
+    rows = np.arange(len(values))
+    last_year = np.where(last >= 0, years[np.maximum(last, 0)], np.nan)
+    last_price = np.where(last >= 0, values[rows, np.maximum(last, 0)], np.nan)
+    return observed.sum(axis=1), last_year, last_price
+
+
+def fit_log_linear(wide):
+    """
+    모든 품목에 log(가격) = level + slope × (연도 - 평균 연도)를 한 번에 최소제곱으로 맞춥니다.
+    결과는 품목별 모수 배열 딕셔너리(n, x_mean, level, slope, sxx, sigma, r2)입니다.
+    """
+    log_values = _log_matrix(wide)
+    observed = ~np.isnan(log_values)
+    years = np.broadcast_to(wide.columns.to_numpy(dtype=float), log_values.shape)
+
+    n = observed.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = np.where(observed, years, 0.0).sum(axis=1) / n
+        y_mean = np.where(observed, log_values, 0.0).sum(axis=1) / n
+        dx = np.where(observed, years - x_mean[:, None], 0.0)
+        dy = np.where(observed, log_values - y_mean[:, None], 0.0)
+        sxx = (dx * dx).sum(axis=1)
+        syy = (dy * dy).sum(axis=1)
+        slope = (dx * dy).sum(axis=1) / sxx
+        sse = ((dy - slope[:, None] * dx) ** 2).sum(axis=1)
+        r2 = np.where(syy > 0, 1 - sse / syy, 1.0)
+        sigma = np.where(n > 2, np.sqrt(sse / (n - 2)), np.nan)
+
+    fitted = (n >= 2) & (sxx > 0)
+    return {
+        'n': n,
+        'x_mean': x_mean,
+        'level': np.where(fitted, y_mean, np.nan),
+        'slope': np.where(fitted, slope, np.nan),
+        'sxx': sxx,
+        'sigma': sigma,
+        'r2': np.where(fitted, r2, np.nan),
+    }
+
+
+def _holt_pass(log_values, years, alpha, beta):
+    """
+    (후보 조합 × 품목) 배열로 Holt 선형 지수평활을 연도 순서대로 한 번 진행합니다.
+    중간 연도가 비어 있으면 그 간격만큼 추세를 적용해 예측합니다.
+    """
+    shape = (len(alpha), log_values.shape[0])
+    level = np.full(shape, np.nan)
+    trend = np.full(shape, np.nan)
+    last_year = np.full(shape, np.nan)
+    sse = np.zeros(shape)
+    count = np.zeros(shape)
+
+    for column, year in enumerate(years):
+        y = log_values[:, column]
+        observed = ~np.isnan(y)
+        if not observed.any():
+            continue
+        observed = np.broadcast_to(observed, shape)
+        dt = year - last_year
+        first = observed & np.isnan(level)
+        second = observed & ~np.isnan(level) & np.isnan(trend)
+        update = observed & ~np.isnan(trend)
+
+        with np.errstate(invalid='ignore'):
+            predicted = level + trend * dt
+            error = y - predicted
+            new_level = alpha * y + (1 - alpha) * predicted
+            new_trend = beta * (new_level - level) / dt + (1 - beta) * trend
+            sse += np.where(update, error ** 2, 0.0)
+            count += update
+            trend = np.where(second, (y - level) / dt, np.where(update, new_trend, trend))
+        level = np.where(first | second, y, np.where(update, new_level, level))
+        last_year = np.where(observed, year, last_year)
+    return level, trend, sse, count
+
+
+def fit_holt(wide):
+    """
+    모든 품목과 모든 (alpha, beta) 후보를 배열 하나로 묶어 Holt 지수평활을 맞추고,
+    품목마다 한 단계 앞 예측 제곱오차 평균이 가장 작은 조합을 고릅니다. 관측이 두 해뿐이면 첫 후보를 사용합니다.
+    """
+    log_values = _log_matrix(wide)
+    years = wide.columns.to_numpy(dtype=float)
+    grid = np.array([(alpha, beta) for alpha in HOLT_ALPHAS for beta in HOLT_BETAS])
+    level, trend, sse, count = _holt_pass(log_values, years, grid[:, :1], grid[:, 1:])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mse = np.where(count > 0, sse / count, np.inf)
+    best = np.argmin(mse, axis=0)
+    items = np.arange(log_values.shape[0])
+    best_mse = mse[best, items]
+    return {
+        'level': level[best, items],
+        'slope': trend[best, items],
+        'sigma': np.where(np.isfinite(best_mse), np.sqrt(best_mse), np.nan),
+        'alpha': grid[best, 0],
+        'beta': grid[best, 1],
+    }
+
+
+def fit(wide, model):
+    """
+    품목 × 연도 행렬의 모든 품목에 예측 모형을 맞춘 모수 표를 반환합니다. (로그 가격 기준)
+    """
+    if model not in MODELS:
+        raise ValueError(f"알 수 없는 예측 모형입니다: {model}")
+    if wide.empty:
+        return pd.DataFrame(columns=PARAM_COLUMNS, index=wide.index)
+
+    n_years, last_year, last_price = _last_observed(wide)
+    params = pd.DataFrame({'n_years': n_years, 'last_year': last_year, 'last_price': last_price}, index=wide.index)
+    if model == 'log_linear':
+        result = fit_log_linear(wide)
+        params['level'] = result['level']
+        params['slope'] = result['slope']
+        params['sigma'] = result['sigma']
+        params['x_mean'] = result['x_mean']
+        params['sxx'] = result['sxx']
+    else:
+        result = fit_holt(wide)
+        params['level'] = result['level']
+        params['slope'] = result['slope']
+        params['sigma'] = result['sigma']
+        params['x_mean'] = last_year
+        params['alpha'] = result['alpha']
+        params['beta'] = result['beta']
+    return params.reindex(columns=PARAM_COLUMNS)
+
+
+def predict(params, model, horizon=1):
+    """
+    모수 표로 품목별 마지막 관측 연도 다음 horizon년의 예측값과 예측 구간을 계산해 장형 표로 반환합니다.
+    """
+    params = params.dropna(subset=['level', 'slope'])
+    if params.empty:
+        return pd.DataFrame(columns=FORECAST_COLUMNS)
+
+    steps = np.arange(1, horizon + 1, dtype=float)
+    years = params['last_year'].to_numpy()[:, None] + steps
+    dx = years - params['x_mean'].to_numpy()[:, None]
+    mean = params['level'].to_numpy()[:, None] + params['slope'].to_numpy()[:, None] * dx
+    sigma = params['sigma'].to_numpy()[:, None]
+
+    if model == 'log_linear':
+        n = params['n_years'].to_numpy(dtype=float)[:, None]
+        spread = np.sqrt(1 + 1 / n + dx ** 2 / params['sxx'].to_numpy()[:, None])
+    else:
+        # h년 앞 예측 분산: sigma² × (1 + Σ_{j<h} alpha²(1 + j·beta)²)
+        alpha = params['alpha'].to_numpy()[:, None]
+        beta = params['beta'].to_numpy()[:, None]
+        terms = alpha ** 2 * (1 + steps[:-1] * beta) ** 2
+        spread = np.sqrt(1 + np.concatenate([np.zeros((len(params), 1)), np.cumsum(terms, axis=1)], axis=1))
+
+    band = BAND_Z * sigma * spread
+    return pd.DataFrame({
+        'item': np.repeat(params.index.to_numpy(), horizon),
+        'year': years.ravel().astype(int),
+        'forecast': np.exp(mean).ravel(),
+        'lower': np.exp(mean - band).ravel(),
+        'upper': np.exp(mean + band).ravel(),
+    })
@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 성능 측정 사용 여부 (환경 변수) 와 재실행별 기록을 추가할 JSON Lines 파일
+ENV_VAR = 'DASHBOARD_PROFILE'
+LOG_ENV_VAR = 'DASHBOARD_PROFILE_LOG'
+LOG_PATH = 'profile_log.jsonl'
+
+# Streamlit 세션마다 스크립트가 별도 스레드에서 실행되므로 재실행 기록은 스레드별로 보관
+_state = threading.local()
+
+
+def is_enabled(flag=None):
+    """
+    환경 변수 DASHBOARD_PROFILE=1 이거나 flag(주소의 ?profile=1 값)가 '1'이면 성능 측정을 사용합니다.
+    """
+    return os.environ.get(ENV_VAR, '') not in ('', '0') or flag == '1'
+
+
+def start_rerun(enabled):
+    # 스크립트 재실행 시작 (사용하지 않으면 기록하지 않음)
+    _state.records = [] if enabled else None
+    _state.stack = []
+    _state.start = time.perf_counter()
+
+
+def enabled():
+    return getattr(_state, 'records', None) is not None
+
+
+@contextmanager
+def timed(name, label='', cached=False):
+    """
+    with 블록의 실행 시간을 기록합니다. 블록 안에서 record['rows']에 행 수를 넣을 수 있고,
+    cached=True인 블록은 안에서 cache_miss()가 호출되지 않으면 캐시 적중으로 기록됩니다.
+    """
+    if not enabled():
+        yield {}
+        return
+
+    record = {'name': name, 'label': label, 'rows': None, 'cache': 'hit' if cached else None}
+    _state.stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        _state.stack.remove(record)
+        _state.records.append(record)
+
+
+def cache_miss():
+    """
+    캐시된 함수 본문에서 호출합니다. 현재 측정 중인 가장 안쪽의 캐시 블록을 캐시 미스로 표시합니다.
+    """
+    if not enabled():
+        return
+    for record in reversed(_state.stack):
+        if record['cache'] is not None:
+            record['cache'] = 'miss'
+            return
+
+
+def finish_rerun(context=None, log_path=None):
+    """
+    재실행 기록을 마무리하고 JSON Lines 로그에 한 줄로 추가한 뒤 반환합니다.
+    """
+    if not enabled():
+        return None
+
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+        'context': context,
+        'total_seconds': time.perf_counter() - _state.start,
+        'records': _state.records,
+    }
+    log_path = log_path or os.environ.get(LOG_ENV_VAR, LOG_PATH)
+    try:
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(run, ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(f"성능 측정 로그 저장 중 오류 발생: {e}")
+    _state.records = None
+    return run
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+# 분야별 조회 열 (품목 열, 값 열, 그룹 열)
+LOOKUP_COLUMNS = {
+    'cable': ('size', 'price', 'brand'),
+    'concre': ('spec', 'price', None),
+    'engineering': ('position', 'salary', None),
+    'construction': ('occupation', 'wage', None),
+}
+
+
+def _runs(changed):
+    # 정렬된 배열에서 값이 바뀌는 위치로 (시작, 끝) 구간 목록을 만듦
+    starts = np.flatnonzero(np.concatenate([[True], changed]))
+    ends = np.append(starts[1:], len(changed) + 1)
+    return zip(starts.tolist(), ends.tolist())
+
+
+class ItemLookup:
+    """
+    분야 데이터를 (그룹, 품목, 연도) 순으로 한 번 정렬해 두고, 품목별 연도·가격 배열 구간과
+    그룹별 품목·연도 목록을 딕셔너리로 보관합니다. 조회할 때 전체 데이터를 다시 훑지 않습니다.
+    """
+
+    def __init__(self, df, item_col, value_col, group_col=None):
+        self.item_col = item_col
+        self.value_col = value_col
+        self.group_col = group_col
+
+        group_values = df[group_col].astype(str) if group_col else pd.Series('', index=df.index)
+        group_codes, groups = pd.factorize(group_values, sort=True)
+        item_codes, items = pd.factorize(df[item_col].astype(str), sort=True)
+        years = df['year'].to_numpy().astype(int)
+        order = np.lexsort((years, item_codes, group_codes))
+        group_codes, item_codes, years = group_codes[order], item_codes[order], years[order]
+
+        # 원본 행은 모두 유지하고 그룹별 연속 구간과 목록을 기록
+        self.frame = df.iloc[order].reset_index(drop=True)
+        self._groups = {}
+        self.items_by_group = {}
+        self.years_by_group = {}
+        if len(order):
+            for start, end in _runs(group_codes[1:] != group_codes[:-1]):
+                group = groups[group_codes[start]]
+                self._groups[group] = (start, end)
+                self.items_by_group[group] = list(items[np.unique(item_codes[start:end])])
+                self.years_by_group[group] = np.unique(years[start:end]).tolist()
+
+        # 품목 배열에는 같은 (그룹, 품목, 연도)의 마지막 값만 사용
+        keep = np.ones(len(order), dtype=bool)
+        keep[:-1] = (group_codes[1:] != group_codes[:-1]) | (item_codes[1:] != item_codes[:-1]) | (years[1:] != years[:-1])
+        group_codes, item_codes = group_codes[keep], item_codes[keep]
+        self._years = years[keep]
+        self._values = df[value_col].to_numpy()[order[keep]].astype('int64')
+        self._items = {}
+        if keep.any():
+            changed = (group_codes[1:] != group_codes[:-1]) | (item_codes[1:] != item_codes[:-1])
+            for start, end in _runs(changed):
+                self._items[(groups[group_codes[start]], items[item_codes[start]])] = (start, end)
+
+        # 그룹이 없는 분야에서 쓰는 전체 목록
+        self.groups = list(self._groups)
+        self.items = list(items)
+        self.years = np.unique(years).tolist()
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def empty(self):
+        return len(self.frame) == 0
+
+    def group_frame(self, group):
+        """
+        한 그룹(케이블 품명)의 행만 담은 데이터프레임 (정렬된 데이터의 연속 구간)
+        """
+        start, end = self._groups.get(group, (0, 0))
+        return self.frame.iloc[start:end]
+
+    def series(self, item, group='', years=None):
+        """
+        한 품목의 연도별 값을 연도순 데이터프레임으로 반환합니다. years를 지정하면 그 연도만 남깁니다.
+        """
+        start, end = self._items.get((group, item), (0, 0))
+        item_years = self._years[start:end]
+        values = self._values[start:end]
+        if years is not None:
+            selected = np.isin(item_years, list(years))
+            item_years, values = item_years[selected], values[selected]
+        return pd.DataFrame({'year': item_years, self.item_col: item, self.value_col: values})
+
+    def batch(self, items, group='', years=None):
+        """
+        여러 품목의 연도별 값을 한 번에 꺼내 (연도, 품목, 값) 장형 데이터프레임으로 반환합니다.
+        품목마다 배열 구간을 찾아 위치 배열 하나로 모으므로 비용은 선택한 품목의 점 수에만 비례합니다.
+        """
+        items = list(items)
+        spans = np.array([self._items.get((group, item), (0, 0)) for item in items], dtype=int).reshape(-1, 2)
+        lengths = spans[:, 1] - spans[:, 0]
+        offsets = np.repeat(spans[:, 0] - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+        positions = offsets + np.arange(lengths.sum())
+
+        item_years = self._years[positions]
+        names = np.repeat(np.array(items, dtype=object), lengths)
+        values = self._values[positions]
+        if years is not None:
+            selected = np.isin(item_years, list(years))
+            item_years, names, values = item_years[selected], names[selected], values[selected]
+        return pd.DataFrame({'year': item_years, self.item_col: names, self.value_col: values})
+
+
+def build(category, df):
+    """
+    분야 데이터프레임으로 ItemLookup을 만듭니다. 빈 데이터프레임이어도 됩니다.
+    """
+    item_col, value_col, group_col = LOOKUP_COLUMNS[category]
+    if df.empty:
+        df = pd.DataFrame(columns=['year', item_col, value_col] + ([group_col] if group_col else []))
+    return ItemLookup(df, item_col, value_col, group_col)
@@ -0,0 +1,89 @@
+import hashlib
+import os
+import shutil
+import sys
+
+# 페이지별 OCR 원문 캐시 위치와 최대 크기
+CACHE_DIR = '.ocr_cache'
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+
+def file_hash(path):
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def page_key(pdf_hash, page_num, scale, lang, config):
+    # PDF 해시, 페이지 번호, 렌더링 배율(fitz.Matrix), 언어, Tesseract 설정으로 키 생성
+    raw = '|'.join([pdf_hash, str(page_num), f"matrix={scale}x{scale}", lang, ' '.join(config.split())])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _entry_path(key, cache_dir):
+    return os.path.join(cache_dir, key[:2], f"{key}.txt")
+
+
+def get(key, cache_dir=CACHE_DIR):
+    path = _entry_path(key, cache_dir)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except FileNotFoundError:
+        return None
+    # 최근 사용 시각 갱신 (오래된 항목부터 제거하기 위해)
+    os.utime(path)
+    return text
+
+
+def put(key, text, cache_dir=CACHE_DIR):
+    path = _entry_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _entries(cache_dir):
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            if name.endswith('.txt'):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                yield stat.st_mtime, stat.st_size, path
+
+
+def evict(max_bytes=MAX_CACHE_BYTES, cache_dir=CACHE_DIR):
+    """
+    캐시 크기가 한도를 넘으면 가장 오래 사용하지 않은 페이지부터 삭제합니다.
+    """
+    entries = sorted(_entries(cache_dir))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+        removed += 1
+    return removed
+
+
+def stats(cache_dir=CACHE_DIR):
+    entries = list(_entries(cache_dir))
+    return len(entries), sum(size for _, size, _ in entries)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "clear":
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        print(f"OCR 캐시를 삭제했습니다: {CACHE_DIR}")
+    else:
+        count, total = stats()
+        print(f"OCR 캐시: {count}페이지, {total / 1024 / 1024:.1f} MB ({CACHE_DIR})")
@@ -0,0 +1,196 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+import fitz  # PyMuPDF
+import pytesseract
+from PIL import Image
+import ocr_cache
+
+
+class PageResult(NamedTuple):
+    page_num: int
+    text: str
+    render_seconds: float
+    ocr_seconds: float
+    source: str = 'ocr'
+    text_seconds: float = 0.0  # 텍스트 레이어 추출 시간 (렌더링·OCR 시간과 별도)
+
+
+# 텍스트 레이어를 그대로 사용할 최소 단어 수와 허용하는 깨진 문자 비율
+MIN_TEXT_LAYER_WORDS = 10
+MAX_BROKEN_CHAR_RATIO = 0.05
+# 이미지 하나가 페이지 면적의 이 비율 이상을 덮으면 스캔 표로 보고 OCR
+MAX_IMAGE_AREA_RATIO = 0.5
+
+
+# 작업 프로세스별로 열어 둔 PDF 문서 (페이지마다 다시 열지 않도록)
+_worker_docs = {}
+
+
+def _init_worker(tesseract_cmd):
+    # 작업 프로세스 초기화: Tesseract 경로 설정 및 내부 스레드 1개로 제한
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def _open_document(pdf_path):
+    doc = _worker_docs.get(pdf_path)
+    if doc is None:
+        doc = fitz.open(pdf_path)
+        _worker_docs[pdf_path] = doc
+    return doc
+
+
+def _has_large_image(page):
+    # 머리글만 텍스트이고 표는 스캔 이미지인 페이지 확인
+    page_area = abs(page.rect)
+    for info in page.get_image_info():
+        if abs(fitz.Rect(info['bbox']) & page.rect) >= page_area * MAX_IMAGE_AREA_RATIO:
+            return True
+    return False
+
+
+def _visual_lines(words):
+    """
+    단어를 세로 중심 좌표로 화면상의 줄로 묶고, 줄마다 x 좌표 순서로 정렬합니다.
+    PDF에 표가 열 단위로 기록되어 있어도 같은 높이의 항목과 금액이 한 줄이 됩니다.
+    """
+    lines = []
+    for word in sorted(words, key=lambda w: (w[1] + w[3]) / 2):
+        center = (word[1] + word[3]) / 2
+        # 중심이 현재 줄 중심에서 단어 높이의 절반 이내이면 같은 줄
+        if lines and abs(center - lines[-1][0]) <= (word[3] - word[1]) / 2:
+            row = lines[-1][1]
+            row.append(word)
+            lines[-1] = (sum((w[1] + w[3]) / 2 for w in row) / len(row), row)
+        else:
+            lines.append((center, [word]))
+    return [' '.join(w[4] for w in sorted(row, key=lambda w: w[0])) for _, row in lines]
+
+
+def page_text_layer(page):
+    """
+    PDF 페이지에 포함된 텍스트 레이어를 화면상의 줄 단위 텍스트로 복원합니다.
+    쓸 만한 텍스트가 없거나 (스캔 이미지 등) 큰 이미지가 페이지를 덮고 있으면 None을 반환합니다.
+    """
+    # (x0, y0, x1, y1, 단어, 블록 번호, 줄 번호, 단어 번호)
+    words = page.get_text("words")
+    if len(words) < MIN_TEXT_LAYER_WORDS:
+        return None
+
+    # 글꼴 매핑이 깨진 PDF는 대체 문자(U+FFFD)가 섞여 나오므로 OCR로 처리
+    chars = ''.join(word[4] for word in words)
+    if chars.count('\ufffd') > len(chars) * MAX_BROKEN_CHAR_RATIO:
+        return None
+
+    # 텍스트는 머리글뿐이고 표가 이미지인 페이지는 OCR로 처리
+    if _has_large_image(page):
+        return None
+
+    return '\n'.join(_visual_lines(words))
+
+
+def ocr_page(pdf_path, page_num, scale=3, lang='kor+eng', config=''):
+    """
+    PDF 한 페이지를 이미지로 변환한 뒤 OCR을 수행합니다.
+    """
+    start = time.perf_counter()
+    page = _open_document(pdf_path).load_page(page_num)
+
+    # 페이지를 이미지로 변환 (해상도 향상)
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))
+    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    rendered = time.perf_counter()
+
+    text = pytesseract.image_to_string(img, lang=lang, config=config)
+    return PageResult(page_num, text, rendered - start, time.perf_counter() - rendered)
+
+
+def _report(result, page_count):
+    print(f"페이지 {result.page_num + 1}/{page_count} 완료 "
+          f"(렌더링 {result.render_seconds:.2f}초, OCR {result.ocr_seconds:.2f}초)")
+
+
+def _text_layer_pages(pdf_path):
+    # 텍스트 레이어가 있는 페이지는 이미지 변환과 OCR 없이 바로 읽음
+    results = {}
+    with fitz.open(pdf_path) as doc:
+        for page_num in range(len(doc)):
+            start = time.perf_counter()
+            text = page_text_layer(doc.load_page(page_num))
+            if text is not None:
+                results[page_num] = PageResult(page_num, text, 0.0, 0.0, 'text', text_seconds=time.perf_counter() - start)
+    return results
+
+
+def ocr_pdf_pages(pdf_path, scale=3, lang='kor+eng', config='', workers=None, cache_dir=ocr_cache.CACHE_DIR,
+                  use_text_layer=True):
+    """
+    PDF의 모든 페이지를 프로세스 풀에서 병렬로 OCR하고 페이지 순서대로 반환합니다.
+    workers를 지정하지 않으면 CPU 코어 수만큼 작업 프로세스를 사용합니다.
+    텍스트 레이어가 있는 페이지는 OCR 없이 텍스트를 바로 사용하고 (use_text_layer),
+    이전에 같은 조건으로 OCR한 페이지는 cache_dir의 캐시에서 읽습니다 (None이면 캐시 사용 안 함).
+    """
+    with fitz.open(pdf_path) as doc:
+        page_count = len(doc)
+    if page_count == 0:
+        return []
+
+    start = time.perf_counter()
+    results = [None] * page_count
+
+    if use_text_layer:
+        for page_num, result in _text_layer_pages(pdf_path).items():
+            results[page_num] = result
+    text_count = sum(result is not None for result in results)
+
+    # 캐시에 있는 페이지는 OCR 생략
+    keys = {}
+    if cache_dir is not None and text_count < page_count:
+        pdf_hash = ocr_cache.file_hash(pdf_path)
+        for page_num in range(page_count):
+            if results[page_num] is not None:
+                continue
+            keys[page_num] = ocr_cache.page_key(pdf_hash, page_num, scale, lang, config)
+            text = ocr_cache.get(keys[page_num], cache_dir)
+            if text is not None:
+                results[page_num] = PageResult(page_num, text, 0.0, 0.0, 'cache')
+    pending = [page_num for page_num in range(page_count) if results[page_num] is None]
+    cached_count = page_count - text_count - len(pending)
+
+    def store(result):
+        results[result.page_num] = result
+        if cache_dir is not None:
+            ocr_cache.put(keys[result.page_num], result.text, cache_dir)
+        _report(result, page_count)
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    if workers == 1:
+        # 단일 프로세스 처리
+        for page_num in pending:
+            store(ocr_page(pdf_path, page_num, scale, lang, config))
+        if pdf_path in _worker_docs:
+            _worker_docs.pop(pdf_path).close()
+    elif workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(pytesseract.pytesseract.tesseract_cmd,),
+        ) as executor:
+            futures = [
+                executor.submit(ocr_page, pdf_path, page_num, scale, lang, config)
+                for page_num in pending
+            ]
+            for future in as_completed(futures):
+                store(future.result())
+
+    if cache_dir is not None and pending:
+        ocr_cache.evict(cache_dir=cache_dir)
+
+    elapsed = time.perf_counter() - start
+    ocr_total = sum(result.ocr_seconds for result in results)
+    text_total = sum(result.text_seconds for result in results)
+    print(f"{pdf_path}: {page_count}페이지 (텍스트 레이어 {text_count}, 캐시 {cached_count}, OCR {len(pending)}), "
+          f"작업 프로세스 {workers}개, 총 {elapsed:.1f}초 (페이지 OCR 합계 {ocr_total:.1f}초, 텍스트 레이어 {text_total:.1f}초)")
+    return results
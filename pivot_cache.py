@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+import pandas as pd
+import change_rate
+import price_analytics
+
+# 캐시 기본 한도
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+def _entry_size(entry):
+    # 항목에 포함된 데이터프레임의 메모리 사용량 합계
+    return sum(
+        int(value.memory_usage(deep=True).sum())
+        for value in entry.values()
+        if isinstance(value, pd.DataFrame)
+    )
+
+
+class PivotCache:
+    """
+    (분야, 시작 연도, 종료 연도, 품명) 키별로 품목 × 연도 행렬과 변동률 표를 보관하는 LRU 캐시입니다.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key, entry):
+        size = _entry_size(entry)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._sizes.pop(key)
+                del self._entries[key]
+            self._entries[key] = entry
+            self._sizes[key] = size
+            self.total_bytes += size
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        entry = self.get(key)
+        if entry is None:
+            entry = compute()
+            self.put(key, entry)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+    def _evict(self):
+        # 가장 오래 사용하지 않은 항목부터 제거 (방금 넣은 항목은 유지)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(key)
+
+
+def build_pivot_entry(df, item_col, value_col, min_year, max_year):
+    """
+    선택한 연도 범위의 품목 × 연도 행렬, 모든 품목의 변동률 표와 전체 연도 기준 분석 표를 계산합니다.
+    """
+    in_range = df[(df['year'] >= min_year) & (df['year'] <= max_year)]
+    matrix = change_rate.pivot_years(in_range, item_col, value_col=value_col)
+    return {
+        'matrix': matrix,
+        'changes': change_rate.compute_changes(matrix, min_year, max_year),
+        'analytics': price_analytics.compute_analytics(matrix),
+    }
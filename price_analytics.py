@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import change_rate
+import forecast
+
+# 품목별 분석 결과 열 구성
+ANALYTICS_COLUMNS = [
+    'n_years', 'start_year', 'end_year', 'start_price', 'end_price', 'change_percent', 'cagr',
+    'yoy_mean', 'yoy_std', 'max_drawdown', 'trend_growth', 'trend_r2',
+]
+
+# 화면 표시용 열 이름
+ANALYTICS_LABELS = {
+    'n_years': '연도 수',
+    'start_year': '시작 연도',
+    'end_year': '종료 연도',
+    'start_price': '시작 가격',
+    'end_price': '종료 가격',
+    'change_percent': '총 변동률(%)',
+    'cagr': '연평균 변동률 CAGR(%)',
+    'yoy_mean': '전년 대비 평균(%)',
+    'yoy_std': '전년 대비 표준편차(%p)',
+    'max_drawdown': '최대 하락폭(%)',
+    'trend_growth': '추세 상승률(%/년)',
+    'trend_r2': '추세 R²',
+}
+
+
+def yoy_changes(wide):
+    """
+    품목 × 연도 행렬에서 전년 대비 변동률(%) 행렬을 계산합니다.
+    중간 연도가 비어 있으면 직전 값이 있는 연도와 비교해 연 단위로 환산합니다.
+    """
+    values = wide.to_numpy(dtype=float)
+    years = np.broadcast_to(wide.columns.to_numpy(dtype=float), values.shape)
+    observed = ~np.isnan(values)
+
+    # 직전 관측값과 그 연도 (앞으로 채운 뒤 한 칸 이동)
+    previous_value = pd.DataFrame(values).ffill(axis=1).shift(1, axis=1).to_numpy()
+    previous_year = pd.DataFrame(np.where(observed, years, np.nan)).ffill(axis=1).shift(1, axis=1).to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        yoy = ((values / previous_value) ** (1 / (years - previous_year)) - 1) * 100
+    yoy[~observed | (previous_value <= 0)] = np.nan
+    return pd.DataFrame(yoy, index=wide.index, columns=wide.columns)
+
+
+def max_drawdown(wide):
+    # 이전 최고가 대비 가장 크게 떨어진 비율(%, 0 이하)
+    values = wide.to_numpy(dtype=float)
+    running_max = np.fmax.accumulate(values, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = (values / running_max - 1) * 100
+    return pd.DataFrame(drawdown).min(axis=1, skipna=True).to_numpy()
+
+
+def log_linear_trend(wide):
+    """
+    품목별로 log(가격) = a + b × 연도 를 최소제곱으로 맞춘 연간 추세 상승률(%)과 결정계수를 계산합니다.
+    값이 없거나 0 이하인 연도는 제외합니다. (적합은 forecast.fit_log_linear와 같음)
+    """
+    result = forecast.fit_log_linear(wide)
+    return (np.exp(result['slope']) - 1) * 100, result['r2']
+
+
+def compute_analytics(wide):
+    """
+    모든 품목의 CAGR, 전년 대비 변동률 평균·표준편차, 최대 하락폭, 로그 선형 추세를 한 번에 계산합니다.
+    시작·종료 가격과 CAGR은 품목별로 값이 있는 첫 해와 마지막 해 기준입니다.
+    """
+    if wide.empty:
+        return pd.DataFrame(columns=ANALYTICS_COLUMNS, index=wide.index)
+
+    yoy = yoy_changes(wide)
+    growth, r2 = log_linear_trend(wide)
+    result = pd.DataFrame({
+        'n_years': wide.notna().sum(axis=1).to_numpy(),
+        'yoy_mean': yoy.mean(axis=1).to_numpy(),
+        'yoy_std': yoy.std(axis=1).to_numpy(),
+        'max_drawdown': max_drawdown(wide),
+        'trend_growth': growth,
+        'trend_r2': r2,
+    }, index=wide.index)
+
+    changes = change_rate.compute_changes(wide)
+    result = result.join(changes[['start_year', 'end_year', 'start_price', 'end_price', 'change_percent', 'cagr']])
+
+    # 두 해 이상 값이 있는 품목만 반환
+    result = result[result['n_years'] >= 2].dropna(subset=['cagr'])
+    result[['start_year', 'end_year']] = result[['start_year', 'end_year']].astype(int)
+    return result[ANALYTICS_COLUMNS]
+
+
+def display_table(analytics, item_label):
+    """
+    분석 표를 화면 표시용 열 이름으로 바꾸고 소수점을 정리합니다.
+    """
+    table = analytics.rename(columns=ANALYTICS_LABELS).round(2)
+    table.index = table.index.astype(str)
+    table.index.name = item_label
+    return table.reset_index()
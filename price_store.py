@@ -0,0 +1,407 @@
+import glob
+import io
+import json
+import os
+import re
+import sys
+import numpy as np
+import pandas as pd
+import documentai_loader
+import ocr_cache
+
+# 통합 단가 저장소 폴더, 분야별 Parquet 파일 하나씩 (마크다운/JSON 원본 파일은 가져오기에만 사용)
+STORE_DIR = 'price_data'
+
+# 장형(long-format) 테이블 열 구성
+STORE_COLUMNS = ['category', 'item', 'spec', 'unit', 'year', 'price']
+
+# 분야별 원본 파일 (마크다운 표, 케이블은 Document AI JSON 포함)
+SOURCES = {
+    'cable': ['cable_data.md', 'onlycable.json'],
+    'concre': ['concre_table_ocr.md'],
+    'engineering': ['engineering_salary_ocr.md'],
+    'construction': ['construction_wage_ocr.md'],
+}
+
+CATEGORIES = list(SOURCES)
+
+# 케이블 제조사 카탈로그 폴더 (품명, 규격, 단위, 연도 열로 된 마크다운 표 또는 CSV)
+CABLE_CATALOG_DIR = 'cable_catalogs'
+CABLE_ID_COLUMNS = ['품명', '규격', '단위']
+
+# 분야 표시 이름
+CATEGORY_LABELS = {
+    'cable': '전기 (케이블)',
+    'concre': '토목 (아스팔트 콘크리트)',
+    'engineering': '엔지니어링노임',
+    'construction': '건설업 임금실태',
+}
+
+# 분야별로 app.py 탭에서 사용하는 열 이름
+CATEGORY_COLUMNS = {
+    'cable': {'item': 'brand', 'spec': 'size', 'unit': 'unit', 'price': 'price'},
+    'concre': {'spec': 'spec', 'price': 'price'},
+    'engineering': {'item': 'position', 'price': 'salary'},
+    'construction': {'item': 'occupation', 'price': 'wage'},
+}
+
+
+def read_markdown_table(path):
+    """
+    마크다운 파이프 테이블을 읽어 문자열 데이터프레임으로 반환합니다.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        markdown_text = f.read()
+
+    # 테이블 시작 위치 찾기 (앞부분 제목 줄 건너뛰기)
+    table_start = re.search(r'^[ \t]*\|', markdown_text, re.MULTILINE)
+    if table_start is None:
+        return pd.DataFrame()
+
+    # 헤더 다음의 구분선은 건너뛰고 한 번에 파싱
+    df = pd.read_csv(
+        io.StringIO(markdown_text[table_start.start():]),
+        sep='|',
+        skiprows=[1],
+        dtype=str,
+        skip_blank_lines=True,
+    )
+    df = df.iloc[:, 1:-1]  # 첫 번째와 마지막 열 제거 (마크다운 형식으로 인한 빈 열)
+    df.columns = df.columns.str.strip()
+    return df.apply(lambda col: col.str.strip())
+
+
+def _to_price(values):
+    return pd.to_numeric(values.str.replace(',', '', regex=False), errors='coerce')
+
+
+def read_catalog(path):
+    """
+    케이블 카탈로그 파일(마크다운 표 또는 CSV)을 읽습니다. 연도 열은 파서에서 바로 숫자로 변환합니다.
+    """
+    if path.endswith('.csv'):
+        df = pd.read_csv(path, thousands=',', skipinitialspace=True, encoding='utf-8-sig')
+    else:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            markdown_text = f.read()
+        table_start = re.search(r'^[ \t]*\|', markdown_text, re.MULTILINE)
+        if table_start is None:
+            return pd.DataFrame(columns=CABLE_ID_COLUMNS)
+        df = pd.read_csv(
+            io.StringIO(markdown_text[table_start.start():]),
+            sep='|',
+            skiprows=[1],
+            thousands=',',
+            skipinitialspace=True,
+        )
+        df = df.iloc[:, 1:-1]  # 첫 번째와 마지막 열 제거 (마크다운 형식으로 인한 빈 열)
+
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _factorize_stripped(values):
+    # 고유값만 공백 제거한 뒤 범주 코드로 변환 (행마다 문자열 처리하지 않음)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    stripped_codes, categories = pd.factorize(pd.Index(uniques).astype(str).str.strip())
+    return stripped_codes[codes], categories
+
+
+def ingest_cable_catalogs(paths):
+    """
+    여러 케이블 카탈로그를 한 번에 장형 테이블로 변환합니다.
+    연도 열의 개수와 범위는 파일마다 달라도 되며, 같은 품명·규격·연도는 뒤에 읽은 파일이 우선합니다.
+    """
+    frames = [read_catalog(path) for path in paths]
+    wide = pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame(columns=CABLE_ID_COLUMNS)
+    year_columns = sorted(c for c in wide.columns if re.fullmatch(r'\d{4}', c))
+
+    item_codes, items = _factorize_stripped(wide['품명'])
+    spec_codes, specs = _factorize_stripped(wide['규격'])
+    unit_codes, units = _factorize_stripped(wide['단위'])
+
+    # 연도 열 전체를 숫자 행렬로 (문자열이 섞인 열만 따로 변환)
+    prices = wide[year_columns].apply(
+        lambda col: col if pd.api.types.is_numeric_dtype(col) else _to_price(col.astype(str))
+    )
+    prices['unit'] = unit_codes
+
+    # 같은 품명·규격은 연도별로 마지막 값 사용 (여러 파일에 나뉜 연도는 합쳐짐)
+    grouped = prices.groupby([item_codes, spec_codes], sort=False).last()
+    values = grouped[year_columns].to_numpy(dtype='float64')
+    n_rows, n_years = values.shape
+
+    def repeat(codes, categories):
+        return pd.Categorical.from_codes(np.repeat(codes, n_years), categories)
+
+    long_df = pd.DataFrame({
+        'category': pd.Categorical.from_codes(np.zeros(n_rows * n_years, dtype='int8'), ['cable']),
+        'item': repeat(grouped.index.get_level_values(0).to_numpy(), items),
+        'spec': repeat(grouped.index.get_level_values(1).to_numpy(), specs),
+        'unit': repeat(grouped['unit'].to_numpy(), units),
+        'year': np.tile(np.array(year_columns, dtype='int16'), n_rows),
+        'price': values.ravel(),
+    })
+    return long_df[~np.isnan(values.ravel())]
+
+
+def _import_concre(df):
+    return pd.DataFrame({
+        'item': '아스팔트 콘크리트',
+        'spec': df['규격'],
+        'unit': '톤',
+        'year': df['연도'].str.replace('년', '', regex=False),
+        'price': _to_price(df['가격']),
+    })
+
+
+def _import_engineering(df):
+    return pd.DataFrame({
+        'item': df['position'],
+        'spec': '',
+        'unit': '일',
+        'year': df['year'],
+        'price': _to_price(df['salary']),
+    })
+
+
+def _import_construction(df):
+    return pd.DataFrame({
+        'item': df['occupation'],
+        'spec': '',
+        'unit': '일',
+        'year': df['year'],
+        'price': _to_price(df['wage']),
+    })
+
+
+IMPORTERS = {
+    'concre': _import_concre,
+    'engineering': _import_engineering,
+    'construction': _import_construction,
+}
+
+
+def import_source(category, path):
+    """
+    분야별 원본 파일 하나를 장형 테이블로 가져옵니다.
+    """
+    if path.endswith('.json'):
+        # Document AI 케이블 단가표
+        long_df = documentai_loader.load_cable_table(path)
+    elif category == 'cable':
+        return ingest_cable_catalogs([path])
+    else:
+        raw_df = read_markdown_table(path)
+        if raw_df.empty:
+            return pd.DataFrame(columns=STORE_COLUMNS)
+        long_df = IMPORTERS[category](raw_df)
+
+    long_df.insert(0, 'category', category)
+    long_df['year'] = pd.to_numeric(long_df['year'], errors='coerce')
+    return long_df.dropna(subset=['year', 'price'])[STORE_COLUMNS]
+
+
+def source_files(category):
+    """
+    분야별 원본 파일 목록 (케이블은 카탈로그 폴더의 파일 포함)
+    """
+    files = list(SOURCES[category])
+    if category == 'cable':
+        files += sorted(
+            glob.glob(os.path.join(CABLE_CATALOG_DIR, '*.md')) + glob.glob(os.path.join(CABLE_CATALOG_DIR, '*.csv'))
+        )
+    return files
+
+
+def import_category(category):
+    """
+    분야의 모든 원본 파일을 가져옵니다. 케이블 카탈로그는 한 번에 일괄 변환합니다.
+    """
+    files = []
+    for source in source_files(category):
+        if os.path.exists(source):
+            files.append(source)
+        else:
+            print(f"원본 파일을 찾을 수 없습니다: {source}")
+
+    frames = []
+    if category == 'cable':
+        catalogs = [path for path in files if not path.endswith('.json')]
+        files = [path for path in files if path.endswith('.json')]
+        if catalogs:
+            frames.append(ingest_cable_catalogs(catalogs))
+    frames += [import_source(category, path) for path in files]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=STORE_COLUMNS)
+
+
+def _finalize(df):
+    # 문자열 열은 범주형 코드로, 숫자 열은 고정 폭 정수로 저장
+    df = df.reset_index(drop=True)
+    for column in ['category', 'item', 'spec', 'unit']:
+        if not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(str).astype('category')
+    df['year'] = df['year'].astype('int16')
+    df['price'] = df['price'].astype('int64')
+    return df
+
+
+def _combine(frames):
+    # 분야별 범주형 열은 범주 목록이 달라 합치면 문자열이 되므로 다시 범주형으로 변환
+    return _finalize(pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=STORE_COLUMNS))
+
+
+def category_path(category, store_dir=STORE_DIR):
+    return os.path.join(store_dir, f"{category}.parquet")
+
+
+def manifest_path(category, store_dir=STORE_DIR):
+    # 분야 저장소를 만들 때 사용한 원본 파일 목록과 크기, 수정 시각, 내용 해시
+    return os.path.join(store_dir, f"{category}.sources.json")
+
+
+def source_signature(category):
+    """
+    분야 원본 파일들의 (경로, 수정 시각, 크기) 목록입니다. stat만 하므로 재실행마다 확인해도 부담이 없습니다.
+    """
+    signature = []
+    for source in source_files(category):
+        try:
+            stat = os.stat(source)
+        except FileNotFoundError:
+            continue
+        signature.append((source, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _fingerprints(signature, previous=None):
+    # 수정 시각과 크기가 이전과 같으면 해시를 다시 계산하지 않음
+    previous = previous or {}
+    fingerprints = {}
+    for source, mtime_ns, size in signature:
+        old = previous.get(source)
+        if old is not None and old['mtime_ns'] == mtime_ns and old['size'] == size:
+            fingerprints[source] = old
+        else:
+            fingerprints[source] = {'mtime_ns': mtime_ns, 'size': size, 'sha256': ocr_cache.file_hash(source)}
+    return fingerprints
+
+
+def _read_manifest(category, store_dir):
+    try:
+        with open(manifest_path(category, store_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_manifest(category, fingerprints, store_dir):
+    path = manifest_path(category, store_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(fingerprints, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _write_parquet(df, path):
+    # 같은 폴더의 임시 파일에 쓴 뒤 바꿔 넣어, 다른 세션이 쓰는 도중의 파일을 읽지 않도록 함
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def build_category(category, store_dir=STORE_DIR):
+    """
+    한 분야의 원본 파일만 다시 가져와 저장소에 저장합니다.
+    """
+    signature = source_signature(category)
+    df = _finalize(import_category(category))
+    os.makedirs(store_dir, exist_ok=True)
+    _write_parquet(df, category_path(category, store_dir))
+    _write_manifest(category, _fingerprints(signature, _read_manifest(category, store_dir)), store_dir)
+    return df
+
+
+def build_store(store_dir=STORE_DIR):
+    """
+    모든 분야의 원본 파일을 가져와 저장소를 다시 만듭니다.
+    """
+    frames = []
+    for category in CATEGORIES:
+        try:
+            frames.append(build_category(category, store_dir))
+        except Exception as e:
+            print(f"{category} 가져오기 오류: {e}")
+    return _combine(frames)
+
+
+def _check_sources(category, store_dir):
+    # (다시 가져와야 하는지, 기록된 지문, 현재 원본 지문) - 파일은 쓰지 않음
+    manifest = _read_manifest(category, store_dir)
+    if manifest is None or not os.path.exists(category_path(category, store_dir)):
+        return True, manifest, None
+
+    signature = source_signature(category)
+    if [source for source, _, _ in signature] != list(manifest):
+        return True, manifest, None
+    fingerprints = _fingerprints(signature, manifest)
+    stale = any(fingerprints[source]['sha256'] != manifest[source]['sha256'] for source in manifest)
+    return stale, manifest, fingerprints
+
+
+def is_stale(category, store_dir=STORE_DIR):
+    """
+    분야의 저장소 파일이 없거나 원본 파일이 추가·삭제·변경된 경우 True를 반환합니다.
+    수정 시각이나 크기가 달라진 파일만 해시를 비교하므로, 내용이 같은 파일을 다시 저장한 경우는 다시 가져오지 않습니다.
+    """
+    return _check_sources(category, store_dir)[0]
+
+
+def load_category(category, store_dir=STORE_DIR):
+    """
+    한 분야의 저장소 파일만 읽습니다. 원본이 변경된 경우에만 그 분야를 다시 가져옵니다.
+    """
+    stale, manifest, fingerprints = _check_sources(category, store_dir)
+    if stale:
+        return build_category(category, store_dir)
+    if fingerprints != manifest:
+        # 내용은 같고 수정 시각만 바뀐 경우, 다음 확인 때 해시를 다시 계산하지 않도록 기록
+        _write_manifest(category, fingerprints, store_dir)
+    return pd.read_parquet(category_path(category, store_dir))
+
+
+def load_store(store_dir=STORE_DIR):
+    """
+    모든 분야를 읽어 하나의 장형 테이블로 합칩니다.
+    """
+    return _combine([load_category(category, store_dir) for category in CATEGORIES])
+
+
+def store_version(category, store_dir=STORE_DIR):
+    # 분야 저장소 파일 수정 시각 (캐시 키에 사용)
+    path = category_path(category, store_dir)
+    return os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+
+
+def category_frame(store, category):
+    """
+    통합 저장소에서 한 분야를 꺼내 app.py 탭에서 쓰는 열 이름으로 반환합니다.
+    """
+    columns = CATEGORY_COLUMNS[category]
+    df = store[store['category'] == category]
+    df = df[['year'] + list(columns)].rename(columns=columns).reset_index(drop=True)
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].cat.remove_unused_categories()
+    return df
+
+
+if __name__ == "__main__":
+    store_dir = sys.argv[1] if len(sys.argv) > 1 else STORE_DIR
+    store = build_store(store_dir)
+    print(f"저장소를 다시 만들었습니다: {store_dir} ({len(store)}개 행)")
+    print(store.groupby('category', observed=True).size().to_string())
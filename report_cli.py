@@ -0,0 +1,273 @@
+import argparse
+import html
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from plotly.offline import get_plotlyjs
+import change_rate
+import charts
+import composite_index
+import data_registry
+import forecast
+import pivot_cache
+import price_analytics
+import price_store
+
+# 분야별 보고서 표시 이름 (품목 이름, 값 이름)
+SECTIONS = {
+    'engineering': {'item_label': '기술자 등급', 'value_label': '노임단가'},
+    'construction': {'item_label': '직종', 'value_label': '임금'},
+    'concre': {'item_label': '규격', 'value_label': '가격'},
+    'cable': {'item_label': '케이블 사이즈', 'value_label': '가격'},
+}
+
+FORMATS = ['html', 'csv', 'xlsx']
+PLOTLY_JS = 'plotly.min.js'
+BASKET_WEIGHT = 25.0  # 앱의 기본 바스켓 가중치와 같음
+
+PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+<style>
+body {{ font-family: sans-serif; margin: 24px; }}
+table {{ border-collapse: collapse; font-size: 13px; margin-bottom: 24px; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def _slug(text):
+    return re.sub(r'[^\w.-]+', '_', str(text)).strip('_')
+
+
+def collect_sections(categories, from_year=None, to_year=None, model=None, horizon=1):
+    """
+    분야별(케이블은 품명별)로 앱과 같은 계산(품목 × 연도 행렬, 변동률 표, 분석 표)을 수행합니다.
+    연도를 지정하지 않으면 각 구역의 첫 해와 마지막 해를 사용합니다. model을 지정하면 모든 연도 기준 예측도 계산합니다.
+    """
+    sections = []
+    for category in categories:
+        lookup = data_registry.load_category_lookup(category)
+        if lookup.empty:
+            print(f"{price_store.CATEGORY_LABELS[category]}: 데이터가 없어 건너뜁니다.")
+            continue
+
+        for group in lookup.groups:
+            years = [year for year in lookup.years_by_group[group]
+                     if (from_year is None or year >= from_year) and (to_year is None or year <= to_year)]
+            if len(years) < 2:
+                continue
+            frame = lookup.group_frame(group) if lookup.group_col else lookup.frame
+            entry = pivot_cache.build_pivot_entry(frame, lookup.item_col, lookup.value_col, years[0], years[-1])
+            if model is not None:
+                wide = change_rate.pivot_years(frame, lookup.item_col, value_col=lookup.value_col)
+                wide.index = wide.index.astype(str)
+                entry['forecast'] = forecast.predict(forecast.fit(wide, model), model, horizon)
+            title = price_store.CATEGORY_LABELS[category] + (f" - {group}" if group else '')
+            sections.append({
+                'key': _slug(f"{category}_{group}" if group else category),
+                'category': category,
+                'group': group,
+                'title': title,
+                'lookup': lookup,
+                'years': years,
+                **SECTIONS[category],
+                **entry,
+            })
+    return sections
+
+
+def figure_tasks(sections, item_charts=True):
+    """
+    그래프 작업 목록 (구역 키, 순서, charts 함수 이름, 인자, 키워드 인자)을 만듭니다. 인자는 작업 프로세스로 전달됩니다.
+    """
+    tasks = []
+    for section in sections:
+        min_year, max_year = section['years'][0], section['years'][-1]
+        prefix = f"{section['group']} " if section['group'] else ''
+        tasks.append((section['key'], 0, 'change_bar_figure', (
+            section['changes'], section['item_label'],
+            f"{prefix}{section['item_label']}별 {section['value_label']} 변동률 ({min_year}-{max_year})",
+        ), {}))
+        if not item_charts:
+            continue
+        lookup = section['lookup']
+        predictions = dict(tuple(section['forecast'].groupby('item'))) if 'forecast' in section else {}
+        for position, item in enumerate(section['matrix'].index, start=1):
+            series = lookup.series(str(item), section['group'], section['years'])
+            tasks.append((section['key'], position, 'trend_figure', (
+                series, lookup.value_col, f"{prefix}{item} 연도별 {section['value_label']} 추이", section['value_label'],
+            ), {'prediction': predictions.get(str(item))}))
+    return tasks
+
+
+def render_figure(task):
+    # 작업 프로세스에서 그래프 하나를 만들어 HTML 조각으로 반환
+    key, position, builder, args, kwargs = task
+    fig = getattr(charts, builder)(*args, **kwargs)
+    return key, position, fig.to_html(full_html=False, include_plotlyjs=False)
+
+
+def render_figures(tasks, workers):
+    """
+    그래프를 여러 프로세스에서 나누어 만들고 {구역 키: [HTML 조각, ...]}로 모읍니다. workers가 1이면 현재 프로세스에서 만듭니다.
+    """
+    if workers <= 1:
+        results = map(render_figure, tasks)
+        return _group_figures(results)
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _group_figures(executor.map(render_figure, tasks, chunksize=chunksize))
+
+
+def _group_figures(results):
+    figures = {}
+    for key, position, fragment in results:
+        figures.setdefault(key, []).append((position, fragment))
+    return {key: [fragment for _, fragment in sorted(items)] for key, items in figures.items()}
+
+
+def composite_section(store):
+    """
+    기본 기준 연도와 동일 가중치로 종합 지수를 계산합니다.
+    """
+    coverage = composite_index.base_year_coverage(store)
+    base_year = composite_index.default_base_year(coverage)
+    result = composite_index.compute(store, base_year, {category: BASKET_WEIGHT for category in price_store.CATEGORIES})
+    indices = result['categories'].rename(columns=price_store.CATEGORY_LABELS)
+    return base_year, indices.assign(**{'종합 지수': result['composite']})
+
+
+def _tables(section):
+    # 보고서에 저장하는 표 (이름, 데이터프레임)
+    prices = section['matrix'].copy()
+    prices.index = prices.index.astype(str)
+    prices.index.name = section['item_label']
+    changes = section['changes'].copy()
+    changes.index = changes.index.astype(str)
+    changes.index.name = section['item_label']
+    tables = [
+        ('prices', prices.reset_index()),
+        ('changes', changes.round(2).reset_index()),
+        ('analytics', price_analytics.display_table(section['analytics'], section['item_label'])),
+    ]
+    if 'forecast' in section:
+        tables.append(('forecast', section['forecast'].rename(columns={'item': section['item_label']}).round(0)))
+    return tables
+
+
+def write_csv(sections, index_table, output_dir):
+    for section in sections:
+        for name, table in _tables(section):
+            table.to_csv(os.path.join(output_dir, f"{section['key']}_{name}.csv"), index=False, encoding='utf-8-sig')
+    if index_table is not None:
+        index_table.round(2).to_csv(os.path.join(output_dir, 'composite_index.csv'), encoding='utf-8-sig')
+
+
+def write_xlsx(sections, index_table, output_dir):
+    """
+    모든 표를 한 엑셀 파일에 시트별로 저장합니다.
+    """
+    path = os.path.join(output_dir, 'report.xlsx')
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        if index_table is not None:
+            index_table.round(2).to_excel(writer, sheet_name='composite_index')
+        for section in sections:
+            for name, table in _tables(section):
+                # 엑셀 시트 이름은 31자 제한
+                sheet = f"{section['key'][:31 - len(name) - 1]}_{name}"
+                table.to_excel(writer, sheet_name=sheet, index=False)
+    return path
+
+
+def write_html(sections, figures, index_table, index_figure, output_dir):
+    """
+    요약 페이지(index.html)와 구역별 품목 추이 페이지를 씁니다. plotly.js는 한 번만 저장해 모든 페이지에서 공유합니다.
+    """
+    with open(os.path.join(output_dir, PLOTLY_JS), 'w', encoding='utf-8') as f:
+        f.write(get_plotlyjs())
+
+    summary = []
+    if index_table is not None:
+        summary.append("<h2>종합 지수</h2>")
+        summary.append(index_figure)
+        summary.append(index_table.round(1).to_html())
+
+    for section in sections:
+        fragments = figures.get(section['key'], [])
+        page = os.path.join(output_dir, f"{section['key']}.html")
+        body = ["<p><a href=\"index.html\">요약으로</a></p>"]
+        body.extend(fragments[1:])
+        with open(page, 'w', encoding='utf-8') as f:
+            f.write(PAGE.format(title=html.escape(section['title']), plotly_js=PLOTLY_JS, body='\n'.join(body)))
+
+        summary.append(f"<h2>{html.escape(section['title'])}</h2>")
+        summary.append(f"<p>{len(section['matrix'])}개 {html.escape(section['item_label'])}, "
+                       f"{section['years'][0]}-{section['years'][-1]}년 · "
+                       f"<a href=\"{section['key']}.html\">품목별 추이</a></p>")
+        summary.extend(fragments[:1])
+        summary.append(price_analytics.display_table(section['analytics'], section['item_label']).to_html(index=False))
+
+    path = os.path.join(output_dir, 'index.html')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(PAGE.format(title="단가변동 보고서", plotly_js=PLOTLY_JS, body='\n'.join(summary)))
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="단가변동 보고서 일괄 생성 (Streamlit 서버 없이 실행)")
+    parser.add_argument('--output-dir', '-o', default='report', help="보고서 폴더")
+    parser.add_argument('--categories', nargs='+', choices=price_store.CATEGORIES, default=price_store.CATEGORIES,
+                        help="보고서에 포함할 분야")
+    parser.add_argument('--from-year', type=int, help="시작 연도 (기본값: 구역별 첫 해)")
+    parser.add_argument('--to-year', type=int, help="종료 연도 (기본값: 구역별 마지막 해)")
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=FORMATS, help="출력 형식")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="그래프 생성 프로세스 수")
+    parser.add_argument('--no-item-charts', action='store_true', help="품목별 추이 그래프 생략")
+    parser.add_argument('--forecast', choices=list(forecast.MODELS), help="예측 모형 (지정하면 예측 표와 예측 구간 포함)")
+    parser.add_argument('--horizon', type=int, default=1, help="예측 기간 (년)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    sections = collect_sections(args.categories, args.from_year, args.to_year, args.forecast, args.horizon)
+    if not sections:
+        print("보고서에 포함할 데이터가 없습니다.")
+        sys.exit(1)
+
+    store = price_store.load_store()
+    base_year, index_table = composite_section(store) if not store.empty else (None, None)
+    if index_table is not None and index_table.empty:
+        index_table = None
+    print(f"{len(sections)}개 구역, {sum(len(section['matrix']) for section in sections)}개 품목 계산 완료")
+
+    if 'csv' in args.formats:
+        write_csv(sections, index_table, args.output_dir)
+    if 'xlsx' in args.formats:
+        write_xlsx(sections, index_table, args.output_dir)
+    if 'html' in args.formats:
+        tasks = figure_tasks(sections, item_charts=not args.no_item_charts)
+        figures = render_figures(tasks, args.workers)
+        index_figure = ''
+        if index_table is not None:
+            indices = index_table.drop(columns='종합 지수')
+            index_figure = charts.index_figure(indices, index_table['종합 지수'], base_year).to_html(
+                full_html=False, include_plotlyjs=False
+            )
+        write_html(sections, figures, index_table, index_figure, args.output_dir)
+        print(f"그래프 {len(tasks)}개 생성 (프로세스 {args.workers}개)")
+
+    print(f"보고서가 저장되었습니다: {args.output_dir} ({time.perf_counter() - start:.1f}초)")
@@ -0,0 +1,164 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+import price_store
+
+# 분야별 원본 표 열 구성 (케이블은 품명/규격/단위 다음에 연도 열)
+SCHEMAS = {
+    'cable': ['품명', '규격', '단위'],
+    'concre': ['연도', '규격', '가격'],
+    'engineering': ['year', 'position', 'salary'],
+    'construction': ['year', 'occupation', 'wage'],
+}
+
+# 실제 데이터에서 가져온 이름 (품목 수가 더 많으면 번호를 붙여 만듦)
+NAMES = {
+    'cable': ['F-CV', 'XLPE', 'HIV', 'CV', 'VCT', 'CVV', 'FR-8', 'TFR-CV'],
+    'concre': ['BB-3(#57) 중층용', 'WC-4(#67) 중표층용', 'WC-2(#78) 표층용', 'BB-2(#467) 기층용'],
+    'engineering': ['기술사', '특급기술자', '고급기술자', '중급기술자', '초급기술자', '고급숙련기술자'],
+    'construction': ['보통인부', '특별인부', '작업반장', '비계공', '철근공', '콘크리트공', '형틀목공'],
+}
+
+CABLE_SIZES = ['1.5', '2.5', '4', '6', '10', '16', '25', '35', '50', '70', '95', '120', '150', '185', '240',
+               '300', '400', '500', '630']
+CABLE_CORES = [1, 2, 3, 4]
+
+# 분야별 기준 단가 (원, 로그 정규분포 중앙값)와 연평균 상승률
+PRICE_SCALE = {'cable': 20_000, 'concre': 85_000, 'engineering': 250_000, 'construction': 200_000}
+ANNUAL_GROWTH = 0.04
+
+# 원본 파일 이름 (형식에 따라 확장자만 바꿈)
+FILE_NAMES = {category: os.path.splitext(sources[0])[0] for category, sources in price_store.SOURCES.items()}
+
+FORMATS = ['md', 'json', 'parquet']
+
+
+def _names(category, n):
+    base = NAMES[category]
+    return [base[i] if i < len(base) else f"{base[i % len(base)]}-{i // len(base)}" for i in range(n)]
+
+
+def _cable_items(n_items, skew, rng):
+    # 품명별 품목 수는 skew가 클수록 앞쪽 품명에 몰림 (Zipf 분포 가중치)
+    n_brands = max(1, min(len(NAMES['cable']), n_items))
+    weights = 1.0 / np.arange(1, n_brands + 1) ** skew
+    brand_index = np.sort(rng.choice(n_brands, size=n_items, p=weights / weights.sum()))
+    brands = np.array(_names('cable', n_brands))[brand_index]
+
+    # 품명 안에서의 순번으로 규격 생성 (SQ × 코어 수 조합을 다 쓰면 번호를 붙임)
+    rank = np.arange(n_items) - np.searchsorted(brand_index, brand_index)
+    combos = len(CABLE_SIZES) * len(CABLE_CORES)
+    specs = [
+        f"{CABLE_SIZES[(k % combos) // len(CABLE_CORES)]} SQ x {CABLE_CORES[k % len(CABLE_CORES)]}C"
+        + (f" #{k // combos}" if k >= combos else '')
+        for k in rank
+    ]
+    return brands, specs
+
+
+def _prices(category, n_items, n_years, skew, missing_rate, rng):
+    # 품목별 기준 단가 × 연도별 누적 상승률, 10원 단위 반올림
+    base = PRICE_SCALE[category] * rng.lognormal(0.0, 0.5 + skew, n_items)
+    growth = np.cumprod(1 + rng.normal(ANNUAL_GROWTH, 0.03, (n_items, n_years)), axis=1)
+    prices = np.round(base[:, None] * growth, -1)
+
+    # 연도 누락 (품목마다 최소 한 해는 남김)
+    missing = rng.random((n_items, n_years)) < missing_rate
+    empty = missing.all(axis=1)
+    missing[np.flatnonzero(empty), rng.integers(0, n_years, empty.sum())] = False
+    prices[missing] = np.nan
+    return prices
+
+
+def generate(category, n_items=100, n_years=10, seed=0, start_year=2015, skew=0.0, missing_rate=0.0):
+    """
+    분야별 원본 표 형식의 합성 데이터를 만듭니다. 같은 seed와 설정이면 항상 같은 데이터가 나옵니다.
+    skew는 기준 단가 분포의 치우침(로그 정규분포 표준편차 0.5 + skew)과 케이블 품명별 품목 수의
+    치우침(Zipf 지수)을, missing_rate는 품목·연도 칸이 비어 있을 확률을 정합니다.
+    """
+    rng = np.random.default_rng([seed, list(SCHEMAS).index(category)])
+    years = np.arange(start_year, start_year + n_years)
+    prices = _prices(category, n_items, n_years, skew, missing_rate, rng)
+
+    if category == 'cable':
+        brands, specs = _cable_items(n_items, skew, rng)
+        df = pd.DataFrame({'품명': brands, '규격': specs, '단위': 'm'})
+        year_df = pd.DataFrame(prices, columns=[str(year) for year in years]).astype('Int64')
+        return pd.concat([df, year_df], axis=1)
+
+    # 연도별로 모든 품목을 나열 (원본 OCR 표와 같은 순서), 빈 칸은 행을 생략
+    year_column, item_column, price_column = SCHEMAS[category]
+    observed = ~np.isnan(prices.T)
+    year_values = np.repeat(years, n_items).reshape(n_years, n_items)[observed]
+    if category == 'concre':
+        year_values = pd.Series(year_values).astype(str) + '년'
+    return pd.DataFrame({
+        year_column: year_values,
+        item_column: np.tile(np.array(_names(category, n_items), dtype=object), n_years)[observed.ravel()],
+        price_column: prices.T[observed].astype('int64'),
+    })
+
+
+def to_markdown(df):
+    """
+    데이터프레임을 마크다운 파이프 테이블 문자열로 변환합니다. (행 단위 포맷 없이 CSV 출력기로 한 번에 변환)
+    """
+    # 양 끝에 빈 열을 붙여 줄 앞뒤의 '|'를 만듦
+    framed = df.set_axis(range(1, len(df.columns) + 1), axis=1).assign(**{'0': '', 'end': ''})
+    framed = framed[['0'] + list(range(1, len(df.columns) + 1)) + ['end']]
+    body = framed.to_csv(sep='|', index=False, header=False, na_rep='')
+    header = '|' + '|'.join(f" {column} " for column in df.columns) + '|\n'
+    separator = '|' + '---|' * len(df.columns) + '\n'
+    return header + separator + body
+
+
+def write(df, path):
+    """
+    확장자에 따라 마크다운(.md), JSON 레코드(.json), Parquet(.parquet) 또는 CSV(.csv)로 저장합니다.
+    """
+    if path.endswith('.md'):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(to_markdown(df))
+    elif path.endswith('.json'):
+        df.to_json(path, orient='records', force_ascii=False)
+    elif path.endswith('.parquet'):
+        df.to_parquet(path, index=False)
+    elif path.endswith('.csv'):
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {path}")
+
+
+def write_dataset(directory, n_items=100, n_years=10, seed=0, start_year=2015, skew=0.0, missing_rate=0.0,
+                  formats=FORMATS, categories=price_store.CATEGORIES):
+    """
+    분야별 합성 데이터를 원본 파일 이름(cable_data.md 등)으로 directory에 저장하고 경로 목록을 반환합니다.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for category in categories:
+        df = generate(category, n_items, n_years, seed, start_year, skew, missing_rate)
+        for fmt in formats:
+            path = os.path.join(directory, f"{FILE_NAMES[category]}.{fmt}")
+            write(df, path)
+            paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="분야별 원본 형식의 합성 단가 데이터 생성")
+    parser.add_argument('directory', help="저장할 폴더")
+    parser.add_argument('--items', type=int, default=1000, help="분야별 품목 수")
+    parser.add_argument('--years', type=int, default=10, help="연도 수")
+    parser.add_argument('--start-year', type=int, default=2015)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skew', type=float, default=0.0, help="단가 분포·케이블 품명 분포의 치우침")
+    parser.add_argument('--missing-rate', type=float, default=0.0, help="품목·연도 칸이 비어 있을 확률")
+    parser.add_argument('--formats', nargs='+', default=FORMATS, choices=FORMATS + ['csv'])
+    parser.add_argument('--categories', nargs='+', default=price_store.CATEGORIES, choices=price_store.CATEGORIES)
+    args = parser.parse_args()
+
+    for path in write_dataset(args.directory, args.items, args.years, args.seed, args.start_year, args.skew,
+                              args.missing_rate, args.formats, args.categories):
+        print(f"{path}: {os.path.getsize(path) / 1024:.1f} KB")
@@ -1,115 +1,186 @@
 import sys
 import os
 import pytesseract
-import fitz  # PyMuPDF
 import numpy as np
-from PIL import Image
 import pandas as pd
 from tabulate import tabulate
-import re
+from operator import itemgetter
+from typing import NamedTuple
+import extract_rules
+import ocr_pipeline
+import price_store
 
 # Tesseract 경로 설정
 pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
+class EngineeringRow(NamedTuple):
+    year: int
+    position: str
+    salary: int
+
+class ConstructionWageRow(NamedTuple):
+    year: int
+    occupation: str
+    wage: int
+
+class ConcreteRow(NamedTuple):
+    year: str
+    spec: str
+    price: int
+
+# 문서 전체에서 추출된 행이 없을 때 사용하는, 이미지에서 확인한 아스팔트 콘크리트 단가
+CONCRETE_FALLBACK_ROWS = [
+    # 2025년 데이터
+    ConcreteRow('2025년', 'BB-3(#57) 중층용', 84000),
+    ConcreteRow('2025년', 'WC-4(#67) 중표층용', 91000),
+    ConcreteRow('2025년', 'WC-2(#78) 표층용', 96000),
+    ConcreteRow('2025년', 'BB-2(#467) 기층용', 77000),
+    # 2020년 데이터
+    ConcreteRow('2020년', 'BB-3(#57) 중층용', 61000),
+    ConcreteRow('2020년', 'WC-4(#67) 중표층용', 68000),
+    ConcreteRow('2020년', 'WC-2(#78) 표층용', 70000),
+    ConcreteRow('2020년', 'BB-2(#467) 기층용', 63000),
+]
+
+# 케이블 단가표의 연도 열
+CABLE_YEARS = ["2021", "2022", "2023", "2024"]
+
+class MarkdownTableSink:
+    """
+    추출된 행을 키별로 한 번만 모아 두었다가 마지막에 정렬된 마크다운 테이블로 저장합니다. (행마다 pd.concat 하지 않음)
+    key_fields를 지정하면 같은 키의 행은 처음 받은 행만 남기고, append=True이면 기존 마크다운 파일의 행에
+    새 행을 키 기준으로 덮어써서(upsert) 저장합니다. sort_fields가 없으면 받은 순서대로 저장합니다.
+    with 블록이 예외 없이 끝나면 저장하고, 예외가 나면 기존 파일을 그대로 둡니다.
+    """
+    def __init__(self, output_path, row_type, sort_fields=None, key_fields=None, append=False, headers=None):
+        self.output_path = output_path
+        self.row_type = row_type
+        self.fields = list(row_type._fields)
+        self.headers = list(headers) if headers else self.fields
+        self.sort_key = itemgetter(*[self.fields.index(field) for field in sort_fields]) if sort_fields else None
+        self.row_key = itemgetter(*[self.fields.index(field) for field in key_fields]) if key_fields else None
+        self.saved = False
+        self._rows = {}
+        self._existing = self._read_existing() if append else {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+    def __len__(self):
+        return len(self._merged())
+
+    def _key(self, row):
+        return self.row_key(row) if self.row_key else row
+
+    def _read_existing(self):
+        # 기존 마크다운 표의 행을 row_type 형식으로 읽음 (파일이 없으면 빈 상태로 시작)
+        if not os.path.exists(self.output_path):
+            return {}
+        df = price_store.read_markdown_table(self.output_path)
+        types = [self.row_type.__annotations__[field] for field in self.fields]
+        existing = {}
+        skipped = 0
+        for values in df[self.headers].itertuples(index=False):
+            row = self._parse_row(types, values)
+            if row is None:
+                skipped += 1
+                continue
+            existing.setdefault(self._key(row), row)
+        if skipped:
+            print(f"경고: {self.output_path}에서 빈 칸이나 잘못된 값이 있는 {skipped}개 행을 건너뜁니다.")
+        return existing
+
+    def _parse_row(self, types, values):
+        # 셀 값을 row_type 형식으로 변환 (빈 칸이나 숫자로 바꿀 수 없는 값이 있으면 None)
+        parsed = []
+        for typ, value in zip(types, values):
+            if not isinstance(value, str) or not value.strip():
+                return None
+            try:
+                parsed.append(typ(value.replace(',', '')) if typ is int else typ(value))
+            except ValueError:
+                return None
+        return self.row_type(*parsed)
+
+    def add(self, row):
+        key = self._key(row)
+        if key not in self._rows:
+            self._rows[key] = row
+
+    def extend(self, rows):
+        for row in rows:
+            self.add(row)
+
+    def _merged(self):
+        return {**self._existing, **self._rows}
+
+    def changes(self):
+        # 기존 파일 대비 (추가된 행 수, 값이 바뀐 행 수)
+        added = sum(key not in self._existing for key in self._rows)
+        updated = sum(key in self._existing and self._existing[key] != row for key, row in self._rows.items())
+        return added, updated
+
+    def rows(self):
+        rows = list(self._merged().values())
+        return sorted(rows, key=self.sort_key) if self.sort_key else rows
+
+    def close(self):
+        # 새로 받은 행이 있으면 임시 파일에 쓴 뒤 이름을 바꿔 저장 (쓰는 도중 중단되어도 기존 파일은 온전함)
+        if self._rows:
+            markdown_table = tabulate(self.rows(), headers=self.headers, tablefmt='pipe')
+            tmp_path = f"{self.output_path}.partial"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(markdown_table)
+            os.replace(tmp_path, self.output_path)
+        self.saved = bool(self._rows)
+        return self.saved
+
 def extract_engineering_data(text):
     # 디버깅용 텍스트 저장
     with open("engineering_ocr_output.txt", "w", encoding="utf-8") as f:
         f.write(text)
     
-    # 줄 단위로 분리
-    lines = text.split('\n')
-    
-    # 빈 줄 제거
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # 엔지니어링 노임 데이터 추출
-    data = []
-    current_year = None
-    position = None
-    salary = None
-    
-    # 연도 패턴 정의
-    year_pattern = r'(\d{4})년'
-    
-    for i, line in enumerate(lines):
-        # 연도 추출
-        year_match = re.search(year_pattern, line)
-        if year_match:
-            current_year = int(year_match.group(1))
-            continue
-        
-        # 기술자 등급과 노임단가 패턴 찾기
-        if current_year and "기술자" in line:
-            position = line.strip()
-            # 다음 라인에 금액이 있는지 확인
-            if i+1 < len(lines) and re.search(r'[\d,]+원', lines[i+1]):
-                salary_line = lines[i+1]
-                # 금액 추출 (숫자와 쉼표로 구성된 부분)
-                salary_match = re.search(r'([\d,]+)원', salary_line)
-                if salary_match:
-                    salary = int(salary_match.group(1).replace(',', ''))
-                    # 데이터 추가
-                    data.append({
-                        'year': current_year,
-                        'position': position,
-                        'salary': salary
-                    })
-    
-    return pd.DataFrame(data)
+    # 기술자 등급과 노임단가를 행 단위로 전달 (금액은 같은 줄 또는 다음 줄)
+    for match in extract_rules.extract(extract_rules.ENGINEERING, text):
+        yield EngineeringRow(match.year, match.item, match.amounts[0])
 
-def convert_engineering_pdf_to_markdown(pdf_files):
+def convert_engineering_pdf_to_markdown(pdf_files, workers=None, append=False):
     try:
-        all_data = pd.DataFrame()
+        # 마크다운 파일 경로
+        output_path = "engineering_salary_ocr.md"
         
-        for pdf_path in pdf_files:
-            print(f"\nPDF 처리 중: {pdf_path}")
-            try:
-                # PDF 문서 열기
-                doc = fitz.open(pdf_path)
-                
-                # 각 페이지 처리
-                for page_num in range(len(doc)):
-                    print(f"\n페이지 {page_num + 1} 처리 중...")
-                    page = doc[page_num]
-                    
-                    # 페이지를 이미지로 변환 (해상도 향상)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(3, 3))
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    
-                    # OCR 수행 (이미지 전처리 옵션 추가)
+        # 추출된 행을 페이지마다 바로 전달받는 저장소 (append이면 기존 파일에 (연도, position) 기준으로 덮어씀)
+        key_fields = ['year', 'position'] if append else None
+        # with 블록이 끝나면 중복 제거, 정렬 후 마크다운 파일로 저장
+        with MarkdownTableSink(output_path, EngineeringRow, ['year', 'position'], key_fields=key_fields, append=append) as sink:
+            for pdf_path in pdf_files:
+                print(f"\nPDF 처리 중: {pdf_path}")
+                try:
+                    # 모든 페이지를 병렬로 OCR 수행 (결과는 페이지 순서 유지)
                     custom_config = r'--oem 3 --psm 6'
-                    text = pytesseract.image_to_string(img, lang='kor+eng', config=custom_config)
+                    pages = ocr_pipeline.ocr_pdf_pages(pdf_path, scale=3, lang='kor+eng', config=custom_config, workers=workers)
                     
-                    # 엔지니어링 노임 데이터 추출
-                    page_data = extract_engineering_data(text)
-                    if not page_data.empty:
-                        all_data = pd.concat([all_data, page_data], ignore_index=True)
-                
-                # PDF 문서 닫기
-                doc.close()
-            except Exception as e:
-                print(f"파일 '{pdf_path}' 처리 중 오류 발생: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                    # 각 페이지 처리
+                    for page in pages:
+                        # 엔지니어링 노임 데이터 추출
+                        sink.extend(extract_engineering_data(page.text))
+                except Exception as e:
+                    print(f"파일 '{pdf_path}' 처리 중 오류 발생: {str(e)}")
+                    import traceback
+                    traceback.print_exc()
         
-        if not all_data.empty:
-            # 중복 제거 및 정렬
-            all_data = all_data.drop_duplicates()
-            all_data = all_data.sort_values(['year', 'position'])
-            
-            # 마크다운 파일 경로
-            output_path = "engineering_salary_ocr.md"
-            
-            # 마크다운으로 변환
-            markdown_table = tabulate(all_data, headers='keys', tablefmt='pipe', showindex=False)
-            
-            # 파일로 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_table)
-            
-            print(f"\n결과가 저장되었습니다: {output_path}")
+        if sink.saved:
+            print(f"\n결과가 저장되었습니다: {output_path} ({len(sink)}개 행)")
+            if append:
+                added, updated = sink.changes()
+                print(f"추가 {added}개 행, 갱신 {updated}개 행")
             print("\n추출된 데이터 미리보기:")
-            print(all_data.head().to_string())
+            print(tabulate(sink.rows()[:5], headers=sink.fields))
             
             return True
         else:
@@ -127,94 +198,39 @@ def extract_table_data(text):
     with open("ocr_output.txt", "w", encoding="utf-8") as f:
         f.write(text)
     
-    # 줄 단위로 분리
-    lines = text.split('\n')
-    
-    # 빈 줄 제거
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # 데이터 추출을 위한 수동 매핑
-    data = []
-    
-    # 이미지에서 확인한 데이터를 직접 입력
-    # 2025년 데이터
-    data.append(['2025년', 'BB-3(#57) 중층용', '84000'])
-    data.append(['2025년', 'WC-4(#67) 중표층용', '91000'])
-    data.append(['2025년', 'WC-2(#78) 표층용', '96000'])
-    data.append(['2025년', 'BB-2(#467) 기층용', '77000'])
-    
-    # 2020년 데이터
-    data.append(['2020년', 'BB-3(#57) 중층용', '61000'])
-    data.append(['2020년', 'WC-4(#67) 중표층용', '68000'])
-    data.append(['2020년', 'WC-2(#78) 표층용', '70000'])
-    data.append(['2020년', 'BB-2(#467) 기층용', '63000'])
-    
-    # OCR 결과로부터 데이터를 추출하려고 시도
-    current_year = None
-    
-    for line in lines:
-        print(f"처리 중인 라인: {line}")
-        
-        # 연도 확인
-        if '2025년' in line:
-            current_year = '2025'
-            continue
-        elif '2020년' in line:
-            current_year = '2020'
-            continue
-        
-        # 가격 패턴 찾기 (예: 84,000, 91,000 등)
-        if current_year and re.search(r'(BB-|WC-)', line):
-            print(f"발견된 규격 라인: {line}")
-    
-    return data
+    # OCR 결과에서 (연도, 규격, 가격) 추출
+    return [
+        ConcreteRow(f"{match.year}년", match.item, match.amounts[0])
+        for match in extract_rules.extract(extract_rules.CONCRETE, text)
+    ]
 
-def convert_pdf_to_markdown(pdf_path):
+def convert_pdf_to_markdown(pdf_path, workers=None):
     try:
         print("PDF 처리 중...")
-        # PDF 문서 열기
-        doc = fitz.open(pdf_path)
-        
-        all_data = []
         
-        # 각 페이지 처리
-        for page_num in range(len(doc)):
-            print(f"\n페이지 {page_num + 1} 처리 중...")
-            page = doc[page_num]
-            
-            # 페이지를 이미지로 변환 (해상도 향상)
-            pix = page.get_pixmap(matrix=fitz.Matrix(3, 3))
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            
-            # OCR 수행 (이미지 전처리 옵션 추가)
-            custom_config = r'--oem 3 --psm 6'
-            text = pytesseract.image_to_string(img, lang='kor+eng', config=custom_config)
-            
-            # 테이블 데이터 추출
-            data_rows = extract_table_data(text)
-            all_data.extend(data_rows)
+        # 마크다운 파일 경로
+        base_path = os.path.splitext(pdf_path)[0]
+        output_path = f"{base_path}_table_ocr.md"
         
-        # PDF 문서 닫기
-        doc.close()
+        # 모든 페이지를 병렬로 OCR 수행 (결과는 페이지 순서 유지)
+        custom_config = r'--oem 3 --psm 6'
+        pages = ocr_pipeline.ocr_pdf_pages(pdf_path, scale=3, lang='kor+eng', config=custom_config, workers=workers)
         
-        if all_data:
-            # 데이터프레임 생성
-            df = pd.DataFrame(all_data, columns=['연도', '규격', '가격'])
-            
-            # 마크다운 파일 경로
-            base_path = os.path.splitext(pdf_path)[0]
-            output_path = f"{base_path}_table_ocr.md"
-            
-            # 마크다운으로 변환
-            markdown_table = tabulate(df, headers='keys', tablefmt='pipe', showindex=False)
-            
-            # 파일로 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_table)
+        # 페이지 순서대로 중복 없이 모아 with 블록이 끝나면 마크다운 파일로 저장
+        with MarkdownTableSink(output_path, ConcreteRow, headers=['연도', '규격', '가격']) as sink:
+            for page in pages:
+                # 테이블 데이터 추출
+                sink.extend(extract_table_data(page.text))
             
+            # 문서 전체에서 추출된 행이 없을 때만 이미지에서 확인한 데이터를 직접 입력
+            if not len(sink):
+                print("\nOCR에서 추출된 행이 없어 이미지에서 확인한 데이터를 사용합니다.")
+                sink.extend(CONCRETE_FALLBACK_ROWS)
+        
+        if sink.saved:
             print(f"\n결과가 저장되었습니다: {output_path}")
             print("\n추출된 데이터 미리보기:")
-            print(df.to_string())
+            print(tabulate(sink.rows(), headers=sink.headers))
             
             return True
         else:
@@ -230,100 +246,42 @@ def extract_construction_wage_data(text):
     with open("construction_wage_ocr_output.txt", "w", encoding="utf-8") as f:
         f.write(text)
     
-    # 줄 단위로 분리
-    lines = text.split('\n')
-    
-    # 빈 줄 제거
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # 건설업 임금실태 데이터 추출
-    data = []
-    current_year = None
-    occupation = None
-    wage = None
-    
-    # 연도 패턴 정의
-    year_pattern = r'(\d{4})년'
-    
-    for i, line in enumerate(lines):
-        # 연도 추출
-        year_match = re.search(year_pattern, line)
-        if year_match:
-            current_year = int(year_match.group(1))
-            continue
-        
-        # 직종과 임금 패턴 찾기
-        if current_year and re.search(r'(보통인부|특별인부|작업반장|비계공|형틀목공|철근공|용접공|절단공|콘크리트공|방수공|미장공|조적공|견출공|도장공|배관공|전공)', line):
-            occupation = line.strip()
-            # 다음 라인에 금액이 있는지 확인
-            if i+1 < len(lines) and re.search(r'[\d,]+원', lines[i+1]):
-                wage_line = lines[i+1]
-                # 금액 추출 (숫자와 쉼표로 구성된 부분)
-                wage_match = re.search(r'([\d,]+)원', wage_line)
-                if wage_match:
-                    wage = int(wage_match.group(1).replace(',', ''))
-                    # 데이터 추가
-                    data.append({
-                        'year': current_year,
-                        'occupation': occupation,
-                        'wage': wage
-                    })
-    
-    return pd.DataFrame(data)
+    # 직종과 임금을 행 단위로 전달 (직종 이름이 포함된 줄, 금액은 같은 줄 또는 다음 줄)
+    for match in extract_rules.extract(extract_rules.CONSTRUCTION, text):
+        yield ConstructionWageRow(match.year, match.item, match.amounts[0])
 
-def convert_construction_wage_pdf_to_markdown(pdf_files):
+def convert_construction_wage_pdf_to_markdown(pdf_files, workers=None, append=False):
     try:
-        all_data = pd.DataFrame()
+        # 마크다운 파일 경로
+        output_path = "construction_wage_ocr.md"
         
-        for pdf_path in pdf_files:
-            print(f"\nPDF 처리 중: {pdf_path}")
-            try:
-                # PDF 문서 열기
-                doc = fitz.open(pdf_path)
-                
-                # 각 페이지 처리
-                for page_num in range(len(doc)):
-                    print(f"\n페이지 {page_num + 1} 처리 중...")
-                    page = doc[page_num]
-                    
-                    # 페이지를 이미지로 변환 (해상도 향상)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(3, 3))
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    
-                    # OCR 수행 (이미지 전처리 옵션 추가)
+        # 추출된 행을 페이지마다 바로 전달받는 저장소 (append이면 기존 파일에 (연도, occupation) 기준으로 덮어씀)
+        key_fields = ['year', 'occupation'] if append else None
+        # with 블록이 끝나면 중복 제거, 정렬 후 마크다운 파일로 저장
+        with MarkdownTableSink(output_path, ConstructionWageRow, ['year', 'occupation'], key_fields=key_fields, append=append) as sink:
+            for pdf_path in pdf_files:
+                print(f"\nPDF 처리 중: {pdf_path}")
+                try:
+                    # 모든 페이지를 병렬로 OCR 수행 (결과는 페이지 순서 유지)
                     custom_config = r'--oem 3 --psm 6'
-                    text = pytesseract.image_to_string(img, lang='kor+eng', config=custom_config)
+                    pages = ocr_pipeline.ocr_pdf_pages(pdf_path, scale=3, lang='kor+eng', config=custom_config, workers=workers)
                     
-                    # 건설업 임금실태 데이터 추출
-                    page_data = extract_construction_wage_data(text)
-                    if not page_data.empty:
-                        all_data = pd.concat([all_data, page_data], ignore_index=True)
-                
-                # PDF 문서 닫기
-                doc.close()
-            except Exception as e:
-                print(f"파일 '{pdf_path}' 처리 중 오류 발생: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                    # 각 페이지 처리
+                    for page in pages:
+                        # 건설업 임금실태 데이터 추출
+                        sink.extend(extract_construction_wage_data(page.text))
+                except Exception as e:
+                    print(f"파일 '{pdf_path}' 처리 중 오류 발생: {str(e)}")
+                    import traceback
+                    traceback.print_exc()
         
-        if not all_data.empty:
-            # 중복 제거 및 정렬
-            all_data = all_data.drop_duplicates()
-            all_data = all_data.sort_values(['year', 'occupation'])
-            
-            # 마크다운 파일 경로
-            output_path = "construction_wage_ocr.md"
-            
-            # 마크다운으로 변환
-            markdown_table = tabulate(all_data, headers='keys', tablefmt='pipe', showindex=False)
-            
-            # 파일로 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_table)
-            
-            print(f"\n결과가 저장되었습니다: {output_path}")
+        if sink.saved:
+            print(f"\n결과가 저장되었습니다: {output_path} ({len(sink)}개 행)")
+            if append:
+                added, updated = sink.changes()
+                print(f"추가 {added}개 행, 갱신 {updated}개 행")
             print("\n추출된 데이터 미리보기:")
-            print(all_data.head().to_string())
+            print(tabulate(sink.rows()[:5], headers=sink.fields))
             
             return True
         else:
@@ -336,93 +294,36 @@ def convert_construction_wage_pdf_to_markdown(pdf_files):
         traceback.print_exc()
         return False
 
-def convert_cable_pdf_to_markdown(pdf_file="onlycable.pdf", output_file="cable_data.md"):
+def convert_cable_pdf_to_markdown(pdf_file="onlycable.pdf", output_file="cable_data.md", workers=None):
     """
     전기 케이블 PDF에서 표 데이터를 추출하여 마크다운 파일로 저장합니다.
     """
     print(f"Processing {pdf_file} for cable data...")
     
     try:
-        import fitz  # PyMuPDF
-        import pytesseract
-        from PIL import Image
-        import pandas as pd
-        import numpy as np
-        import re
-        import os
-        from tabulate import tabulate
-        
-        # OCR 설정
-        pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-        
-        # PDF 열기
-        doc = fitz.open(pdf_file)
-        
         # 데이터를 저장할 리스트
         cable_data = []
         
-        # 각 페이지 처리
-        for page_num in range(len(doc)):
-            print(f"Processing page {page_num+1}/{len(doc)}...")
-            page = doc.load_page(page_num)
-            
-            # 각 페이지를 이미지로 변환 (해상도 향상)
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            
-            # OCR 실행
-            text = pytesseract.image_to_string(img, lang='kor+eng')
-            
-            # 케이블 데이터 추출 (품명, 규격, 단위, 각 연도별 단가)
-            lines = text.split('\n')
-            
-            cable_pattern = re.compile(r'(F-CV|HIV|CVV|한국|케이블|전력|제어용|가교|연선|동선).*')
-            size_pattern = re.compile(r'(\d+(\.\d+)?)\s*[xX×]\s*(\d+(\.\d+)?)(sq)?\s*mm.*')
-            
-            for i, line in enumerate(lines):
-                if cable_pattern.search(line) or size_pattern.search(line):
-                    # 품명과 규격 찾기
-                    item_name = line.strip()
-                    size = ""
-                    
-                    # 규격 추출 시도
-                    size_match = size_pattern.search(line)
-                    if size_match:
-                        size = size_match.group(0).strip()
-                    
-                    # 단위 (기본값 'm' 설정)
-                    unit = 'm'
-                    
-                    # 가격 데이터 찾기 (다음 몇 줄 확인)
-                    for j in range(1, 4):
-                        if i + j < len(lines):
-                            price_line = lines[i + j]
-                            price_match = re.findall(r'(\d{1,3}(,\d{3})+|\d+)', price_line)
-                            
-                            if len(price_match) >= 2:  # 적어도 두 개의 숫자가 있으면 가격으로 간주
-                                # 연도와 가격 정보 추출
-                                years = ["2021", "2022", "2023", "2024"]
-                                prices = [p[0] for p in price_match]
-                                
-                                # 데이터가 충분하면 저장
-                                if len(prices) >= 2:
-                                    entry = {
-                                        "품명": item_name,
-                                        "규격": size,
-                                        "단위": unit
-                                    }
-                                    
-                                    # 가격 데이터 할당 (연도별)
-                                    for k, year in enumerate(years):
-                                        if k < len(prices):
-                                            entry[year] = prices[k].replace(",", "")
-                                        else:
-                                            entry[year] = ""
-                                    
-                                    cable_data.append(entry)
-                                    break
+        # 모든 페이지를 병렬로 OCR 실행 (결과는 페이지 순서 유지)
+        pages = ocr_pipeline.ocr_pdf_pages(pdf_file, scale=2, lang='kor+eng', workers=workers)
         
-        doc.close()
+        # 각 페이지 처리
+        for page in pages:
+            # 케이블 데이터 추출 (품명, 규격, 단위, 각 연도별 단가), 가격은 품명 다음 3줄 안에서 숫자가 2개 이상인 줄
+            for match in extract_rules.extract(extract_rules.CABLE, page.text):
+                # 규격 추출 시도
+                size_match = extract_rules.CABLE_SIZE.search(match.item)
+                entry = {
+                    "품명": match.item,
+                    "규격": size_match.group(0).strip() if size_match else "",
+                    "단위": 'm'  # 단위 (기본값 'm' 설정)
+                }
+                
+                # 가격 데이터 할당 (연도별)
+                for k, year in enumerate(CABLE_YEARS):
+                    entry[year] = str(match.amounts[k]) if k < len(match.amounts) else ""
+                
+                cable_data.append(entry)
         
         # 데이터프레임 생성
         if cable_data:
@@ -432,7 +333,7 @@ def convert_cable_pdf_to_markdown(pdf_file="onlycable.pdf", output_file="cable_d
             df = df.drop_duplicates()
             
             # 가격 데이터 숫자로 변환
-            for year in ["2021", "2022", "2023", "2024"]:
+            for year in CABLE_YEARS:
                 df[year] = pd.to_numeric(df[year], errors='coerce')
             
             # 마크다운 테이블 생성
@@ -459,43 +360,69 @@ def convert_cable_pdf_to_markdown(pdf_file="onlycable.pdf", output_file="cable_d
         traceback.print_exc()
         return False
 
+def pop_flag(argv, flag):
+    # 값이 없는 옵션(--append 등)을 인자 목록에서 꺼냄
+    if flag not in argv:
+        return False
+    argv.remove(flag)
+    return True
+
+def pdf_file_arguments(argv, default_files):
+    # 모드 다음에 PDF 파일을 지정하면 그 파일만, 지정하지 않으면 기본 파일 목록 사용
+    pdf_files = argv[2:] or default_files
+    for pdf_path in pdf_files:
+        if not os.path.exists(pdf_path):
+            print(f"오류: 파일을 찾을 수 없습니다: {pdf_path}")
+            sys.exit(1)
+    return pdf_files
+
+def pop_workers_option(argv):
+    # --workers N 옵션을 인자 목록에서 꺼냄 (지정하지 않으면 CPU 코어 수 사용)
+    if '--workers' not in argv:
+        return None
+    index = argv.index('--workers')
+    if index + 1 >= len(argv) or not argv[index + 1].isdigit():
+        print("오류: --workers 다음에는 작업 프로세스 수를 지정해야 합니다.")
+        sys.exit(1)
+    workers = int(argv[index + 1])
+    del argv[index:index + 2]
+    return workers
+
 if __name__ == "__main__":
+    workers = pop_workers_option(sys.argv)
+    append = pop_flag(sys.argv, '--append')
     if len(sys.argv) < 2:
-        print("사용법: python table_to_markdown.py <PDF 파일 경로 또는 'engineering' 또는 'construction' 또는 'cable'>")
+        print("사용법: python table_to_markdown.py <PDF 파일 경로 또는 'engineering' 또는 'construction' 또는 'cable'> [--workers N]")
+        print("        python table_to_markdown.py <'engineering' 또는 'construction'> [PDF 파일 ...] [--append]")
+        print("        (--append: 지정한 PDF만 OCR하여 기존 마크다운에 (연도, 항목) 기준으로 추가·갱신)")
+        sys.exit(1)
+    if append and sys.argv[1] not in ("engineering", "construction"):
+        print("오류: --append는 'engineering' 또는 'construction' 모드에서만 사용할 수 있습니다.")
+        sys.exit(1)
+    if append and len(sys.argv) < 3:
+        print("오류: --append에는 새로 추가할 PDF 파일을 지정해야 합니다.")
         sys.exit(1)
     
     if sys.argv[1] == "engineering":
-        # 엔지니어링 노임 PDF 파일들 처리
-        engineering_files = [
+        # 엔지니어링 노임 PDF 파일들 처리 (파일을 지정하지 않으면 전체 보고서)
+        engineering_files = pdf_file_arguments(sys.argv, [
             "2021년도_엔지니어링업체.pdf",
             "2023년도_엔지니어링업체.pdf",
             "2024년도_엔지니어링업체.pdf"
-        ]
-        
-        # 파일 존재 확인
-        for pdf_path in engineering_files:
-            if not os.path.exists(pdf_path):
-                print(f"오류: 파일을 찾을 수 없습니다: {pdf_path}")
-                sys.exit(1)
+        ])
         
-        success = convert_engineering_pdf_to_markdown(engineering_files)
+        success = convert_engineering_pdf_to_markdown(engineering_files, workers=workers, append=append)
         if not success:
             sys.exit(1)
     elif sys.argv[1] == "construction":
-        # 건설업 임금실태 PDF 파일들 처리
-        construction_files = [
+        # 건설업 임금실태 PDF 파일들 처리 (파일을 지정하지 않으면 전체 보고서)
+        construction_files = pdf_file_arguments(sys.argv, [
             "2020년_상반기_적용_건설업_임금실태조사_보고서.pdf",
             "2024년_상반기_적용_건설업_임금실태조사_보고서.pdf",
             "2025년_상반기_적용_건설업_임금실태조사_보고서.pdf"
-        ]
-        
-        # 파일 존재 확인
-        for pdf_path in construction_files:
-            if not os.path.exists(pdf_path):
-                print(f"오류: 파일을 찾을 수 없습니다: {pdf_path}")
-                sys.exit(1)
+        ])
         
-        success = convert_construction_wage_pdf_to_markdown(construction_files)
+        success = convert_construction_wage_pdf_to_markdown(construction_files, workers=workers, append=append)
         if not success:
             sys.exit(1)
     elif sys.argv[1] == "cable":
@@ -503,7 +430,7 @@ if __name__ == "__main__":
         pdf_file = "onlycable.pdf"
         if len(sys.argv) > 2:
             pdf_file = sys.argv[2]
-        convert_cable_pdf_to_markdown(pdf_file)
+        convert_cable_pdf_to_markdown(pdf_file, workers=workers)
     else:
         # 단일 PDF 파일 처리
         pdf_path = sys.argv[1]
@@ -511,6 +438,6 @@ if __name__ == "__main__":
             print(f"오류: 파일을 찾을 수 없습니다: {pdf_path}")
             sys.exit(1)
         
-        success = convert_pdf_to_markdown(pdf_path)
+        success = convert_pdf_to_markdown(pdf_path, workers=workers)
         if not success:
             sys.exit(1) 
\ No newline at end of file
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 500]
+NO_SORT = "(원래 순서)"
+
+
+def won_column(label):
+    # 원 단위 금액 (천 단위 구분, 숫자 정렬 유지)
+    return st.column_config.NumberColumn(f"{label}(원)", format="localized")
+
+
+def percent_column(label, digits=1):
+    return st.column_config.NumberColumn(f"{label}(%)", format=f"%.{digits}f%%")
+
+
+def page_positions(table, sort_by=None, ascending=True, start=0, stop=None):
+    """
+    sort_by 열로 정렬했을 때 start번째부터 stop번째 앞까지의 행 위치를 반환합니다.
+    숫자 열은 필요한 앞부분만 부분 선택(argpartition)한 뒤 정렬하므로 전체를 정렬하지 않습니다. 빈 값은 항상 뒤로 보냅니다.
+    """
+    n = len(table)
+    stop = n if stop is None else min(stop, n)
+    if sort_by is None or start >= stop:
+        return np.arange(start, stop)
+
+    column = table[sort_by]
+    if pd.api.types.is_numeric_dtype(column):
+        key = column.to_numpy(dtype=float, na_value=np.nan)
+        key = key if ascending else -key
+        key = np.where(np.isnan(key), np.inf, key)
+        if stop < n:
+            # stop번째 값보다 작은 행 전부 + 그 값과 같은 행은 앞에서부터 필요한 만큼
+            threshold = key[np.argpartition(key, stop - 1)[stop - 1]]
+            below = np.flatnonzero(key < threshold)
+            head = np.concatenate([below, np.flatnonzero(key == threshold)[:stop - len(below)]])
+        else:
+            head = np.arange(n)
+        # 같은 값은 원래 순서대로
+        order = head[np.lexsort((head, key[head]))]
+    else:
+        order = np.argsort(column.astype(str).to_numpy(), kind='stable')
+        if not ascending:
+            order = order[::-1]
+        missing = column.isna().to_numpy()[order]
+        order = np.concatenate([order[~missing], order[missing]])
+    return order[start:stop]
+
+
+def paged_dataframe(table, key, column_config=None, page_sizes=PAGE_SIZES, **kwargs):
+    """
+    서버에서 정렬하고 현재 페이지의 행만 st.dataframe으로 보냅니다. 행이 가장 작은 페이지 크기 이하이면 그대로 출력합니다.
+    """
+    if len(table) <= page_sizes[0]:
+        st.dataframe(table, column_config=column_config, hide_index=True, **kwargs)
+        return
+
+    col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
+    with col1:
+        sort_by = st.selectbox("정렬 기준", [NO_SORT] + list(table.columns), key=f"{key}_sort")
+    with col2:
+        order = st.selectbox("정렬 순서", ["오름차순", "내림차순"], key=f"{key}_order")
+    with col3:
+        page_size = st.selectbox("페이지당 행 수", page_sizes, index=min(1, len(page_sizes) - 1), key=f"{key}_size")
+    n_pages = -(-len(table) // page_size)
+    with col4:
+        page = st.number_input("페이지", min_value=1, max_value=n_pages, value=1, step=1, key=f"{key}_page")
+
+    start = (min(page, n_pages) - 1) * page_size
+    stop = min(start + page_size, len(table))
+    positions = page_positions(table, None if sort_by == NO_SORT else sort_by, order == "오름차순", start, stop)
+    st.dataframe(table.iloc[positions], column_config=column_config, hide_index=True, **kwargs)
+    st.caption(f"전체 {len(table):,}행 중 {start + 1:,}-{stop:,}행 ({page}/{n_pages} 페이지)")
@@ -0,0 +1,34 @@
+import extract_rules
+
+
+def test_construction_keeps_compound_occupation_names():
+    text = "2024년 상반기\n내선전공\n250,000원\n보통인부 165,000원\n"
+
+    rows = [(match.year, match.item, match.amounts[0])
+            for match in extract_rules.extract(extract_rules.CONSTRUCTION, text)]
+
+    assert rows == [
+        (2024, '내선전공', 250000),
+        (2024, '보통인부', 165000),
+    ]
+
+
+def test_construction_finds_occupation_inside_other_text():
+    text = "2025년\n가. 옥내 내선전공(일반) 기준 268,000원\n비고: 전체 평균\n"
+
+    rows = [(match.item, match.amounts[0])
+            for match in extract_rules.extract(extract_rules.CONSTRUCTION, text)]
+
+    assert rows == [('가. 옥내 내선전공(일반) 기준', 268000)]
+
+
+def test_cable_items_waiting_for_the_same_price_line_all_get_it():
+    text = "F-CV 0.6/1kV 전력케이블\n한국전선 제어용\n3200 3500 3800 4100\n"
+
+    rows = [(match.item, match.amounts)
+            for match in extract_rules.extract(extract_rules.CABLE, text)]
+
+    assert rows == [
+        ('F-CV 0.6/1kV 전력케이블', [3200, 3500, 3800, 4100]),
+        ('한국전선 제어용', [3200, 3500, 3800, 4100]),
+    ]
@@ -0,0 +1,41 @@
+import fitz
+import extract_rules
+import ocr_pipeline
+
+POSITIONS = ['수석기술자', '특급기술자', '고급기술자', '중급기술자', '초급기술자']
+AMOUNTS = ['650,000원', '600,000원', '550,000원', '500,000원', '450,000원']
+
+
+def _column_ordered_page(doc):
+    # 표를 열 단위로 기록 (기술자 등급 열을 모두 쓴 뒤 금액 열)
+    page = doc.new_page()
+    page.insert_text((72, 72), '2024년 엔지니어링 노임단가 (단위: 원)', fontname='korea')
+    for row, position in enumerate(POSITIONS):
+        page.insert_text((72, 110 + row * 20), position, fontname='korea')
+    for row, amount in enumerate(AMOUNTS):
+        page.insert_text((300, 110 + row * 20), amount, fontname='korea')
+    return page
+
+
+def test_text_layer_follows_visual_rows_for_column_ordered_table():
+    with fitz.open() as doc:
+        text = ocr_pipeline.page_text_layer(_column_ordered_page(doc))
+
+    rows = [(match.year, match.item, match.amounts[0])
+            for match in extract_rules.extract(extract_rules.ENGINEERING, text)]
+    assert rows == [
+        (2024, position, int(amount.rstrip('원').replace(',', '')))
+        for position, amount in zip(POSITIONS, AMOUNTS)
+    ]
+
+
+def test_text_layer_skips_page_whose_table_is_a_scanned_image():
+    with fitz.open() as doc:
+        page = doc.new_page()
+        page.insert_text((72, 60), '2024년 엔지니어링 노임단가 조사 결과 표 (단위: 원, 부가가치세 제외)', fontname='korea')
+        scan = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 200, 200), False)
+        scan.clear_with(255)
+        page.insert_image(fitz.Rect(36, 80, page.rect.width - 36, page.rect.height - 36), pixmap=scan)
+
+        assert len(page.get_text("words")) >= ocr_pipeline.MIN_TEXT_LAYER_WORDS
+        assert ocr_pipeline.page_text_layer(page) is None
@@ -0,0 +1,30 @@
+from table_to_markdown import ConstructionWageRow, MarkdownTableSink
+
+
+EXISTING_TABLE = """|   year | occupation   | wage    |
+|-------:|:-------------|:--------|
+|   2024 | 보통인부     | 150,000 |
+|   2024 | 철근공       |         |
+|   2024 | 용접공       | 미상    |
+|   2024 ||
+|   2024 | 형틀목공     | 230,000 |
+"""
+
+
+def test_append_skips_rows_with_blank_or_invalid_price(tmp_path, capsys):
+    output_path = tmp_path / "construction_wage_ocr.md"
+    output_path.write_text(EXISTING_TABLE, encoding='utf-8')
+
+    with MarkdownTableSink(str(output_path), ConstructionWageRow, ['year', 'occupation'],
+                           key_fields=['year', 'occupation'], append=True) as sink:
+        sink.add(ConstructionWageRow(2025, '보통인부', 160000))
+
+    assert "3개 행을 건너뜁니다" in capsys.readouterr().out
+    assert sink.saved
+    assert sink.rows() == [
+        ConstructionWageRow(2024, '보통인부', 150000),
+        ConstructionWageRow(2024, '형틀목공', 230000),
+        ConstructionWageRow(2025, '보통인부', 160000),
+    ]
+    assert sink.changes() == (1, 0)
+